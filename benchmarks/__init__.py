@@ -0,0 +1,3 @@
+"""
+Benchmarks for the seed generation and upsert pipelines
+"""
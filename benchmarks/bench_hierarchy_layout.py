@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSONB hierarchy layout of seeds_posts against the normalized
+seed_tier1/seed_tier2 layout from migrations/001_seed_hierarchy.sql.
+
+Loads the same synthetic corpus into both layouts inside a scratch schema
+through the shipped upsert statements of lib.seeds_db, as `upsert_to_pg.py`
+(with and without --normalized) does, then reports load time, on-disk size
+and hierarchy query latency as JSON.
+
+Usage:
+    python3 benchmarks/bench_hierarchy_layout.py --dsn postgresql://localhost/bench --seeds 200000
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import psycopg
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.util import get_pg_conn_string
+from lib.seeds_db import (
+    NORMALIZED_UPSERT_SQL,
+    UPSERT_SQL,
+    attach_hierarchy_ids,
+    build_seed_rows,
+    in_schema,
+    order_rows,
+)
+
+SCHEMA = "afleau_layout_bench"
+
+# Rows per upsert transaction, for both layouts
+LOAD_BATCH_SIZE = 5000
+
+SETUP_SQL = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+
+CREATE TABLE {SCHEMA}.seeds_jsonb (
+    id          bigserial PRIMARY KEY,
+    platform    text NOT NULL,
+    raw_input   text NOT NULL,
+    parsed_json jsonb,
+    priority    integer NOT NULL DEFAULT 0,
+    updated_at  timestamptz NOT NULL DEFAULT now()
+);
+CREATE UNIQUE INDEX ON {SCHEMA}.seeds_jsonb (platform, lower(btrim(raw_input)));
+
+CREATE TABLE {SCHEMA}.seed_tier1 (
+    id         serial PRIMARY KEY,
+    category   text NOT NULL,
+    name       text NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    UNIQUE (category, name)
+);
+
+CREATE TABLE {SCHEMA}.seed_tier2 (
+    id         serial PRIMARY KEY,
+    tier1_id   integer NOT NULL REFERENCES {SCHEMA}.seed_tier1 (id),
+    name       text NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    UNIQUE (tier1_id, name)
+);
+
+-- Normalized layout, named like afleau.seeds_posts so the shipped upsert SQL applies
+CREATE TABLE {SCHEMA}.seeds_posts (
+    id          bigserial PRIMARY KEY,
+    platform    text NOT NULL,
+    raw_input   text NOT NULL,
+    parsed_json jsonb,
+    priority    integer NOT NULL DEFAULT 0,
+    updated_at  timestamptz NOT NULL DEFAULT now(),
+    tier1_id    integer REFERENCES {SCHEMA}.seed_tier1 (id),
+    tier2_id    integer REFERENCES {SCHEMA}.seed_tier2 (id)
+);
+CREATE UNIQUE INDEX ON {SCHEMA}.seeds_posts (platform, lower(btrim(raw_input)));
+"""
+
+INDEX_SQL = f"""
+CREATE INDEX ON {SCHEMA}.seeds_posts (tier1_id);
+CREATE INDEX ON {SCHEMA}.seeds_posts (tier2_id);
+ANALYZE;
+"""
+
+QUERIES = {
+    "seeds_per_tier1": {
+        "jsonb": f"""
+            SELECT parsed_json->>'tier1_name', count(*)
+            FROM {SCHEMA}.seeds_jsonb
+            WHERE parsed_json->>'category' = %(category)s
+            GROUP BY 1
+        """,
+        "normalized": f"""
+            SELECT t1.name, count(*)
+            FROM {SCHEMA}.seeds_posts s
+            JOIN {SCHEMA}.seed_tier1 t1 ON t1.id = s.tier1_id
+            WHERE t1.category = %(category)s
+            GROUP BY 1
+        """,
+    },
+    "seeds_for_tier2": {
+        "jsonb": f"""
+            SELECT raw_input
+            FROM {SCHEMA}.seeds_jsonb
+            WHERE parsed_json->>'category' = %(category)s
+              AND parsed_json->>'tier2_name' = %(tier2_name)s
+        """,
+        "normalized": f"""
+            SELECT s.raw_input
+            FROM {SCHEMA}.seeds_posts s
+            JOIN {SCHEMA}.seed_tier2 t2 ON t2.id = s.tier2_id
+            JOIN {SCHEMA}.seed_tier1 t1 ON t1.id = t2.tier1_id
+            WHERE t1.category = %(category)s AND t2.name = %(tier2_name)s
+        """,
+    },
+}
+
+
+def synthetic_hierarchy(categories: int, tier1_per_category: int, tier2_per_tier1: int) -> List[tuple]:
+    """Build (category, tier1_name, tier2_name) triples shaped like generator output"""
+    return [
+        (f"category_{c}", f"Tier One Topic {c}-{t1}", f"Tier Two Practice {c}-{t1}-{t2}")
+        for c in range(categories)
+        for t1 in range(tier1_per_category)
+        for t2 in range(tier2_per_tier1)
+    ]
+
+
+def synthetic_seeds(seeds: int, hierarchy: List[tuple]) -> List[Dict[str, Any]]:
+    """Seed dictionaries spread evenly over the hierarchy"""
+    seed_dicts = []
+    for i in range(seeds):
+        category, tier1_name, tier2_name = hierarchy[i % len(hierarchy)]
+        seed_dicts.append({
+            "category": category,
+            "tier1_name": tier1_name,
+            "tier2_name": tier2_name,
+            "seed_text": f"synthetic search seed number {i}",
+        })
+    return seed_dicts
+
+
+def load_layouts(conn: psycopg.Connection, seeds: int, hierarchy: List[tuple]) -> Dict[str, float]:
+    """
+    Load the same synthetic seeds into both layouts.
+
+    Both layouts are loaded like `upsert_to_pg.py` loads them: batches of
+    LOAD_BATCH_SIZE rows in conflict-key order, one transaction per batch,
+    upserted against the conflict index. The JSONB layout uses UPSERT_SQL;
+    the normalized layout first goes through attach_hierarchy_ids() and then
+    uses NORMALIZED_UPSERT_SQL. The load times therefore differ only by layout.
+
+    Returns:
+        Load time in seconds per layout
+    """
+    rows = build_seed_rows(synthetic_seeds(seeds, hierarchy), "youtube")
+    with conn.cursor() as cur:
+        cur.execute(SETUP_SQL)
+    conn.commit()
+
+    # UPSERT_SQL names seeds_posts, which holds the normalized layout here
+    jsonb_sql = in_schema(UPSERT_SQL, SCHEMA).replace(f"{SCHEMA}.seeds_posts", f"{SCHEMA}.seeds_jsonb")
+    load_seconds = {
+        "jsonb": upsert_batches(conn, rows, jsonb_sql),
+        "normalized": upsert_batches(conn, rows, in_schema(NORMALIZED_UPSERT_SQL, SCHEMA), normalized=True),
+    }
+
+    with conn.cursor() as cur:
+        cur.execute(INDEX_SQL)
+    conn.commit()
+    return load_seconds
+
+
+def upsert_batches(conn: psycopg.Connection, rows: List[Dict[str, Any]], sql: str, normalized: bool = False) -> float:
+    """Upsert rows in LOAD_BATCH_SIZE transactions; returns the elapsed seconds"""
+    start = time.perf_counter()
+    for offset in range(0, len(rows), LOAD_BATCH_SIZE):
+        batch = rows[offset:offset + LOAD_BATCH_SIZE]
+        if normalized:
+            batch = attach_hierarchy_ids(conn, batch, schema=SCHEMA)
+        with conn.cursor() as cur:
+            cur.executemany(sql, order_rows(batch))
+        conn.commit()
+    return round(time.perf_counter() - start, 3)
+
+
+def measure_sizes(conn: psycopg.Connection) -> Dict[str, int]:
+    """Total on-disk bytes (heap, TOAST and indexes) per layout"""
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT pg_total_relation_size('{SCHEMA}.seeds_jsonb')")
+        jsonb_bytes = cur.fetchone()[0]
+        cur.execute(f"""
+            SELECT pg_total_relation_size('{SCHEMA}.seeds_posts')
+                 + pg_total_relation_size('{SCHEMA}.seed_tier1')
+                 + pg_total_relation_size('{SCHEMA}.seed_tier2')
+        """)
+        normalized_bytes = cur.fetchone()[0]
+    return {"jsonb": jsonb_bytes, "normalized": normalized_bytes}
+
+
+def measure_queries(conn: psycopg.Connection, params: Dict[str, Any], repeats: int) -> Dict[str, Any]:
+    """Median and p95 latency in milliseconds for each query and layout"""
+    results = {}
+    with conn.cursor() as cur:
+        for query_name, layouts in QUERIES.items():
+            results[query_name] = {}
+            for layout, sql in layouts.items():
+                cur.execute(sql, params)  # Warm the cache
+                cur.fetchall()
+                timings = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    cur.execute(sql, params)
+                    cur.fetchall()
+                    timings.append((time.perf_counter() - start) * 1000)
+                timings.sort()
+                results[query_name][layout] = {
+                    "median_ms": round(statistics.median(timings), 3),
+                    "p95_ms": round(timings[int(0.95 * (len(timings) - 1))], 3),
+                }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare JSONB and normalized hierarchy layouts')
+    parser.add_argument('--dsn', help='PostgreSQL connection string (default: from lib.util.get_pg_conn_string)')
+    parser.add_argument('--seeds', type=int, default=200000, help='Number of synthetic seeds (default: 200000)')
+    parser.add_argument('--categories', type=int, default=22, help='Number of categories (default: 22)')
+    parser.add_argument('--repeats', type=int, default=20, help='Timed runs per query (default: 20)')
+    parser.add_argument('--output', type=Path, help='Write results JSON to this file')
+    parser.add_argument('--keep', action='store_true', help='Keep the scratch schema after the run')
+    args = parser.parse_args()
+
+    dsn = args.dsn or get_pg_conn_string()
+    hierarchy = synthetic_hierarchy(args.categories, tier1_per_category=12, tier2_per_tier1=8)
+
+    with psycopg.connect(dsn) as conn:
+        load_seconds = load_layouts(conn, args.seeds, hierarchy)
+        sample_category, _, sample_tier2 = hierarchy[len(hierarchy) // 2]
+        results = {
+            "benchmark": "hierarchy_layout",
+            "seeds": args.seeds,
+            "hierarchy_rows": len(hierarchy),
+            "load_seconds": load_seconds,
+            "size_bytes": measure_sizes(conn),
+            "query_latency": measure_queries(
+                conn,
+                {"category": sample_category, "tier2_name": sample_tier2},
+                args.repeats
+            ),
+        }
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+            conn.commit()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
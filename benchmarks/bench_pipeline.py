@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmarks for the generation and upsert pipelines.
+
+Runs DataGenerator.generate_all_data against a simulated-latency backend
+across concurrency levels and category sizes, and micro-benchmarks the
+Tier 3 filter, CSV checkpoint I/O and seeds_posts row building on synthetic
+corpora. Results are written as JSON so runs can be compared.
+
+Usage:
+    python3 benchmarks/bench_pipeline.py --output benchmarks/results/latest.json
+    python3 benchmarks/bench_pipeline.py --quick --compare benchmarks/results/latest.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+from lib.seeds_db import build_seed_rows, dedupe_rows
+
+logger = logging.getLogger(__name__)
+
+# (name, Tier 1 categories, Tier 2 items per Tier 1)
+CATEGORY_SIZES = [("small", 4, 5), ("medium", 10, 10), ("large", 20, 20)]
+CONCURRENCY_LEVELS = [1, 8, 32]
+CORPUS_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def timed(func: Callable[[], Any], repeats: int = 1) -> Dict[str, float]:
+    """Run func repeats times and return best and mean wall-clock seconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {"best_s": round(min(timings), 6), "mean_s": round(sum(timings) / len(timings), 6)}
+
+
+def synthetic_seeds(count: int, duplicate_ratio: float = 0.1) -> List[Dict[str, Any]]:
+    """Tier 3 seed dictionaries shaped like generator output, with some case-only duplicates"""
+    unique = int(count * (1 - duplicate_ratio))
+    seeds = []
+    for i in range(count):
+        n = i if i < unique else i % unique
+        text = f"synthetic search seed {n}" if i < unique else f"Synthetic Search Seed {n}"
+        seeds.append({
+            "category": "benchmark",
+            "tier1_name": f"Tier One {n % 20}",
+            "tier2_name": f"Tier Two {n % 400}",
+            "seed_text": text,
+        })
+    return seeds
+
+
+def new_generator(backend, output_dir: Path) -> DataGenerator:
+    """Create a generator writing into an isolated output directory"""
+    config.base_output_dir = str(output_dir)
+    return DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+
+
+def bench_generation(latency: float, jitter: float, sizes, concurrency_levels) -> List[Dict[str, Any]]:
+    """Full generate_all_data runs against SyntheticBackend"""
+    results = []
+    for size_name, tier1_items, tier2_items in sizes:
+        for concurrency in concurrency_levels:
+            backend = SyntheticBackend(
+                latency=latency, jitter=jitter,
+                tier1_items=tier1_items, tier2_items=tier2_items, seed=0
+            )
+            config.max_concurrency = concurrency
+            with tempfile.TemporaryDirectory() as tmp:
+                generator = new_generator(backend, Path(tmp))
+                start = time.perf_counter()
+                counts = asyncio.run(generator.generate_all_data())
+                elapsed = time.perf_counter() - start
+
+            results.append({
+                "size": size_name,
+                "concurrency": concurrency,
+                "calls": backend.calls,
+                "tier3_seeds": counts["tier3_count"],
+                "wall_s": round(elapsed, 4),
+                "calls_per_s": round(backend.calls / elapsed, 2),
+            })
+            logger.info(f"generation {size_name} x{concurrency}: {elapsed:.2f}s for {backend.calls} calls")
+    return results
+
+
+def bench_corpus(count: int, repeats: int) -> Dict[str, Any]:
+    """Filter, checkpoint I/O and row building on a synthetic corpus"""
+    seeds = synthetic_seeds(count)
+    result = {"seeds": count}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = new_generator(SyntheticBackend(), Path(tmp))
+
+        def run_filter():
+            generator.seed_hashes.clear()
+            generator._filter_tier3_seeds(seeds)
+
+        result["filter_tier3_seeds"] = timed(run_filter, repeats)
+
+        checkpoint = Path(tmp) / "checkpoint.csv"
+        result["save_tier3_checkpoint"] = timed(lambda: generator._save_tier3_to_file(seeds, checkpoint), repeats)
+        result["load_tier3_checkpoint"] = timed(lambda: generator._load_tier3_from_file(checkpoint), repeats)
+        result["save_tier3_aggregate"] = timed(lambda: generator._create_aggregated_tier3_file(seeds), repeats)
+
+    result["build_seed_rows"] = timed(lambda: build_seed_rows(seeds, "youtube"), repeats)
+    rows = build_seed_rows(seeds, "youtube")
+    result["dedupe_rows"] = timed(lambda: dedupe_rows(rows), repeats)
+
+    logger.info(f"corpus {count}: filter {result['filter_tier3_seeds']['best_s']}s, "
+                f"rows {result['build_seed_rows']['best_s']}s")
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    """Metadata needed to compare results across runs"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]):
+    """Print current/baseline timing ratios; >1.0 means slower than baseline"""
+    print(f"Comparing against baseline from {baseline['environment']['timestamp']}")
+
+    baseline_runs = {(r["size"], r["concurrency"]): r for r in baseline.get("generation", [])}
+    for run in current.get("generation", []):
+        base = baseline_runs.get((run["size"], run["concurrency"]))
+        if base:
+            print(f"  generation {run['size']:>6} x{run['concurrency']:<3} {run['wall_s'] / base['wall_s']:.2f}x")
+
+    baseline_corpora = {c["seeds"]: c for c in baseline.get("corpus", [])}
+    for corpus in current.get("corpus", []):
+        base = baseline_corpora.get(corpus["seeds"])
+        if not base:
+            continue
+        for stage, timing in corpus.items():
+            if isinstance(timing, dict) and stage in base:
+                print(f"  {stage:>22} {corpus['seeds']:>9} {timing['best_s'] / base[stage]['best_s']:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the generation and upsert pipelines')
+    parser.add_argument('--latency', type=float, default=0.05, help='Simulated model latency in seconds (default: 0.05)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Simulated latency jitter in seconds (default: 0.02)')
+    parser.add_argument('--repeats', type=int, default=3, help='Repeats per corpus micro-benchmark (default: 3)')
+    parser.add_argument('--quick', action='store_true', help='Small sizes only (10k corpus, small/medium categories)')
+    parser.add_argument('--skip-generation', action='store_true', help='Only run the corpus micro-benchmarks')
+    parser.add_argument('--output', type=Path, help='Write results JSON to this file')
+    parser.add_argument('--compare', type=Path, help='Baseline results JSON to compare against')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # The generator logs every item at INFO, which would dominate the timings
+    logging.getLogger("lib").setLevel(logging.WARNING)
+
+    sizes = CATEGORY_SIZES[:2] if args.quick else CATEGORY_SIZES
+    corpus_sizes = CORPUS_SIZES[:1] if args.quick else CORPUS_SIZES
+
+    results = {"environment": environment()}
+    if not args.skip_generation:
+        results["generation"] = bench_generation(args.latency, args.jitter, sizes, CONCURRENCY_LEVELS)
+    results["corpus"] = [bench_corpus(count, args.repeats) for count in corpus_sizes]
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output + "\n")
+    print(output)
+
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the command-line entry points.
+
+Runs each target under `python -X importtime` and sums the cumulative
+import time of everything the target imports beyond the interpreter's own
+startup. Targets fail when their median import time exceeds its budget or
+when they import a module they must not need (boto3 and psycopg are only
+imported by the code paths that talk to AWS or PostgreSQL). Exits non-zero
+on any failure, so it can gate CI.
+
+Usage:
+    python3 benchmarks/bench_startup.py
+    python3 benchmarks/bench_startup.py --repeats 9 --budget-scale 2 --output benchmarks/results/startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.bench_pipeline import environment
+
+# (name, arguments after `python -X importtime`, import budget in ms, modules that must not be imported)
+TARGETS: List[Tuple[str, List[str], float, Tuple[str, ...]]] = [
+    ("import lib.registry", ["-c", "import lib.registry"], 60, ("boto3", "botocore", "psycopg", "prompts")),
+    ("import lib.generator", ["-c", "import lib.generator"], 200, ("boto3", "psycopg", "http.server")),
+    ("generate_seeds --list-categories", ["scripts/generate_seeds.py", "--list-categories"], 150,
+     ("boto3", "psycopg", "http.server", "prompts.food_prompts", "asyncio", "lib.generator")),
+    ("generate_seeds --help", ["scripts/generate_seeds.py", "--help"], 150,
+     ("boto3", "psycopg", "http.server", "asyncio", "lib.generator")),
+]
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, cumulative microseconds, nesting depth) of every `-X importtime` line"""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            _, cumulative, indent, module = match.groups()
+            entries.append((module, int(cumulative), (len(indent) - 1) // 2))
+    return entries
+
+
+def run_importtime(arguments: List[str]) -> Tuple[List[Tuple[str, int, int]], float]:
+    """Run the interpreter with -X importtime; returns its import entries and wall-clock seconds"""
+    # Let bytecode be cached, as it is in deployed environments
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        cwd=project_root, env=env, capture_output=True, text=True
+    )
+    wall_s = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise RuntimeError(f"{' '.join(arguments)} exited with {completed.returncode}: {completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr), wall_s
+
+
+def import_cost_ms(entries: List[Tuple[str, int, int]], baseline: Set[str]) -> float:
+    """Cumulative time of the top-level imports that interpreter startup does not already do"""
+    return sum(cumulative for module, cumulative, depth in entries if depth == 0 and module not in baseline) / 1000
+
+
+def bench_target(
+    name: str,
+    arguments: List[str],
+    budget_ms: float,
+    forbidden: Tuple[str, ...],
+    baseline: Set[str],
+    repeats: int,
+) -> Dict[str, Any]:
+    run_importtime(arguments)  # Warm-up: writes bytecode caches
+    costs, walls, imported = [], [], set()
+    for _ in range(repeats):
+        entries, wall_s = run_importtime(arguments)
+        costs.append(import_cost_ms(entries, baseline))
+        walls.append(wall_s * 1000)
+        imported.update(module for module, _, _ in entries)
+
+    loaded_forbidden = sorted(
+        prefix for prefix in forbidden
+        if any(module == prefix or module.startswith(prefix + ".") for module in imported)
+    )
+    median_ms = statistics.median(costs)
+    result = {
+        "target": name,
+        "import_ms": round(median_ms, 1),
+        "budget_ms": budget_ms,
+        "wall_ms": round(statistics.median(walls), 1),
+        "modules": len(imported),
+        "forbidden_imports": loaded_forbidden,
+        "passed": median_ms <= budget_ms and not loaded_forbidden,
+    }
+    status = "ok" if result["passed"] else "FAIL"
+    print(f"{status:>4}  {name:<36} {median_ms:7.1f} ms (budget {budget_ms:g})  wall {result['wall_ms']:7.1f} ms"
+          + (f"  forbidden: {', '.join(loaded_forbidden)}" if loaded_forbidden else ""))
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Enforce import-time budgets of the command-line entry points')
+    parser.add_argument('--repeats', type=int, default=5, help='Measured runs per target; the median counts (default: 5)')
+    parser.add_argument('--budget-scale', type=float, default=1.0, help='Multiply every budget, e.g. 2 on slow CI machines')
+    parser.add_argument('--output', type=Path, help='Write results JSON to this file')
+    args = parser.parse_args()
+
+    baseline = {module for module, _, _ in run_importtime(["-c", "pass"])[0]}
+    results = [
+        bench_target(name, arguments, budget_ms * args.budget_scale, forbidden, baseline, args.repeats)
+        for name, arguments, budget_ms, forbidden in TARGETS
+    ]
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"environment": environment(), "startup": results}, indent=2) + "\n")
+
+    return 0 if all(result["passed"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
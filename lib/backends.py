@@ -0,0 +1,283 @@
+"""
+Pluggable transports for BedrockClient
+
+BotoBackend talks to Bedrock. RecordingBackend captures prompt/response
+pairs from another backend into a JSONL fixture archive, and ReplayBackend
+serves them back offline with configurable latency and fault injection so
+pipeline runs and benchmarks are reproducible without AWS credentials.
+SyntheticBackend fabricates well-formed responses of a configurable size
+for load tests that need no fixtures at all.
+"""
+
+import abc
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from lib.routing import min_cache_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(request_body: Dict[str, Any]) -> str:
+    """
+    Fixture key for a request: a hash of its prompt content only.
+
+    Inference parameters are deliberately excluded so fixtures stay valid
+    when temperature or max_tokens are tuned.
+    """
+    prompt_content = {
+        "system": request_body.get("system"),
+        "messages": request_body.get("messages"),
+    }
+    return hashlib.sha256(json.dumps(prompt_content, sort_keys=True).encode()).hexdigest()
+
+
+def accepts_native_body(model_id: str) -> bool:
+    """Whether InvokeModel takes BedrockClient's Nova-native request body for a model"""
+    return "amazon.nova-" in model_id
+
+
+class BedrockBackend(abc.ABC):
+    """Interface for the transport used by BedrockClient"""
+
+    @abc.abstractmethod
+    async def invoke(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one request and return the parsed response body.
+
+        Transport errors must surface as botocore ClientError/BotoCoreError so
+        BedrockClient's retry logic applies to every backend alike.
+        """
+        raise NotImplementedError
+
+
+class BotoBackend(BedrockBackend):
+    """
+    Live Bedrock runtime backend.
+
+    Args:
+        region: AWS region
+        api: "invoke" sends the request body to InvokeModel; "converse" sends
+            its messages, system blocks (with cache points) and inferenceConfig
+            to the Converse API, which supports prompt caching on every model
+            that does. Models that do not take the Nova-native body (e.g.
+            Claude models routed to a tier) always use the Converse API.
+    """
+
+    def __init__(self, region: str = "us-east-1", api: str = "invoke"):
+        if api not in ("invoke", "converse"):
+            raise ValueError(f"Unknown Bedrock API '{api}'; expected 'invoke' or 'converse'")
+        self.region = region
+        self.api = api
+        import boto3  # Deferred so replayed and synthetic runs never pay for the import
+        self.client = boto3.client("bedrock-runtime", region_name=region)
+
+    async def invoke(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        # boto3 is blocking, so run it off the event loop
+        if self.api == "converse" or not accepts_native_body(model_id):
+            response = await asyncio.to_thread(self.client.converse, modelId=model_id, **request_body)
+            response.pop("ResponseMetadata", None)
+            return response
+        response = await asyncio.to_thread(
+            self.client.invoke_model,
+            modelId=model_id,
+            body=json.dumps(request_body)
+        )
+        return json.loads(response["body"].read())
+
+
+class RecordingBackend(BedrockBackend):
+    """Wraps another backend and appends every prompt/response pair to a fixture archive"""
+
+    def __init__(self, inner: BedrockBackend, archive_path: Path):
+        self.inner = inner
+        self.archive_path = Path(archive_path)
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+
+    async def invoke(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        response_body = await self.inner.invoke(model_id, request_body)
+
+        record = {
+            "key": request_key(request_body),
+            "model_id": model_id,
+            "request": request_body,
+            "response": response_body,
+        }
+        with open(self.archive_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        return response_body
+
+
+class ReplayBackend(BedrockBackend):
+    """
+    Serves recorded responses from a fixture archive.
+
+    Args:
+        archive_path: JSONL archive written by RecordingBackend
+        latency: Mean simulated latency per call, in seconds
+        jitter: Latency is drawn uniformly from latency +/- jitter
+        throttle_rate: Probability of raising a ThrottlingException
+        malformed_rate: Probability of returning truncated, unparseable JSON
+        seed: Seed for the fault-injection RNG (None for nondeterministic)
+        fallback: Backend used for prompts that are not in the archive
+    """
+
+    def __init__(
+        self,
+        archive_path: Path,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        seed: Optional[int] = None,
+        fallback: Optional[BedrockBackend] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.malformed_rate = malformed_rate
+        self.fallback = fallback
+        self._rng = random.Random(seed)
+        self._fixtures: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+
+        with open(archive_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._fixtures.setdefault(record["key"], []).append(record["response"])
+
+        logger.info(f"Loaded {sum(len(r) for r in self._fixtures.values())} recorded responses from {archive_path}")
+
+    async def invoke(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._rng.random() < self.throttle_rate:
+            from botocore.exceptions import ClientError
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded (injected)"}},
+                "InvokeModel"
+            )
+
+        key = request_key(request_body)
+        responses = self._fixtures.get(key)
+        if not responses:
+            if self.fallback is not None:
+                return await self.fallback.invoke(model_id, request_body)
+            raise FixtureNotFoundError(f"No recorded response for request {key[:12]}")
+
+        # Cycle through repeated recordings of the same prompt
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        response_body = copy.deepcopy(responses[index % len(responses)])
+
+        if self._rng.random() < self.malformed_rate:
+            self._truncate_text(response_body)
+
+        return response_body
+
+    @staticmethod
+    def _truncate_text(response_body: Dict[str, Any]):
+        """Cut the response text in half so JSON parsing fails downstream"""
+        try:
+            content = response_body["output"]["message"]["content"][0]
+        except (KeyError, IndexError, TypeError):
+            return
+        content["text"] = content["text"][:len(content["text"]) // 2]
+
+
+class SyntheticBackend(BedrockBackend):
+    """
+    Fabricates valid Tier 1/2/3 responses with simulated latency.
+
+    The tier is detected from the JSON key the prompt asks for. Seeds are
+    unique across calls and sized to pass the default length filter, and
+    responses carry a usage block estimated from prompt and output length.
+    System blocks followed by a cache point are reported as cache writes the
+    first time and as cache reads afterwards, like Bedrock's prompt cache;
+    blocks below the model's minimum cacheable tokens are billed as uncached
+    input.
+
+    Args:
+        latency: Mean simulated latency per call, in seconds
+        jitter: Latency is drawn uniformly from latency +/- jitter
+        tier1_items: Tier 1 categories per Tier 1 response
+        tier2_items: Tier 2 items per Tier 2 response
+        tier3_items: Search seeds per Tier 3 response
+        seed: Seed for the latency RNG (None for nondeterministic)
+        min_cache_tokens: Minimum system block tokens to cache (default: the
+            model's minimum from lib.routing)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        tier1_items: int = 10,
+        tier2_items: int = 8,
+        tier3_items: int = 15,
+        seed: Optional[int] = None,
+        min_cache_tokens: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.tier1_items = tier1_items
+        self.tier2_items = tier2_items
+        self.tier3_items = tier3_items
+        self.calls = 0
+        self.min_cache_tokens = min_cache_tokens
+        self._rng = random.Random(seed)
+        self._cached_systems: Set[str] = set()
+
+    async def invoke(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        self.calls += 1
+        call = self.calls
+        prompt = json.dumps(request_body.get("messages"))
+        system = json.dumps(request_body.get("system")) if request_body.get("system") else ""
+        instructions = system + prompt
+        if "search_seeds" in instructions:
+            payload = {"search_seeds": [f"synthetic seed {call} idea {i}" for i in range(self.tier3_items)]}
+        elif "tier2_items" in instructions:
+            payload = {"tier2_items": [f"Synthetic Practice {call}-{i}" for i in range(self.tier2_items)]}
+        else:
+            payload = {"tier1_categories": [f"Synthetic Category {i}" for i in range(self.tier1_items)]}
+
+        text = json.dumps(payload)
+        usage = {
+            "inputTokens": len(prompt) // 4,
+            "outputTokens": len(text) // 4,
+            "totalTokens": (len(instructions) + len(text)) // 4,
+        }
+        if system and "cachePoint" in system and len(system) // 4 >= self._min_cache_tokens(model_id):
+            usage["cacheReadInputTokens" if system in self._cached_systems else "cacheWriteInputTokens"] = len(system) // 4
+            self._cached_systems.add(system)
+        elif system:
+            usage["inputTokens"] += len(system) // 4
+        return {
+            "output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+            "usage": usage,
+            "stopReason": "end_turn",
+        }
+
+    def _min_cache_tokens(self, model_id: str) -> int:
+        if self.min_cache_tokens is not None:
+            return self.min_cache_tokens
+        return min_cache_tokens(model_id)
+
+
+class FixtureNotFoundError(KeyError):
+    """Raised when a replayed request has no recorded response"""
+    pass
@@ -2,22 +2,51 @@
 Bedrock client for data generation
 """
 
-import json
-import boto3
 import asyncio
+import time
 from typing import Dict, Any, Optional
 from botocore.exceptions import ClientError, BotoCoreError
 import logging
 
+from lib.backends import BedrockBackend, BotoBackend
+from lib.telemetry import CallRecord, CallTelemetry, THROTTLE_ERROR_CODES
+from lib.metrics import metrics
+from lib.tracing import span, set_attributes
+from lib.rate_limiter import RateLimiter
+from lib.resilience import CircuitBreaker, RetryBudget
+
 logger = logging.getLogger(__name__)
 
+# Error codes of a degraded service rather than a bad request; with 5xx
+# responses and connection errors, only these count against the circuit breaker
+SERVICE_ERROR_CODES = THROTTLE_ERROR_CODES | {
+    "InternalServerException",
+    "ModelTimeoutException",
+    "ModelNotReadyException",
+}
+
 
 class BedrockClient:
     """Bedrock client wrapper for data generation"""
     
-    def __init__(self, region: str = "us-east-1"):
+    def __init__(
+        self,
+        region: str = "us-east-1",
+        backend: Optional[BedrockBackend] = None,
+        requests_per_minute: Optional[float] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         self.region = region
-        self.client = boto3.client("bedrock-runtime", region_name=region)
+        # Transport is pluggable so runs can be recorded and replayed offline
+        self.backend = backend if backend is not None else BotoBackend(region)
+        self.telemetry = CallTelemetry()
+        # Optional client-side cap on attempts per minute (retries included)
+        self.rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        # Optional cap on retries across all calls, shared with the generator's JSON retries
+        self.retry_budget = retry_budget
+        # Optional breaker that pauses and fast-fails calls while the service is failing
+        self.circuit_breaker = circuit_breaker
     
     async def invoke_model(
         self,
@@ -26,11 +55,16 @@ class BedrockClient:
         temperature: float = 0.1,
         top_p: float = 0.9,
         max_tokens: int = 4000,
-        max_retries: int = 3
+        max_retries: int = 3,
+        tags: Optional[Dict[str, Any]] = None,
+        system: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Invoke Bedrock model with retry logic
         
+        Every attempt is recorded in self.telemetry with its latency, token
+        usage and outcome.
+        
         Args:
             model_id: Bedrock model ID (e.g., "amazon.nova-micro-v1:0")
             prompt: Input prompt
@@ -38,13 +72,19 @@ class BedrockClient:
             top_p: Nucleus sampling parameter
             max_tokens: Maximum tokens to generate
             max_retries: Number of retry attempts
+            tags: Telemetry tags; "stage" and "category" are used for grouping
+            system: Static instructions sent as a system block followed by a
+                cache point, so Bedrock can serve them from its prompt cache
             
         Returns:
-            Parsed response from Bedrock
+            Parsed response from Bedrock, including the "call_record" of the
+            successful attempt
             
         Raises:
-            BedrockError: If all retries fail
+            BedrockError: If all retries fail or the retry budget is exhausted
+            CircuitOpenError: If the circuit breaker stayed open for its maximum pause
         """
+        tags = tags or {}
         request_body = {
             "messages": [
                 {
@@ -58,64 +98,167 @@ class BedrockClient:
                 "topP": top_p
             }
         }
+        if system is not None:
+            request_body["system"] = [{"text": system}, {"cachePoint": {"type": "default"}}]
         
         last_error = None
         for attempt in range(max_retries):
+            permit = None
+            if self.circuit_breaker is not None:
+                permit = await self.circuit_breaker.acquire()
+                if permit is None:
+                    metrics.inc("seedgen_model_calls_total", stage=tags.get("stage", "unknown"), outcome="circuit_open")
+                    raise CircuitOpenError(
+                        f"Circuit breaker open for over {self.circuit_breaker.max_pause_s:.0f}s; not calling {model_id}"
+                    ) from last_error
             try:
-                logger.info(f"Invoking Bedrock model {model_id} (attempt {attempt + 1}/{max_retries})")
-                
-                response = self.client.invoke_model(
-                    modelId=model_id,
-                    body=json.dumps(request_body)
-                )
-                
-                # Parse the response
-                response_body = json.loads(response["body"].read())
-                logger.debug(f"Raw response body: {response_body}")
-                
-                # Handle different response formats
-                content = None
-                if "output" in response_body and "message" in response_body["output"]:
-                    # Standard format
-                    content = response_body["output"]["message"]["content"][0]["text"]
-                elif "completion" in response_body:
-                    # Alternative format
-                    content = response_body["completion"]
-                elif "text" in response_body:
-                    # Another alternative format
-                    content = response_body["text"]
-                else:
-                    logger.error(f"Unexpected response format: {response_body}")
-                    raise BedrockError(f"Unexpected response format from Bedrock")
-                
-                if content is None:
-                    logger.error("Content is None after parsing response")
-                    raise BedrockError("Empty content in Bedrock response")
-                
-                # Clean the content - remove markdown code blocks if present
-                clean_content = self._clean_response(content)
-                
-                logger.info(f"Bedrock model {model_id} responded successfully")
-                return {
-                    "content": clean_content,
-                    "raw_response": response_body,
-                    "model_id": model_id,
-                    "attempt": attempt + 1
-                }
-                
-            except (ClientError, BotoCoreError) as e:
-                last_error = e
-                logger.warning(f"Bedrock invocation failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                
-                if attempt < max_retries - 1:
-                    # Wait before retry (exponential backoff)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                logger.info("Invoking Bedrock model %s (attempt %d/%d)", model_id, attempt + 1, max_retries)
+                start = time.perf_counter()
+            
+                metrics.inc("seedgen_inflight_calls")
+                response_body = None
+                with span("bedrock.invoke_model", model_id=model_id, attempt=attempt + 1, **tags) as current:
+                    try:
+                        response_body = await self.backend.invoke(model_id, request_body)
+                    except asyncio.CancelledError:
+                        # The losing copy of a hedged call (lib.hedging)
+                        self._record_call(model_id, tags, attempt + 1, start, "cancelled")
+                        set_attributes(current, outcome="cancelled")
+                        raise
+                    except (ClientError, BotoCoreError) as e:
+                        last_error = e
+                        outcome = "throttled" if self._is_throttle(e) else "error"
+                        self._record_call(model_id, tags, attempt + 1, start, outcome)
+                        set_attributes(current, outcome=outcome)
+                        logger.warning("Bedrock invocation failed (attempt %d/%d): %s", attempt + 1, max_retries, e)
+                        if self.circuit_breaker is not None and self._is_service_failure(e):
+                            self.circuit_breaker.record_failure(permit)
+                    
+                        if attempt == max_retries - 1:
+                            logger.error("All Bedrock retry attempts failed: %s", e)
+                            raise BedrockError(f"Bedrock invocation failed after {max_retries} attempts: {str(e)}") from e
+                        if self.retry_budget is not None and not self.retry_budget.try_retry("api"):
+                            logger.error("Retry budget exhausted; not retrying: %s", e)
+                            raise BedrockError(f"Bedrock invocation failed and the retry budget is exhausted: {str(e)}") from e
+                    else:
+                        if self.circuit_breaker is not None:
+                            self.circuit_breaker.record_success(permit)
+                        if self.retry_budget is not None:
+                            self.retry_budget.record_success()
+                        usage = response_body.get("usage") or {}
+                        set_attributes(
+                            current, outcome="ok",
+                            input_tokens=usage.get("inputTokens"), output_tokens=usage.get("outputTokens")
+                        )
+                    finally:
+                        metrics.inc("seedgen_inflight_calls", -1)
+            finally:
+                # Frees the half-open probe slot if the call ended without an outcome
+                # (cancelled, a request error, or an error other than a Bedrock one)
+                if permit is not None:
+                    self.circuit_breaker.release(permit)
+            
+            if response_body is None:
+                # Wait before retry (exponential backoff)
+                with span("bedrock.backoff", stage=tags.get("stage"), attempt=attempt + 1, wait_s=2 ** attempt):
                     await asyncio.sleep(2 ** attempt)
-                else:
-                    logger.error(f"All Bedrock retry attempts failed: {str(e)}")
-                    raise BedrockError(f"Bedrock invocation failed after {max_retries} attempts: {str(e)}") from e
+                continue
+            
+            record = self._record_call(model_id, tags, attempt + 1, start, "ok", response_body.get("usage"))
+            # Lazy %-formatting: the response dict is only stringified when DEBUG is enabled
+            logger.debug("Raw response body: %s", response_body)
+            
+            # Handle different response formats
+            content = None
+            if "output" in response_body and "message" in response_body["output"]:
+                # Standard format
+                content = response_body["output"]["message"]["content"][0]["text"]
+            elif "completion" in response_body:
+                # Alternative format
+                content = response_body["completion"]
+            elif "text" in response_body:
+                # Another alternative format
+                content = response_body["text"]
+            else:
+                record.outcome = "error"
+                logger.error("Unexpected response format: %s", response_body)
+                raise BedrockError(f"Unexpected response format from Bedrock")
+            
+            if content is None:
+                record.outcome = "error"
+                logger.error("Content is None after parsing response")
+                raise BedrockError("Empty content in Bedrock response")
+            
+            # Clean the content - remove markdown code blocks if present
+            clean_content = self._clean_response(content)
+            
+            logger.info("Bedrock model %s responded successfully", model_id)
+            return {
+                "content": clean_content,
+                "raw_response": response_body,
+                "model_id": model_id,
+                "attempt": attempt + 1,
+                "call_record": record
+            }
         
         raise BedrockError(f"Bedrock invocation failed: {str(last_error)}") from last_error
     
+    def _record_call(
+        self,
+        model_id: str,
+        tags: Dict[str, Any],
+        attempt: int,
+        start: float,
+        outcome: str,
+        usage: Optional[Dict[str, Any]] = None
+    ) -> CallRecord:
+        """Record one attempt in the client's telemetry and metrics"""
+        usage = usage or {}
+        stage = tags.get("stage", "unknown")
+        metrics.inc("seedgen_model_calls_total", stage=stage, outcome=outcome)
+        if outcome == "throttled":
+            metrics.inc("seedgen_throttles_total", stage=stage)
+        if attempt > 1:
+            metrics.inc("seedgen_retries_total", stage=stage, kind="api")
+        
+        return self.telemetry.record(CallRecord(
+            model_id=model_id,
+            stage=stage,
+            category=tags.get("category", "unknown"),
+            attempt=attempt,
+            latency_s=time.perf_counter() - start,
+            outcome=outcome,
+            input_tokens=usage.get("inputTokens", 0),
+            output_tokens=usage.get("outputTokens", 0),
+            # Converse reports cacheRead/WriteInputTokens, native Nova responses *TokenCount
+            cache_read_input_tokens=usage.get("cacheReadInputTokens", usage.get("cacheReadInputTokenCount", 0)),
+            cache_write_input_tokens=usage.get("cacheWriteInputTokens", usage.get("cacheWriteInputTokenCount", 0)),
+            tags=tags
+        ))
+    
+    @staticmethod
+    def _is_throttle(error: Exception) -> bool:
+        """Check whether a botocore error is a rate-limiting response"""
+        if isinstance(error, ClientError):
+            return error.response.get("Error", {}).get("Code") in THROTTLE_ERROR_CODES
+        return False
+    
+    @staticmethod
+    def _is_service_failure(error: Exception) -> bool:
+        """
+        Check whether a botocore error says the service is failing.
+        
+        Request errors such as ValidationException or AccessDeniedException
+        (e.g. a bad model ID in a route) fail the same way every time and say
+        nothing about the service, so they must not open the shared breaker.
+        """
+        if isinstance(error, ClientError):
+            status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+            return error.response.get("Error", {}).get("Code") in SERVICE_ERROR_CODES or status >= 500
+        return True
+    
     def _clean_response(self, content: str) -> str:
         """Clean response content by removing markdown code blocks"""
         clean_content = content.strip()
@@ -130,3 +273,8 @@ class BedrockError(Exception):
     """Custom exception for Bedrock-related errors"""
     pass
 
+
+class CircuitOpenError(BedrockError):
+    """Raised when a call is not sent because the circuit breaker is open"""
+    pass
+
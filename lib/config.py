@@ -2,8 +2,8 @@
 Configuration for data generation (supports multiple categories)
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
 
 @dataclass
@@ -22,14 +22,63 @@ class DataGenerationConfig:
     top_p: float = 0.9
     max_tokens: int = 4000
     max_retries: int = 3
+    # Per-tier overrides of model_id/max_tokens/temperature/top_p (see lib/routing.py),
+    # e.g. {"tier1": {"model_id": "amazon.nova-pro-v1:0"}, "tier3": {"max_tokens": 1024}}
+    tier_routes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Per-category overrides applied on top, e.g. {"food": {"tier3": {"temperature": 0.3}}}
+    category_routes: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+    max_prompt_tokens: int = 800  # Estimated rendered-prompt size flagged by scripts/analyze_prompts.py
+    prompt_caching: bool = False  # Send Tier 2/3 instructions as a cached system block via the Converse API
     
-    # Processing settings (for future use if batch processing is re-implemented)
-    # tier2_batch_size: int = 5  # Number of Tier 2 items to process in parallel
-    # tier3_batch_size: int = 6  # Number of Tier 3 seeds to generate per Tier 2
+    # Hedging settings (lib/hedging.py)
+    hedge_requests: bool = False  # Duplicate calls still running after the stage's latency percentile
+    hedge_latency_percentile: float = 95.0  # Observed latency percentile after which a call is hedged
+    hedge_budget_ratio: float = 0.05  # Maximum hedged calls as a share of all calls
+    hedge_min_samples: int = 20  # Observed calls of a stage before its calls are hedged
+    hedge_min_delay_s: float = 1.0  # Calls are never hedged sooner than this
+    
+    # Retry budget and circuit breaker settings (lib/resilience.py)
+    retry_budget_ratio: Optional[float] = 0.2  # Retries per successful call in the window (None = unlimited)
+    retry_budget_min_retries: int = 10  # Retries allowed per window regardless of successes
+    retry_budget_window_s: float = 60.0
+    circuit_breaker: bool = True  # Pause and fast-fail calls while most recent calls fail
+    circuit_failure_threshold: float = 0.5  # Share of failed recent calls that opens the breaker
+    circuit_window: int = 20  # Recent call outcomes considered
+    circuit_min_calls: int = 10  # Outcomes needed before the breaker can open
+    circuit_cooldown_s: float = 30.0  # Pause before a probe call is let through
+    circuit_max_pause_s: float = 300.0  # Longest a call waits for the breaker before failing fast
+    
+    # Pricing for run report cost estimates of models missing from lib.routing.MODEL_PRICING
+    # (USD per 1,000 tokens, on-demand Nova Micro)
+    input_cost_per_1k_tokens: float = 0.000035
+    output_cost_per_1k_tokens: float = 0.00014
+    cache_read_cost_per_1k_tokens: float = 0.00000875  # Prompt-cache reads (75% below the input price)
+    cache_write_cost_per_1k_tokens: float = 0.000035  # Prompt-cache writes
+    
+    # Processing settings
+    max_concurrency: int = 1  # Maximum in-flight model calls for Tier 2/Tier 3 items
+    requests_per_minute: Optional[float] = None  # Client-side cap on model call attempts (None = unlimited)
+    
+    # Target-yield settings
+    target_seeds: Optional[int] = None  # Stop once this many unique Tier 3 seeds are kept (None = no target)
+    max_top_up_rounds: int = 3  # Extra call rounds for Tier 2 items below their share of the target
+    max_exclusion_seeds: int = 100  # Kept seeds listed in a top-up prompt as exclusions
+    
+    # Deadline settings
+    deadline: Optional[float] = None  # Unix timestamp after which no call should still be running
+    deadline_default_latency_s: float = 20.0  # Assumed call latency until latencies are observed
+    
+    # Work-queue (--worker) settings
+    queue_visibility_timeout_s: float = 300.0  # Lease length; heartbeats extend it every third of this
+    queue_poll_interval_s: float = 5.0  # Idle wait while other workers still hold leases
+    queue_max_attempts: int = 3  # Errored attempts before a job is marked failed
     
     # Output settings
     base_output_dir: str = "data"  # Base directory for all outputs
     tier1_filename: str = "tier1.json"
+    manifest_filename: str = "manifest.json"  # Describes the artifacts in each output dir
+    run_report_filename: str = "run_report.json"  # Per-run call latency, token and cost report
+    fingerprints_filename: str = "fingerprints.json"  # Prompt fingerprint of each checkpoint in a directory
     # Note: tier2 and tier3 files are now generated dynamically per category/practice
     
     # Safety settings
@@ -44,6 +93,10 @@ class DataGenerationConfig:
         """Get the Tier 1 filename for the current category"""
         return f"tier1_{self.category}.json"
     
+    def get_manifest_file(self) -> str:
+        """Get the manifest filename for the current category and platform"""
+        return self.manifest_filename
+    
     @staticmethod
     def is_valid_platform(platform: str) -> bool:
         """Check if platform is valid"""
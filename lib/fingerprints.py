@@ -0,0 +1,91 @@
+"""
+Prompt fingerprints for checkpoint invalidation
+
+A checkpoint's fingerprint hashes the tier's prompt template together with
+the model and inference parameters (of the tier's route) that produced it.
+Fingerprints are kept in a sidecar file (fingerprints.json) next to the
+checkpoints, keyed by checkpoint filename, so the checkpoint formats stay
+unchanged. When a template or model setting changes, only checkpoints of
+the affected tier stop matching and get regenerated.
+
+Templates are the tier prompts rendered with placeholder names, so any edit
+to the static prompt text changes the fingerprint while the item names do
+not. Checkpoints written before fingerprints existed adopt the current
+fingerprint the first time they are seen.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+TIERS = ("tier1", "tier2", "tier3")
+
+
+def tier_templates(prompts, platform: str) -> Dict[str, str]:
+    """Each tier's prompt rendered with placeholder item names"""
+    return {
+        "tier1": prompts.build_tier1_prompt(),
+        "tier2": prompts.build_tier2_prompt("{tier1_name}"),
+        "tier3": prompts.build_tier3_prompt("{tier1_name}", "{tier2_name}", platform),
+    }
+
+
+def fingerprint(template: str, model_id: str, temperature: float, top_p: float, max_tokens: int) -> str:
+    """Short stable hash of a prompt template and the inference settings it runs with"""
+    payload = json.dumps(
+        {
+            "template": template,
+            "model_id": model_id,
+            "temperature": temperature,
+            "top_p": top_p,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def tier_fingerprints(prompts, platform: str, config, routes: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """
+    Current fingerprint of every tier for a prompts module and DataGenerationConfig.
+
+    With routes (tier -> lib.routing.TierRoute), each tier is fingerprinted
+    with its own route's model and inference settings.
+    """
+    fingerprints = {}
+    for tier, template in tier_templates(prompts, platform).items():
+        settings = routes[tier] if routes else config
+        fingerprints[tier] = fingerprint(
+            template, settings.model_id, settings.temperature, settings.top_p, settings.max_tokens
+        )
+    return fingerprints
+
+
+class FingerprintStore:
+    """
+    Checkpoint filename -> fingerprint, persisted as one JSON file per directory.
+
+    Every update rewrites the file through a temporary file and a rename, so
+    an interrupted run never leaves it half-written.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fingerprints: Dict[str, str] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._fingerprints = json.load(f)
+
+    def get(self, checkpoint_name: str) -> Optional[str]:
+        return self._fingerprints.get(checkpoint_name)
+
+    def set(self, checkpoint_name: str, value: str):
+        if self._fingerprints.get(checkpoint_name) == value:
+            return
+        self._fingerprints[checkpoint_name] = value
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._fingerprints, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
@@ -7,26 +7,80 @@ import json
 import csv
 import os
 import hashlib
+import math
 import asyncio
 import logging
 import re
-from typing import Dict, Any, List, Optional, Set
+import time
+from collections import Counter
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 from lib.bedrock_client import BedrockClient, BedrockError
 from lib.config import config
 from lib.registry import prompt_registry
+from lib.telemetry import build_run_report
+from lib.metrics import metrics
+from lib.tracing import span
+from lib.profiling import profile_stage
+from lib.scheduler import DeadlineScheduler, breadth_first
+from lib.sharding import ShardingError, shard_dir_name, shard_of
+from lib.work_queue import LEASED, QUEUED, Job, WorkQueue
+from lib.fingerprints import TIERS, FingerprintStore, tier_fingerprints
+from lib.routing import min_cache_tokens, model_pricing, resolve_routes, stage_tier
+from lib.tokens import estimate_tokens
+from lib.hedging import HedgePolicy
 
 logger = logging.getLogger(__name__)
 
 
+def sanitize_filename(name: str) -> str:
+    """Sanitize a name to be used as a filename"""
+    # Replace spaces with underscores and remove special characters
+    sanitized = re.sub(r'[^\w\s-]', '', name)
+    sanitized = re.sub(r'[-\s]+', '_', sanitized)
+    return sanitized.strip('_').lower()
+
+
+def tier2_checkpoint_name(category: str, tier1_name: str) -> str:
+    """Filename of the Tier 2 checkpoint for one Tier 1 category"""
+    return f"tier2_{category}_{sanitize_filename(tier1_name)}.csv"
+
+
+def tier3_checkpoint_name(category: str, platform: str, tier2_name: str) -> str:
+    """Filename of the Tier 3 checkpoint for one Tier 2 item"""
+    return f"tier3_{category}_{platform}_{sanitize_filename(tier2_name)}.csv"
+
+
+def sink_key(checkpoint_name: str, seeds: List[Dict[str, Any]]) -> str:
+    """
+    Sink key of one submission: the checkpoint file plus a digest of the seeds sent.
+
+    Top-up rounds and regenerated checkpoints therefore get keys of their
+    own, and a reloaded checkpoint is skipped only if exactly its contents
+    were delivered in one submission.
+    """
+    digest = hashlib.md5("\n".join(seed["seed_text"] for seed in seeds).encode()).hexdigest()
+    return f"{checkpoint_name}#{digest[:16]}"
+
+
 class DataGenerator:
     """Main service for generating hierarchical data across multiple categories"""
     
-    def __init__(self, bedrock_client: BedrockClient, category: str = "health_wellbeing", platform: str = "youtube"):
+    def __init__(
+        self,
+        bedrock_client: BedrockClient,
+        category: str = "health_wellbeing",
+        platform: str = "youtube",
+        shard: Optional[Tuple[int, int]] = None
+    ):
         self.client = bedrock_client
         self.category = category
         self.platform = platform
+        # (index, count) when this process only handles one shard of the Tier 3 items
+        self.shard = shard
         self.config = config
         self.config.category = category  # Update config with the category
         self.config.platform = platform  # Update config with the platform
@@ -38,24 +92,99 @@ class DataGenerator:
         self.output_dir = Path(self.config.get_output_dir())
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Tier 3 outputs of a shard stay in a shard-local directory until merged
+        self.tier3_dir = self.output_dir
+        if shard is not None:
+            self.tier3_dir = self.output_dir / shard_dir_name(*shard)
+            self.tier3_dir.mkdir(parents=True, exist_ok=True)
+        
         # File paths
         self.tier1_file = self.output_dir / self.config.get_tier1_file()
         
         # Aggregated file paths
         self.tier2_aggregated_file = self.output_dir / f"all_tier2_{category}.csv"
-        self.tier3_aggregated_file = self.output_dir / f"all_tier3_{category}_{platform}.csv"
+        self.tier3_aggregated_file = self.tier3_dir / f"all_tier3_{category}_{platform}.csv"
+        self.manifest_file = self.output_dir / self.config.get_manifest_file()
+        self.run_report_file = self.tier3_dir / self.config.run_report_filename
+        self.seed_index_file = self.output_dir / f"seed_index_{category}_{platform}.csv"
+        
+        # Model and inference settings of each tier's calls
+        self.routes = resolve_routes(self.config, category)
+        
+        # Tiers whose instructions go to a cached system block (--prompt-cache)
+        self.cached_tiers = self._cacheable_tiers()
+        
+        # Fingerprints of the prompt and inference settings behind each checkpoint
+        self.fingerprints = tier_fingerprints(self.prompts, platform, self.config, self.routes)
+        self.fingerprint_store = FingerprintStore(self.output_dir / self.config.fingerprints_filename)
+        self.tier3_fingerprint_store = self.fingerprint_store
+        if shard is not None:
+            self.tier3_fingerprint_store = FingerprintStore(self.tier3_dir / self.config.fingerprints_filename)
+        # Checkpoints regenerated because their fingerprint no longer matched, per tier
+        self.invalidated = Counter({tier: 0 for tier in TIERS})
         
         # Deduplication tracking
         self.seed_hashes: Set[str] = set()
+        
+        # Tier 3 seeds kept after filtering in this run (excludes checkpoint loads)
+        self.new_seed_count = 0
+        
+        # Tier 3 seeds kept overall (including checkpoint loads), for --target-seeds
+        self.kept_seed_count = 0
+        self.top_up_calls = 0
+        
+        # With a deadline, calls are only started if they are expected to finish in time
+        self.scheduler: Optional[DeadlineScheduler] = None
+        if self.config.deadline is not None:
+            self.scheduler = DeadlineScheduler(
+                self.config.deadline,
+                self.client.telemetry,
+                default_latency_s=self.config.deadline_default_latency_s
+            )
+        self.deadline_skipped = 0
+        
+        # Optional duplicate requests for calls slower than the stage's observed tail latency
+        self.hedge_policy: Optional[HedgePolicy] = None
+        if self.config.hedge_requests:
+            self.hedge_policy = HedgePolicy(
+                self.client.telemetry,
+                latency_percentile=self.config.hedge_latency_percentile,
+                budget_ratio=self.config.hedge_budget_ratio,
+                min_samples=self.config.hedge_min_samples,
+                min_delay_s=self.config.hedge_min_delay_s
+            )
+        
+        # Results of earlier tiers, so later tiers don't reload every checkpoint
+        self._tier1_data: Optional[List[str]] = None
+        self._tier2_data: Optional[List[Dict[str, Any]]] = None
+        
+        # Tier 3 progress for the ETA metric
+        self._tier3_started_at: Optional[float] = None
+        self._tier3_generated = 0
+        
+        # Optional streaming sink (e.g. lib.pg_sink.PostgresSink)
+        self.sink = None
+    
+    def attach_sink(self, sink):
+        """
+        Attach a streaming sink that receives each Tier 3 checkpoint's seeds.
+        
+        The sink must provide async submit(key, seeds) and is_delivered(key);
+        keys come from sink_key().
+        """
+        self.sink = sink
     
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a name to be used as a filename"""
-        # Replace spaces with underscores and remove special characters
-        sanitized = re.sub(r'[^\w\s-]', '', name)
-        sanitized = re.sub(r'[-\s]+', '_', sanitized)
-        return sanitized.strip('_').lower()
+        return sanitize_filename(name)
     
-    async def _invoke_model_with_json_retry(self, prompt: str, max_retries: int = None) -> Dict[str, Any]:
+    async def _invoke_model_with_json_retry(
+        self,
+        prompt: str,
+        max_retries: int = None,
+        tags: Optional[Dict[str, Any]] = None,
+        system: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Invoke Bedrock model and parse JSON response with retry logic for JSON parsing errors.
         
@@ -66,6 +195,8 @@ class DataGenerator:
         Args:
             prompt: Input prompt
             max_retries: Maximum number of retries for JSON parsing errors (defaults to config.max_retries)
+            tags: Telemetry tags for the call (stage and item names); category is added
+            system: Static instructions to send as a cached system block (see _prompt_parts)
             
         Returns:
             Parsed JSON data from the response
@@ -75,35 +206,45 @@ class DataGenerator:
         """
         if max_retries is None:
             max_retries = self.config.max_retries
+        tags = {"category": self.category, "platform": self.platform, **(tags or {})}
+        stage = tags.get("stage", "unknown")
         
         last_error = None
         for attempt in range(max_retries):
+            attempt_tags = {**tags, "json_attempt": attempt + 1}
             try:
-                # Invoke Bedrock model (Bedrock client handles its own API-level retries)
-                response = await self.client.invoke_model(
-                    model_id=self.config.model_id,
-                    prompt=prompt,
-                    temperature=self.config.temperature,
-                    top_p=self.config.top_p,
-                    max_tokens=self.config.max_tokens,
-                    max_retries=self.config.max_retries  # Bedrock API retries
-                )
-                
-                # Parse JSON response
-                data = json.loads(response["content"])
+                if self.hedge_policy is not None:
+                    # A slow call gets a duplicate; the first valid JSON wins
+                    data = await self.hedge_policy.run(
+                        stage,
+                        lambda hedge: self._invoke_and_parse(
+                            prompt, system, {**attempt_tags, "hedge": True} if hedge else attempt_tags
+                        )
+                    )
+                else:
+                    data = await self._invoke_and_parse(prompt, system, attempt_tags)
                 return data
                 
             except json.JSONDecodeError as e:
                 last_error = e
-                logger.warning(f"JSON parsing failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                logger.warning("JSON parsing failed (attempt %d/%d): %s", attempt + 1, max_retries, e)
+                
+                wait_time = 5 ** attempt
+                if attempt < max_retries - 1 and self.scheduler is not None and \
+                        not self.scheduler.can_start(tags.get("stage", "unknown"), extra_s=wait_time):
+                    raise BedrockError(f"JSON parsing failed and no time is left before the deadline to retry: {e}") from e
+                if attempt < max_retries - 1 and self.client.retry_budget is not None and \
+                        not self.client.retry_budget.try_retry("json"):
+                    raise BedrockError(f"JSON parsing failed and the retry budget is exhausted: {e}") from e
                 
                 if attempt < max_retries - 1:
-                    # Wait before retry (fixed 5 second delay)
-                    wait_time = 5 ** attempt
-                    logger.info(f"Retrying API call and JSON parsing in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
+                    metrics.inc("seedgen_retries_total", stage=tags.get("stage", "unknown"), kind="json")
+                    # Wait before retry (exponential 5 ** attempt second delay)
+                    logger.info("Retrying API call and JSON parsing in %d seconds...", wait_time)
+                    with span("json_retry.backoff", stage=tags.get("stage"), attempt=attempt + 1, wait_s=wait_time):
+                        await asyncio.sleep(wait_time)
                 else:
-                    logger.error(f"All JSON parsing retry attempts failed: {str(e)}")
+                    logger.error("All JSON parsing retry attempts failed: %s", e)
                     raise BedrockError(f"JSON parsing failed after {max_retries} attempts: {str(e)}") from e
                     
             except BedrockError as e:
@@ -115,6 +256,25 @@ class DataGenerator:
         
         raise BedrockError(f"JSON parsing failed: {str(last_error)}") from last_error
     
+    async def _invoke_and_parse(self, prompt: str, system: Optional[str], tags: Dict[str, Any]) -> Dict[str, Any]:
+        """One model call with the stage's route, parsed as JSON (Bedrock client handles API-level retries)"""
+        route = self.routes[stage_tier(tags.get("stage", "tier3"))]
+        response = await self.client.invoke_model(
+            model_id=route.model_id,
+            prompt=prompt,
+            system=system,
+            temperature=route.temperature,
+            top_p=route.top_p,
+            max_tokens=route.max_tokens,
+            max_retries=self.config.max_retries,  # Bedrock API retries
+            tags=tags
+        )
+        try:
+            return json.loads(response["content"])
+        except json.JSONDecodeError:
+            response["call_record"].outcome = "parse_failure"
+            raise
+    
     async def generate_all_data(self) -> Dict[str, Any]:
         """Generate all three tiers of data with checkpointing"""
         logger.info("Starting data generation")
@@ -146,24 +306,331 @@ class DataGenerator:
             logger.error(f"Error in data generation: {e}")
             results["errors"].append(str(e))
         
+        for tier, count in self.invalidated.items():
+            if count:
+                logger.info(f"Prompt or model changes invalidated {count} {tier} checkpoints")
+        results["invalidated"] = dict(self.invalidated)
+        
+        self.write_run_report()
         return results
     
+    def write_run_report(self) -> Dict[str, Any]:
+        """Write per-stage latency, token and cost statistics of this run to run_report.json"""
+        report = build_run_report(
+            self.client.telemetry.records,
+            surviving_seeds=self.new_seed_count,
+            input_cost_per_1k=self.config.input_cost_per_1k_tokens,
+            output_cost_per_1k=self.config.output_cost_per_1k_tokens,
+            cache_read_cost_per_1k=self.config.cache_read_cost_per_1k_tokens,
+            cache_write_cost_per_1k=self.config.cache_write_cost_per_1k_tokens,
+            model_pricing={
+                route.model_id: model_pricing(self.config, route.model_id) for route in self.routes.values()
+            },
+            extra={
+                "category": self.category,
+                "platform": self.platform,
+                "model_id": self.config.model_id,
+                "tier_routes": {tier: asdict(route) for tier, route in self.routes.items()},
+                "prompt_caching": self.config.prompt_caching,
+                "prompt_cached_tiers": sorted(self.cached_tiers),
+                "hedging": self.hedge_policy.summary() if self.hedge_policy is not None else None,
+                "retry_budget": self.client.retry_budget.summary() if self.client.retry_budget is not None else None,
+                "circuit_breaker": (
+                    self.client.circuit_breaker.summary() if self.client.circuit_breaker is not None else None
+                ),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "target_seeds": self.config.target_seeds,
+                "kept_seeds": self.kept_seed_count,
+                "top_up_calls": self.top_up_calls,
+                "deadline": (
+                    datetime.fromtimestamp(self.config.deadline, timezone.utc).isoformat()
+                    if self.config.deadline is not None else None
+                ),
+                "deadline_skipped": self.deadline_skipped,
+                "shard": f"{self.shard[0]}/{self.shard[1]}" if self.shard is not None else None,
+                "prompt_fingerprints": self.fingerprints,
+                "invalidated_checkpoints": dict(self.invalidated),
+            }
+        )
+        with open(self.run_report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        
+        logger.info(
+            f"Run report saved: {self.run_report_file} "
+            f"({report['attempts']} calls, ~${report['estimated_cost_usd']:.4f})"
+        )
+        return report
+    
+    async def prepare_shards(self) -> Dict[str, Any]:
+        """Generate (or load) Tier 1 and Tier 2 once, so every shard works on the same items"""
+        tier2_data = await self.generate_tier2()
+        self.write_run_report()
+        return {"tier1_count": len(self._tier1_data or []), "tier2_count": len(tier2_data)}
+    
+    def merge_shards(self, shard_count: int) -> Dict[str, Any]:
+        """
+        Merge shard-local Tier 3 checkpoints into the canonical outputs.
+        
+        Items are merged in Tier 2 order and deduplicated across shards (each
+        shard only deduplicated its own seeds). Writes canonical per-item
+        checkpoints, the aggregated Tier 3 file with its manifest, and a seed
+        index (seed hash -> item and shard) for later dedup checks.
+        
+        Returns:
+            Item, seed and duplicate counts, and the Tier 2 items no shard has finished
+        """
+        if not self.tier2_aggregated_file.exists():
+            raise ShardingError(f"Missing {self.tier2_aggregated_file}; nothing was prepared for sharding")
+        tier2_data = self._load_tier2_from_file(self.tier2_aggregated_file)
+        
+        self.seed_hashes.clear()
+        merged: List[Dict[str, Any]] = []
+        index_rows: List[Dict[str, Any]] = []
+        missing: List[str] = []
+        shard_fingerprints: Dict[int, FingerprintStore] = {}
+        duplicates = 0
+        for item in tier2_data:
+            shard_index = shard_of(self.category, self.platform, item["tier1_name"], item["tier2_name"], shard_count)
+            tier3_filename = tier3_checkpoint_name(self.category, self.platform, item["tier2_name"])
+            shard_file = self.output_dir / shard_dir_name(shard_index, shard_count) / tier3_filename
+            if not shard_file.exists():
+                missing.append(item["tier2_name"])
+                continue
+            
+            kept = []
+            for seed in self._load_tier3_from_file(shard_file):
+                seed_hash = self._seed_hash(seed["seed_text"])
+                if seed_hash in self.seed_hashes:
+                    duplicates += 1
+                    continue
+                self.seed_hashes.add(seed_hash)
+                kept.append(seed)
+                index_rows.append({
+                    "seed_hash": seed_hash,
+                    "tier1_name": seed["tier1_name"],
+                    "tier2_name": seed["tier2_name"],
+                    "shard": shard_index
+                })
+            self._save_tier3_to_file(kept, self.output_dir / tier3_filename)
+            merged.extend(kept)
+            
+            # Carry over the fingerprint of the prompt the shard actually used
+            if shard_index not in shard_fingerprints:
+                shard_fingerprints[shard_index] = FingerprintStore(shard_file.parent / self.config.fingerprints_filename)
+            shard_fingerprint = shard_fingerprints[shard_index].get(tier3_filename)
+            if kept and shard_fingerprint is not None:
+                self.fingerprint_store.set(tier3_filename, shard_fingerprint)
+        
+        if len(missing) == len(tier2_data):
+            # Most likely a wrong shard count; keep the existing canonical outputs
+            raise ShardingError(f"No Tier 3 checkpoints found for {shard_count} shards under {self.output_dir}")
+        
+        self._create_aggregated_tier3_file(merged)
+        self._save_seed_index(index_rows)
+        
+        if missing:
+            logger.warning(f"{len(missing)} Tier 2 items have no Tier 3 checkpoint in any shard yet")
+        logger.info(
+            f"Merged {shard_count} shards: {len(merged)} seeds from {len(tier2_data) - len(missing)} items, "
+            f"{duplicates} cross-shard duplicates dropped"
+        )
+        return {
+            "items": len(tier2_data),
+            "merged_items": len(tier2_data) - len(missing),
+            "missing_items": missing,
+            "seeds": len(merged),
+            "duplicates_dropped": duplicates,
+        }
+    
+    def _in_shard(self, tier2_item: Dict[str, Any]) -> bool:
+        """Whether a Tier 2 item belongs to this process's shard"""
+        index, count = self.shard
+        return shard_of(self.category, self.platform, tier2_item["tier1_name"], tier2_item["tier2_name"], count) == index
+    
+    async def enqueue_jobs(self, queue: WorkQueue) -> Dict[str, Any]:
+        """
+        Generate (or load) Tier 1 and queue a Tier 2 job per Tier 1 category.
+        
+        Tier 3 jobs are queued by the workers as Tier 2 jobs complete. Failed
+        jobs of an earlier enqueue get a fresh set of attempts.
+        """
+        tier1_data = await self.generate_tier1()
+        added = await asyncio.to_thread(queue.enqueue, "tier2", [(name, "") for name in tier1_data])
+        requeued = await asyncio.to_thread(queue.requeue_failed)
+        self.write_run_report()
+        logger.info(f"Queued {added} Tier 2 jobs ({requeued} failed jobs re-queued)")
+        return {"tier1_count": len(tier1_data), "enqueued": added, "requeued": requeued}
+    
+    async def run_worker(self, queue: WorkQueue, worker_id: str) -> Dict[str, int]:
+        """
+        Lease and run queued jobs until no job is queued or leased.
+        
+        Runs up to config.max_concurrency jobs at a time. While a job runs, its
+        lease is extended every third of config.queue_visibility_timeout_s; if
+        the lease is lost anyway, the job is abandoned and its result discarded.
+        The worker's run report is written to workers/run_report_<worker_id>.json.
+        
+        Returns:
+            Jobs per outcome (completed, failed, requeued, lost)
+        """
+        self.run_report_file = self.output_dir / "workers" / f"run_report_{sanitize_filename(worker_id)}.json"
+        self.run_report_file.parent.mkdir(parents=True, exist_ok=True)
+        outcomes = Counter()
+        
+        async def run_slot():
+            while True:
+                job = await asyncio.to_thread(queue.lease, worker_id, self.config.queue_visibility_timeout_s)
+                if job is not None:
+                    outcomes[await self._run_job(queue, job)] += 1
+                    continue
+                counts = await asyncio.to_thread(queue.counts)
+                if not counts[QUEUED] and not counts[LEASED]:
+                    return
+                # Other workers' Tier 2 jobs may still queue Tier 3 jobs, or their leases may expire
+                await asyncio.sleep(self.config.queue_poll_interval_s)
+        
+        await self._gather_items(run_slot() for _ in range(self.config.max_concurrency))
+        self.write_run_report()
+        logger.info(f"Worker {worker_id} finished: {dict(outcomes)}")
+        return dict(outcomes)
+    
+    async def _run_job(self, queue: WorkQueue, job: Job) -> str:
+        """Run one leased job under heartbeats and record its outcome in the queue"""
+        name = job.tier2_name or job.tier1_name
+        logger.info("Leased %s job '%s' (attempt %d)", job.kind, name, job.attempts)
+        work = asyncio.ensure_future(self._execute_job(job))
+        keeper = asyncio.ensure_future(self._keep_lease(queue, job, work))
+        try:
+            result, follow_ups = await work
+        except asyncio.CancelledError:
+            if keeper.done() and not keeper.cancelled():
+                return "lost"
+            raise
+        except Exception as e:
+            status = await asyncio.to_thread(queue.fail, job, str(e), self.config.queue_max_attempts)
+            logger.error("Error running %s job '%s' (%s): %s", job.kind, name, status, e)
+            return "failed" if status != QUEUED else "requeued"
+        finally:
+            keeper.cancel()
+        
+        if not await asyncio.to_thread(queue.complete, job, result, follow_ups):
+            logger.warning("Lease on %s job '%s' expired before completion; result discarded", job.kind, name)
+            return "lost"
+        metrics.inc("seedgen_items_completed_total", tier=job.kind, source="generated")
+        logger.info("Completed %s job '%s' - %d items", job.kind, name, len(result))
+        return "completed"
+    
+    async def _execute_job(self, job: Job):
+        """Make a job's model call; returns its result and the (tier1, tier2) items of follow-up jobs"""
+        if job.kind == "tier2":
+            tier2_data = await self._generate_tier2_for_category(job.tier1_name)
+            names = [item["tier2_name"] for item in tier2_data]
+            return names, [(job.tier1_name, name) for name in names]
+        
+        tier3_data = await self._generate_tier3_for_item({"tier1_name": job.tier1_name, "tier2_name": job.tier2_name})
+        seeds = self._filter_tier3_seeds(tier3_data)
+        return [seed["seed_text"] for seed in seeds], []
+    
+    async def _keep_lease(self, queue: WorkQueue, job: Job, work: asyncio.Future):
+        """Extend a job's lease until cancelled; cancels the work once the lease is lost"""
+        timeout = self.config.queue_visibility_timeout_s
+        while True:
+            await asyncio.sleep(timeout / 3)
+            if not await asyncio.to_thread(queue.heartbeat, job, timeout):
+                logger.warning("Lost lease on %s job '%s'; abandoning it", job.kind, job.tier2_name or job.tier1_name)
+                work.cancel()
+                return
+    
+    def collect_jobs(self, queue: WorkQueue) -> Dict[str, Any]:
+        """
+        Write the results of completed queue jobs as canonical checkpoints and aggregates.
+        
+        Tier 3 seeds are deduplicated across jobs in Tier 2 order (each worker
+        only deduplicated its own seeds). Jobs that are still queued or leased
+        are reported and can be collected by running this again.
+        
+        Returns:
+            Job counts per status plus Tier 2, seed and duplicate counts
+        """
+        counts = queue.counts()
+        
+        tier2_data: List[Dict[str, Any]] = []
+        for tier1_name, _, tier2_names in queue.results("tier2"):
+            items = [{"tier1_name": tier1_name, "tier2_name": name} for name in tier2_names]
+            tier2_file_path = self.output_dir / tier2_checkpoint_name(self.category, tier1_name)
+            self._save_tier2_to_file(items, tier2_file_path)
+            self._record_fingerprint("tier2", tier2_file_path)
+            tier2_data.extend(items)
+        self._create_aggregated_tier2_file(tier2_data)
+        
+        seeds_by_item = {
+            (tier1_name, tier2_name): seeds
+            for tier1_name, tier2_name, seeds in queue.results("tier3")
+        }
+        self.seed_hashes.clear()
+        all_tier3_data: List[Dict[str, Any]] = []
+        duplicates = 0
+        for item in tier2_data:
+            seeds = seeds_by_item.get((item["tier1_name"], item["tier2_name"]))
+            if seeds is None:
+                continue
+            kept = []
+            for seed_text in seeds:
+                seed_hash = self._seed_hash(seed_text)
+                if seed_hash in self.seed_hashes:
+                    duplicates += 1
+                    continue
+                self.seed_hashes.add(seed_hash)
+                kept.append({**item, "seed_text": seed_text})
+            tier3_file_path = self.output_dir / tier3_checkpoint_name(self.category, self.platform, item["tier2_name"])
+            self._save_tier3_to_file(kept, tier3_file_path)
+            self._record_fingerprint("tier3", tier3_file_path)
+            all_tier3_data.extend(kept)
+        self._create_aggregated_tier3_file(all_tier3_data)
+        
+        if counts[QUEUED] or counts[LEASED]:
+            logger.warning(f"{counts[QUEUED] + counts[LEASED]} jobs are still queued or leased")
+        logger.info(
+            f"Collected {len(tier2_data)} Tier 2 items and {len(all_tier3_data)} seeds, "
+            f"{duplicates} cross-worker duplicates dropped"
+        )
+        return {
+            "jobs": dict(counts),
+            "tier2_count": len(tier2_data),
+            "tier3_items": len(seeds_by_item),
+            "seeds": len(all_tier3_data),
+            "duplicates_dropped": duplicates,
+        }
+    
     async def generate_tier1(self) -> List[str]:
         """Generate Tier 1 categories"""
-        if self.tier1_file.exists():
+        if self._tier1_data is None:
+            with span("generate.tier1", category=self.category, platform=self.platform), profile_stage("tier1"):
+                self._tier1_data = await self._generate_tier1()
+        return self._tier1_data
+    
+    async def _generate_tier1(self) -> List[str]:
+        """Load Tier 1 categories from checkpoint or generate them"""
+        metrics.set("seedgen_items_total", 1, tier="tier1")
+        if self._checkpoint_state("tier1", self.tier1_file) == "current":
             logger.info("Tier 1 file exists, loading from checkpoint")
+            metrics.inc("seedgen_items_completed_total", tier="tier1", source="checkpoint")
             return self._load_tier1_from_file()
+        if self.shard is not None:
+            raise ShardingError(f"Missing {self.tier1_file}; run --prepare-shards before starting shards")
         
         logger.info(f"Generating Tier 1 categories for {self.category}")
         prompt = self.prompts.build_tier1_prompt()
         
         try:
             # Invoke model and parse JSON with retry logic
-            data = await self._invoke_model_with_json_retry(prompt)
+            data = await self._invoke_model_with_json_retry(prompt, tags={"stage": "tier1"})
             tier1_categories = data.get("tier1_categories", [])
             
             # Save to file
             self._save_tier1_to_file(tier1_categories)
+            self._record_fingerprint("tier1", self.tier1_file)
+            metrics.inc("seedgen_items_completed_total", tier="tier1", source="generated")
             logger.info(f"Generated and saved {len(tier1_categories)} Tier 1 categories")
             
             return tier1_categories
@@ -172,50 +639,84 @@ class DataGenerator:
             logger.error(f"Error generating Tier 1: {e}")
             raise BedrockError(f"Tier 1 generation failed: {e}") from e
     
+    async def _gather_items(self, coroutines) -> List[Any]:
+        """Run per-item coroutines concurrently, cancelling the rest if one raises"""
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    
     async def generate_tier2(self) -> List[Dict[str, Any]]:
         """Generate Tier 2 items for each Tier 1 category"""
+        if self._tier2_data is None:
+            with span("generate.tier2", category=self.category, platform=self.platform), profile_stage("tier2"):
+                self._tier2_data = await self._generate_tier2()
+        return self._tier2_data
+    
+    async def _generate_tier2(self) -> List[Dict[str, Any]]:
+        """Load or generate Tier 2 items for every Tier 1 category"""
         # Load Tier 1 data
         tier1_data = await self.generate_tier1()
+        metrics.set("seedgen_items_total", len(tier1_data), tier="tier2")
+        
+        # Process Tier 1 categories concurrently (bounded by max_concurrency), keeping their order
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        results = await self._gather_items(
+            self._process_tier2_category(tier1_name, semaphore) for tier1_name in tier1_data
+        )
+        all_tier2_data = [item for tier2_data in results for item in tier2_data]
         
-        all_tier2_data = []
+        # Create aggregated Tier 2 file (shards only read the prepared one)
+        if self.shard is None:
+            self._create_aggregated_tier2_file(all_tier2_data)
         
-        # Process each Tier 1 category
-        for tier1_name in tier1_data:
-            tier2_filename = f"tier2_{self.category}_{self._sanitize_filename(tier1_name)}.csv"
+        return all_tier2_data
+    
+    async def _process_tier2_category(self, tier1_name: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Load or generate the Tier 2 items of one Tier 1 category"""
+        with span("tier2.item", category=self.category, tier="tier2", tier1_name=tier1_name):
+            tier2_filename = tier2_checkpoint_name(self.category, tier1_name)
             tier2_file_path = self.output_dir / tier2_filename
             
-            # Check if this Tier 2 file already exists
-            if tier2_file_path.exists():
-                logger.info(f"Tier 2 file exists for '{tier1_name}', loading from checkpoint")
-                tier2_data = self._load_tier2_from_file(tier2_file_path)
-                all_tier2_data.extend(tier2_data)
-                continue
+            # Check if this Tier 2 file already exists and was made by the current prompt
+            if self._checkpoint_state("tier2", tier2_file_path) == "current":
+                logger.info("Tier 2 file exists for '%s', loading from checkpoint", tier1_name)
+                metrics.inc("seedgen_items_completed_total", tier="tier2", source="checkpoint")
+                return self._load_tier2_from_file(tier2_file_path)
+            if self.shard is not None:
+                # Shards must agree on the Tier 2 items, so they never generate them
+                raise ShardingError(f"Missing {tier2_file_path}; run --prepare-shards before starting shards")
             
             try:
                 # Generate Tier 2 data for this category
-                tier2_data = await self._generate_tier2_for_category(tier1_name)
-                
+                async with semaphore:
+                    if self._out_of_time("tier2", tier1_name):
+                        return []
+                    tier2_data = await self._generate_tier2_for_category(tier1_name)
+            
                 # Save to separate file
                 self._save_tier2_to_file(tier2_data, tier2_file_path)
-                all_tier2_data.extend(tier2_data)
-                
-                logger.info(f"Generated Tier 2 for '{tier1_name}' - {len(tier2_data)} items")
-                
+                self._record_fingerprint("tier2", tier2_file_path)
+                metrics.inc("seedgen_items_completed_total", tier="tier2", source="generated")
+            
+                logger.info("Generated Tier 2 for '%s' - %d items", tier1_name, len(tier2_data))
+                return tier2_data
+            
             except Exception as e:
-                logger.error(f"Error generating Tier 2 for '{tier1_name}': {e}")
-                continue
-        
-        # Create aggregated Tier 2 file
-        self._create_aggregated_tier2_file(all_tier2_data)
-        
-        return all_tier2_data
+                logger.error("Error generating Tier 2 for '%s': %s", tier1_name, e)
+                return []
     
     async def _generate_tier2_for_category(self, tier1_name: str) -> List[Dict[str, Any]]:
         """Generate Tier 2 items for a specific Tier 1 category"""
-        prompt = self.prompts.build_tier2_prompt(tier1_name)
+        system, prompt = self._prompt_parts("tier2", tier1_name=tier1_name)
         
         # Invoke model and parse JSON with retry logic
-        data = await self._invoke_model_with_json_retry(prompt)
+        data = await self._invoke_model_with_json_retry(
+            prompt, tags={"stage": "tier2", "tier1_name": tier1_name}, system=system
+        )
         tier2_items = data.get("tier2_items", [])
         
         # Add Tier 1 context to each Tier 2 item
@@ -232,56 +733,121 @@ class DataGenerator:
         """Generate Tier 3 seeds for each Tier 2 item"""
         # Load Tier 2 data
         tier2_data = await self.generate_tier2()
+        if self.shard is not None:
+            tier2_data = [item for item in tier2_data if self._in_shard(item)]
+            logger.info("Shard %d/%d owns %d Tier 2 items", *self.shard, len(tier2_data))
         
-        all_tier3_data = []
+        with span("generate.tier3", category=self.category, platform=self.platform, items=len(tier2_data)), \
+                profile_stage("tier3"):
+            return await self._generate_tier3(tier2_data)
+    
+    async def _generate_tier3(self, tier2_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Load or generate Tier 3 seeds for every Tier 2 item"""
+        metrics.set("seedgen_items_total", len(tier2_data), tier="tier3")
+        self._tier3_started_at = time.monotonic()
         
-        # Process each Tier 2 item
-        for tier2_item in tier2_data:
-            tier1_name = tier2_item["tier1_name"]
-            tier2_name = tier2_item["tier2_name"]
-            
-            tier3_filename = f"tier3_{self.category}_{self.platform}_{self._sanitize_filename(tier2_name)}.csv"
-            tier3_file_path = self.output_dir / tier3_filename
+        # Process Tier 2 items concurrently (bounded by max_concurrency); the semaphore admits
+        # them in start order, which is breadth-first across Tier 1 branches under a deadline
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        order = self._tier3_start_order(tier2_data)
+        started = await self._gather_items(
+            self._process_tier3_item(tier2_data[index], semaphore) for index in order
+        )
+        # Results stay in Tier 2 order regardless of start order
+        results: List[List[Dict[str, Any]]] = [[] for _ in tier2_data]
+        for index, tier3_data in zip(order, started):
+            results[index] = tier3_data
+        
+        if self.config.target_seeds and tier2_data:
+            await self._top_up_tier3(tier2_data, results, semaphore)
+        
+        all_tier3_data = [seed for tier3_data in results for seed in tier3_data]
+        
+        # Create aggregated Tier 3 file
+        self._create_aggregated_tier3_file(all_tier3_data)
+        
+        return all_tier3_data
+    
+    async def _process_tier3_item(self, tier2_item: Dict[str, Any], semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Load or generate the Tier 3 seeds of one Tier 2 item"""
+        tier2_name = tier2_item["tier2_name"]
+        with span("tier3.item", category=self.category, tier="tier3",
+                  tier1_name=tier2_item["tier1_name"], tier2_name=tier2_name):
+            tier3_filename = tier3_checkpoint_name(self.category, self.platform, tier2_name)
+            tier3_file_path = self.tier3_dir / tier3_filename
             
-            # Check if this Tier 3 file already exists
-            if tier3_file_path.exists():
-                logger.info(f"Tier 3 file exists for '{tier2_name}', loading from checkpoint")
+            # Check if this Tier 3 file already exists and was made by the current prompt
+            if self._checkpoint_state("tier3", tier3_file_path) == "current":
+                logger.info("Tier 3 file exists for '%s', loading from checkpoint", tier2_name)
                 tier3_data = self._load_tier3_from_file(tier3_file_path)
-                all_tier3_data.extend(tier3_data)
-                continue
+                metrics.inc("seedgen_items_completed_total", tier="tier3", source="checkpoint")
+                self.kept_seed_count += len(tier3_data)
+                if self.config.target_seeds:
+                    # Count checkpointed seeds as taken so top-ups cannot repeat them
+                    self.seed_hashes.update(self._seed_hash(seed["seed_text"]) for seed in tier3_data)
+            
+                # Re-send checkpoints that were saved but never reached the sink
+                if self.sink is not None:
+                    key = sink_key(tier3_filename, tier3_data)
+                    if not self.sink.is_delivered(key):
+                        await self.sink.submit(key, tier3_data)
+                return tier3_data
             
             try:
                 # Generate Tier 3 data for this item
-                tier3_data = await self._generate_tier3_for_item(tier2_item)
-                
+                async with semaphore:
+                    if self._target_met():
+                        logger.info("Seed target reached, skipping Tier 3 for '%s'", tier2_name)
+                        return []
+                    if self._out_of_time("tier3", tier2_name):
+                        return []
+                    tier3_data = await self._generate_tier3_for_item(tier2_item)
+            
                 # Apply deduplication and safety filters
                 filtered_seeds = self._filter_tier3_seeds(tier3_data)
-                
+                self.new_seed_count += len(filtered_seeds)
+                self.kept_seed_count += len(filtered_seeds)
+            
                 # Save to separate file
                 self._save_tier3_to_file(filtered_seeds, tier3_file_path)
-                all_tier3_data.extend(filtered_seeds)
-                
-                logger.info(f"Generated Tier 3 for '{tier2_name}' - {len(filtered_seeds)} seeds")
-                
+                self._record_fingerprint("tier3", tier3_file_path)
+                metrics.inc("seedgen_items_completed_total", tier="tier3", source="generated")
+                self._update_eta()
+            
+                logger.info("Generated Tier 3 for '%s' - %d seeds", tier2_name, len(filtered_seeds))
+            
             except Exception as e:
-                logger.error(f"Error generating Tier 3 for '{tier2_name}': {e}")
-                continue
-        
-        # Create aggregated Tier 3 file
-        self._create_aggregated_tier3_file(all_tier3_data)
-        
-        return all_tier3_data
+                logger.error("Error generating Tier 3 for '%s': %s", tier2_name, e)
+                return []
+            
+            # Outside the try so a failing sink stops the run instead of every item
+            if self.sink is not None:
+                await self.sink.submit(sink_key(tier3_filename, filtered_seeds), filtered_seeds)
+            
+            return filtered_seeds
     
-    async def _generate_tier3_for_item(self, tier2_item: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate Tier 3 seeds for a specific Tier 2 item"""
-        prompt = self.prompts.build_tier3_prompt(
-            tier2_item["tier1_name"],
-            tier2_item["tier2_name"],
-            self.platform
+    async def _generate_tier3_for_item(
+        self,
+        tier2_item: Dict[str, Any],
+        exclude: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate Tier 3 seeds for a specific Tier 2 item, optionally avoiding seeds already kept"""
+        system, prompt = self._prompt_parts(
+            "tier3", tier1_name=tier2_item["tier1_name"], tier2_name=tier2_item["tier2_name"]
         )
+        if exclude:
+            prompt += self._exclusion_block(exclude)
         
         # Invoke model and parse JSON with retry logic
-        data = await self._invoke_model_with_json_retry(prompt)
+        data = await self._invoke_model_with_json_retry(
+            prompt,
+            tags={
+                "stage": "tier3_topup" if exclude else "tier3",
+                "tier1_name": tier2_item["tier1_name"],
+                "tier2_name": tier2_item["tier2_name"]
+            },
+            system=system
+        )
         seeds = data.get("search_seeds", [])
         
         # Add Tier 1 and Tier 2 context to each seed
@@ -295,30 +861,257 @@ class DataGenerator:
         
         return result
     
+    def _prompt_parts(self, tier: str, **items: str) -> Tuple[Optional[str], str]:
+        """
+        (system, prompt) of a Tier 2/Tier 3 call.
+        
+        With prompt caching the tier's instructions, identical for every item,
+        go to the cached system block and the prompt only carries the item
+        names. Otherwise (for prompts modules without a compiled spec, or
+        instructions too short to cache, see _cacheable_tiers) the whole
+        rendered prompt is sent as before.
+        """
+        if tier in self.cached_tiers:
+            template = self.prompts.PROMPTS.template(tier, self.platform)
+            return template.instructions, template.item_message(**items)
+        if tier == "tier2":
+            return None, self.prompts.build_tier2_prompt(items["tier1_name"])
+        return None, self.prompts.build_tier3_prompt(items["tier1_name"], items["tier2_name"], self.platform)
+    
+    def _cacheable_tiers(self) -> Set[str]:
+        """
+        Tier 2/Tier 3 tiers to send with cached instructions.
+        
+        Bedrock caches nothing behind a cache point with fewer tokens than the
+        model's minimum, so a tier whose estimated instructions fall short of
+        its routed model's minimum keeps the whole rendered prompt.
+        """
+        compiled = getattr(self.prompts, "PROMPTS", None)
+        if not self.config.prompt_caching or compiled is None:
+            return set()
+        
+        tiers = set()
+        for tier in ("tier2", "tier3"):
+            model_id = self.routes[tier].model_id
+            tokens = estimate_tokens(compiled.template(tier, self.platform).instructions)
+            minimum = min_cache_tokens(model_id)
+            if tokens < minimum:
+                logger.warning(
+                    "%s instructions are ~%d tokens, below the %d-token cache minimum of %s; sending them uncached",
+                    tier, tokens, minimum, model_id
+                )
+            else:
+                tiers.add(tier)
+        return tiers
+    
+    def _tier3_start_order(self, tier2_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Indexes of Tier 2 items in the order their Tier 3 calls should start.
+        
+        Without a deadline this is the Tier 2 order. With one, checkpointed
+        items come first (they cost no calls) and pending items follow
+        round-robin across Tier 1 branches, least-covered branches first.
+        """
+        indexes = list(range(len(tier2_data)))
+        if self.scheduler is None:
+            return indexes
+        
+        done = {
+            index for index in indexes
+            if self._checkpoint_state("tier3", self.tier3_dir / tier3_checkpoint_name(
+                self.category, self.platform, tier2_data[index]["tier2_name"]
+            ), count=False) == "current"
+        }
+        covered = Counter(tier2_data[index]["tier1_name"] for index in done)
+        pending = breadth_first(
+            [index for index in indexes if index not in done],
+            branch=lambda index: tier2_data[index]["tier1_name"],
+            covered=covered
+        )
+        return sorted(done) + pending
+    
+    def _checkpoint_state(self, tier: str, file_path: Path, count: bool = True) -> str:
+        """
+        Whether a checkpoint is "missing", "current" or "stale" (made by a different prompt or model setting).
+        
+        Checkpoints without a recorded fingerprint predate fingerprinting and
+        adopt the current one. Shards use the prepared Tier 1/Tier 2 as they are.
+        """
+        if not file_path.exists():
+            return "missing"
+        if self.shard is not None and tier != "tier3":
+            return "current"
+        
+        store = self._fingerprint_store_for(tier)
+        recorded = store.get(file_path.name)
+        if recorded is None:
+            store.set(file_path.name, self.fingerprints[tier])
+            return "current"
+        if recorded == self.fingerprints[tier]:
+            return "current"
+        
+        if count:
+            self.invalidated[tier] += 1
+            metrics.inc("seedgen_checkpoints_invalidated_total", tier=tier)
+            logger.info("Prompt fingerprint changed for %s checkpoint %s; regenerating", tier, file_path.name)
+        return "stale"
+    
+    def _record_fingerprint(self, tier: str, file_path: Path):
+        """Record that a checkpoint was produced by the current prompt and settings"""
+        if file_path.exists():
+            self._fingerprint_store_for(tier).set(file_path.name, self.fingerprints[tier])
+    
+    def _fingerprint_store_for(self, tier: str) -> FingerprintStore:
+        return self.tier3_fingerprint_store if tier == "tier3" else self.fingerprint_store
+    
+    def _out_of_time(self, stage: str, item_name: str) -> bool:
+        """Whether the deadline leaves too little time to start a call; counts and logs skips"""
+        if self.scheduler is None or self.scheduler.can_start(stage):
+            return False
+        self.deadline_skipped += 1
+        logger.info(
+            "Deadline: %.0fs left, below expected %s latency %.1fs; skipping '%s'",
+            self.scheduler.remaining(), stage, self.scheduler.expected_latency(stage), item_name
+        )
+        return True
+    
+    def _target_met(self) -> bool:
+        """Whether --target-seeds is set and already reached"""
+        return bool(self.config.target_seeds) and self.kept_seed_count >= self.config.target_seeds
+    
+    def _exclusion_block(self, seeds: List[str]) -> str:
+        """Prompt suffix listing seeds the model must not repeat"""
+        recent = seeds[-self.config.max_exclusion_seeds:]
+        lines = "\n".join(f"- {seed}" for seed in recent)
+        return (
+            "\n\nALREADY COLLECTED - do not repeat these or close variants of them; "
+            f"generate only new, different search seeds:\n{lines}"
+        )
+    
+    async def _top_up_tier3(
+        self,
+        tier2_data: List[Dict[str, Any]],
+        results: List[List[Dict[str, Any]]],
+        semaphore: asyncio.Semaphore
+    ):
+        """
+        Issue extra calls for Tier 2 items below their share of --target-seeds.
+        
+        Each item's share is target / number of Tier 2 items. Rounds repeat
+        (up to config.max_top_up_rounds) while the target is unmet and the
+        previous round still produced new seeds; results are extended in place.
+        """
+        quota = math.ceil(self.config.target_seeds / len(tier2_data))
+        for round_number in range(1, self.config.max_top_up_rounds + 1):
+            if self._target_met():
+                break
+            deficient = [index for index, seeds in enumerate(results) if len(seeds) < quota]
+            if not deficient:
+                break
+            
+            logger.info(
+                "Seed target %d not met (%d kept); top-up round %d for %d Tier 2 items",
+                self.config.target_seeds, self.kept_seed_count, round_number, len(deficient)
+            )
+            gained = await self._gather_items(
+                self._top_up_tier3_item(tier2_data[index], results[index], semaphore) for index in deficient
+            )
+            if not any(gained):
+                logger.warning("Top-up round produced no new seeds, stopping")
+                break
+        
+        if not self._target_met():
+            logger.warning(
+                "Seed target %d not reached: %d seeds kept", self.config.target_seeds, self.kept_seed_count
+            )
+    
+    async def _top_up_tier3_item(
+        self,
+        tier2_item: Dict[str, Any],
+        kept: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> int:
+        """Generate more seeds for one Tier 2 item, appending survivors to kept and its checkpoint"""
+        tier2_name = tier2_item["tier2_name"]
+        tier3_filename = tier3_checkpoint_name(self.category, self.platform, tier2_name)
+        
+        try:
+            async with semaphore:
+                if self._target_met() or self._out_of_time("tier3_topup", tier2_name):
+                    return 0
+                self.top_up_calls += 1
+                tier3_data = await self._generate_tier3_for_item(
+                    tier2_item, exclude=[seed["seed_text"] for seed in kept]
+                )
+            
+            new_seeds = self._filter_tier3_seeds(tier3_data)
+            self.new_seed_count += len(new_seeds)
+            self.kept_seed_count += len(new_seeds)
+            kept.extend(new_seeds)
+            if new_seeds:
+                self._save_tier3_to_file(kept, self.tier3_dir / tier3_filename)
+                self._record_fingerprint("tier3", self.tier3_dir / tier3_filename)
+            logger.info("Topped up Tier 3 for '%s' - %d new seeds", tier2_name, len(new_seeds))
+        
+        except Exception as e:
+            logger.error("Error topping up Tier 3 for '%s': %s", tier2_name, e)
+            return 0
+        
+        if self.sink is not None and new_seeds:
+            await self.sink.submit(sink_key(tier3_filename, new_seeds), new_seeds)
+        return len(new_seeds)
+    
+    def _update_eta(self):
+        """Extrapolate the Tier 3 completion time from the generation rate so far"""
+        self._tier3_generated += 1
+        elapsed = time.monotonic() - self._tier3_started_at
+        remaining = (
+            metrics.get("seedgen_items_total", tier="tier3")
+            - metrics.get("seedgen_items_completed_total", tier="tier3", source="generated")
+            - metrics.get("seedgen_items_completed_total", tier="tier3", source="checkpoint")
+        )
+        metrics.set("seedgen_eta_seconds", max(0.0, remaining * elapsed / self._tier3_generated))
+    
     def _filter_tier3_seeds(self, seeds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply deduplication and safety filters to Tier 3 seeds"""
-        filtered_seeds = []
-        
-        for seed in seeds:
-            seed_text = seed.get("seed_text", "").strip()
+        with profile_stage("filter"):
+            filtered_seeds = []
+            dropped = {"length": 0, "duplicate": 0, "unsafe": 0}
             
-            # Length validation
-            if len(seed_text) < self.config.min_seed_length or len(seed_text) > self.config.max_seed_length:
-                continue
+            for seed in seeds:
+                seed_text = seed.get("seed_text", "").strip()
             
-            # Deduplication check
-            seed_hash = hashlib.md5(seed_text.lower().encode()).hexdigest()
-            if seed_hash in self.seed_hashes:
-                continue
+                # Length validation
+                if len(seed_text) < self.config.min_seed_length or len(seed_text) > self.config.max_seed_length:
+                    dropped["length"] += 1
+                    continue
             
-            # Safety filter (basic check for medical advice)
-            if self._contains_unsafe_content(seed_text):
-                continue
+                # Deduplication check
+                seed_hash = self._seed_hash(seed_text)
+                if seed_hash in self.seed_hashes:
+                    dropped["duplicate"] += 1
+                    continue
             
-            self.seed_hashes.add(seed_hash)
-            filtered_seeds.append(seed)
-        
-        return filtered_seeds
+                # Safety filter (basic check for medical advice)
+                if self._contains_unsafe_content(seed_text):
+                    dropped["unsafe"] += 1
+                    continue
+            
+                self.seed_hashes.add(seed_hash)
+                filtered_seeds.append(seed)
+            
+            # Update metrics once per batch rather than per seed
+            metrics.inc("seedgen_seeds_kept_total", len(filtered_seeds))
+            for reason, count in dropped.items():
+                if count:
+                    metrics.inc("seedgen_seeds_filtered_total", count, reason=reason)
+            
+            return filtered_seeds
+    
+    @staticmethod
+    def _seed_hash(seed_text: str) -> str:
+        """Deduplication key of a seed"""
+        return hashlib.md5(seed_text.strip().lower().encode()).hexdigest()
     
     def _contains_unsafe_content(self, text: str) -> bool:
         """Check if text contains potentially unsafe medical content"""
@@ -333,12 +1126,14 @@ class DataGenerator:
     
     def _save_tier1_to_file(self, data: List[str]):
         """Save Tier 1 data to JSON file"""
-        with open(self.tier1_file, 'w', encoding='utf-8') as f:
+        with span("checkpoint.write", tier="tier1", path=self.tier1_file.name), \
+                open(self.tier1_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _load_tier1_from_file(self) -> List[str]:
         """Load Tier 1 data from JSON file"""
-        with open(self.tier1_file, 'r', encoding='utf-8') as f:
+        with span("checkpoint.read", tier="tier1", path=self.tier1_file.name), \
+                open(self.tier1_file, 'r', encoding='utf-8') as f:
             return json.load(f)
     
     def _save_tier2_to_file(self, data: List[Dict[str, Any]], file_path: Path):
@@ -347,7 +1142,8 @@ class DataGenerator:
             return
         
         fieldnames = ["tier1_name", "tier2_name"]
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        with span("checkpoint.write", tier="tier2", path=file_path.name), \
+                open(file_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             for item in data:
@@ -362,7 +1158,8 @@ class DataGenerator:
             return []
         
         data = []
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with span("checkpoint.read", tier="tier2", path=file_path.name), \
+                open(file_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 data.append({
@@ -377,7 +1174,8 @@ class DataGenerator:
             return
         
         fieldnames = ["tier1_name", "tier2_name", "seed_text"]
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        with span("checkpoint.write", tier="tier3", path=file_path.name), \
+                open(file_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             for item in data:
@@ -393,7 +1191,8 @@ class DataGenerator:
             return []
         
         data = []
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with span("checkpoint.read", tier="tier3", path=file_path.name), \
+                open(file_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
                 data.append({
@@ -411,7 +1210,8 @@ class DataGenerator:
         logger.info(f"Creating aggregated Tier 2 file with {len(all_tier2_data)} items")
         
         fieldnames = ["tier1_name", "tier2_name"]
-        with open(self.tier2_aggregated_file, 'w', newline='', encoding='utf-8') as f:
+        with span("aggregate.write", tier="tier2", rows=len(all_tier2_data)), profile_stage("aggregation"), \
+                open(self.tier2_aggregated_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             for item in all_tier2_data:
@@ -430,7 +1230,8 @@ class DataGenerator:
         logger.info(f"Creating aggregated Tier 3 file with {len(all_tier3_data)} seeds")
         
         fieldnames = ["tier1_name", "tier2_name", "seed_text"]
-        with open(self.tier3_aggregated_file, 'w', newline='', encoding='utf-8') as f:
+        with span("aggregate.write", tier="tier3", rows=len(all_tier3_data)), profile_stage("aggregation"), \
+                open(self.tier3_aggregated_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             for item in all_tier3_data:
@@ -441,4 +1242,37 @@ class DataGenerator:
                 })
         
         logger.info(f"Aggregated Tier 3 file saved: {self.tier3_aggregated_file}")
+        
+        # Shard aggregates are not canonical outputs, so they get no manifest
+        if self.shard is None:
+            self._save_manifest(len(all_tier3_data))
+    
+    def _save_seed_index(self, rows: List[Dict[str, Any]]):
+        """Save the seed hash index written when shards are merged"""
+        fieldnames = ["seed_hash", "tier1_name", "tier2_name", "shard"]
+        with open(self.seed_index_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        
+        logger.info(f"Seed index saved: {self.seed_index_file}")
+    
+    def _save_manifest(self, tier3_count: int):
+        """
+        Save the manifest describing the aggregated outputs of this directory.
+        
+        Downstream consumers (e.g. scripts/upsert_to_pg.py) read category and
+        platform from here instead of parsing them back out of filenames.
+        """
+        manifest = {
+            "category": self.category,
+            "platform": self.platform,
+            "tier1_file": self.tier1_file.name,
+            "tier2_aggregated_file": self.tier2_aggregated_file.name,
+            "tier3_aggregated_file": self.tier3_aggregated_file.name,
+            "tier3_count": tier3_count,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
 
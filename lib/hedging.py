@@ -0,0 +1,113 @@
+"""
+Hedged model calls against tail latency
+
+A call that is still running after the stage's observed latency percentile
+(p95 by default) gets a duplicate. Whichever copy first returns a valid
+result wins and the other is cancelled; if one copy fails, the other still
+gets its chance. Hedges are capped at a share of the calls made (5% by
+default), so a slow or throttling service is not hit with twice the load.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from lib.metrics import metrics
+from lib.telemetry import CallTelemetry, percentile
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    When to hedge a call, with a global hedge budget.
+
+    Args:
+        telemetry: Call telemetry of the client, used for observed latencies
+        latency_percentile: Percentile of the stage's observed latencies after which a call is hedged
+        budget_ratio: Maximum hedges as a share of the calls made
+        min_samples: Observed calls of a stage needed before its calls are hedged
+        min_delay_s: Floor of the hedge delay, so fast stages are not hedged on noise
+    """
+
+    def __init__(
+        self,
+        telemetry: CallTelemetry,
+        latency_percentile: float = 95.0,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay_s: float = 1.0,
+    ):
+        self.telemetry = telemetry
+        self.latency_percentile = latency_percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.min_delay_s = min_delay_s
+        self.calls = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def delay(self, stage: str) -> Optional[float]:
+        """Seconds after which a call of the stage is hedged, or None until enough calls were observed"""
+        latencies = self.telemetry.latencies(stage)
+        if len(latencies) < self.min_samples:
+            return None
+        return max(self.min_delay_s, percentile(latencies, self.latency_percentile))
+
+    def acquire(self) -> bool:
+        """Take one hedge from the budget; False when hedging now would exceed budget_ratio"""
+        if self.hedges + 1 > self.budget_ratio * self.calls:
+            return False
+        self.hedges += 1
+        return True
+
+    async def run(self, stage: str, call: Callable[[bool], Awaitable[T]]) -> T:
+        """
+        Run call(hedge=False), hedging it with call(hedge=True) if it is slow.
+
+        Returns the first result; if a copy raises, waits for the other and
+        raises the first error only when both fail.
+        """
+        self.calls += 1
+        delay = self.delay(stage)
+        primary = asyncio.ensure_future(call(False))
+        tasks: Dict[asyncio.Future, bool] = {primary: False}
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self.acquire():
+                return await primary
+
+            logger.info("Hedging %s call still running after %.1fs (%d/%d hedges)", stage, delay, self.hedges, self.calls)
+            metrics.inc("seedgen_hedges_total", stage=stage, result="issued")
+            tasks[asyncio.ensure_future(call(True))] = True
+            pending = set(tasks)
+            first_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if tasks[task]:
+                            self.wins += 1
+                            metrics.inc("seedgen_hedges_total", stage=stage, result="won")
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def summary(self) -> Dict[str, float]:
+        """Hedging counts for the run report"""
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.wins,
+            "hedge_ratio": round(self.hedges / self.calls, 4) if self.calls else 0.0,
+            "budget_ratio": self.budget_ratio,
+            "latency_percentile": self.latency_percentile,
+        }
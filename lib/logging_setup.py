@@ -0,0 +1,134 @@
+"""
+Queue-based logging for the command-line scripts
+
+Log calls on the event loop only put the record on an in-memory queue; a
+QueueListener thread does the console and file I/O, so slow disks or
+terminals never stall in-flight model calls. Records can be rendered as
+plain text or as one JSON object per line.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed via extra={...}
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Render records as single-line JSON objects.
+
+    Fields passed with extra={...} and the formatter's static fields (e.g.
+    category and platform) are included as top-level keys.
+    """
+
+    def __init__(self, static_fields: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        self.static_fields = dict(static_fields or {})
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **self.static_fields,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener's handlers.
+
+    The stock prepare() formats the record with the default formatter and
+    folds the traceback into the message, so JsonFormatter could not report
+    it as a separate field. Here only the message is resolved (its arguments
+    may change after the call) and the traceback is rendered to exc_text, so
+    no frames are kept alive on the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(
+    log_file: Optional[Path] = None,
+    level: int = logging.INFO,
+    json_format: bool = False,
+    static_fields: Optional[Dict[str, Any]] = None,
+) -> QueueListener:
+    """
+    Route all logging through a queue to console (and optionally file) handlers.
+
+    Replaces any handlers already on the root logger, so it can be called
+    again once the log file name is known.
+
+    Args:
+        log_file: File to log to in addition to stdout
+        level: Root log level
+        json_format: Emit JSON lines instead of plain text
+        static_fields: Fields added to every JSON record
+    """
+    global _listener
+    stop_logging()
+
+    formatter = JsonFormatter(static_fields) if json_format else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file is not None:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(_RecordQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging():
+    """Drain the queue and stop the listener thread (registered with atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,122 @@
+"""
+In-process metrics with a Prometheus/OpenMetrics text endpoint
+
+Counters and gauges are always collected (they are cheap); the HTTP
+endpoint is only started on request, e.g. by
+``scripts/generate_seeds.py --metrics-port 9108``.
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# name -> (type, help)
+METRIC_DEFINITIONS: Dict[str, Tuple[str, str]] = {
+    "seedgen_inflight_calls": ("gauge", "Model calls currently in flight"),
+    "seedgen_model_calls_total": ("counter", "Model call attempts by stage and outcome"),
+    "seedgen_throttles_total": ("counter", "Model call attempts rejected by rate limiting"),
+    "seedgen_retries_total": ("counter", "Model call retries by stage and kind (api or json)"),
+    "seedgen_retries_rejected_total": ("counter", "Retries not made because the retry budget was exhausted, by kind"),
+    "seedgen_circuit_state": ("gauge", "Circuit breaker state: 0 closed, 1 half-open, 2 open"),
+    "seedgen_circuit_opened_total": ("counter", "Times the circuit breaker opened"),
+    "seedgen_hedges_total": ("counter", "Hedged model calls by stage and result (issued, or won by the hedge)"),
+    "seedgen_items_total": ("gauge", "Known work items per tier"),
+    "seedgen_items_completed_total": ("counter", "Completed work items per tier and source (generated or checkpoint)"),
+    "seedgen_seeds_kept_total": ("counter", "Tier 3 seeds kept after filtering"),
+    "seedgen_seeds_filtered_total": ("counter", "Tier 3 seeds dropped by filter reason"),
+    "seedgen_eta_seconds": ("gauge", "Estimated seconds until all Tier 3 items are complete"),
+    "seedgen_checkpoints_invalidated_total": ("counter", "Checkpoints regenerated because their prompt fingerprint changed"),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """Thread-safe registry of labelled counters and gauges"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[LabelKey, float]] = {name: {} for name in METRIC_DEFINITIONS}
+        self._constant_labels: LabelKey = ()
+
+    def set_constant_labels(self, **labels: str):
+        """Labels added to every exported sample (e.g. category and platform)"""
+        self._constant_labels = tuple(sorted(labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels: str):
+        """Increment a counter, or move a gauge up (negative value moves it down)"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values[name]
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels: str):
+        """Set a gauge"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[name][key] = value
+
+    def get(self, name: str, **labels: str) -> float:
+        """Current value of one series (0 if never written)"""
+        with self._lock:
+            return self._values[name].get(tuple(sorted(labels.items())), 0)
+
+    def reset(self):
+        """Clear all series, e.g. between benchmark runs"""
+        with self._lock:
+            for series in self._values.values():
+                series.clear()
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, (metric_type, help_text) in METRIC_DEFINITIONS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for key, value in sorted(self._values[name].items()):
+                    labels = self._constant_labels + key
+                    label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                    lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+    """Serve the global metrics registry at http://host:port/metrics from a daemon thread"""
+    # Deferred: http.server is a large import that only --metrics-port needs
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Scrapes every few seconds would otherwise flood stderr
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Serving metrics at http://{host}:{server.server_port}/metrics")
+    return server
+
+
+# Global metrics registry
+metrics = Metrics()
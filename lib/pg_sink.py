@@ -0,0 +1,201 @@
+"""
+Streaming PostgreSQL sink for Tier 3 seeds
+
+Lets DataGenerator upsert filtered seeds into seeds_posts as each Tier 3
+item completes instead of waiting for scripts/upsert_to_pg.py.
+"""
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import psycopg
+
+from lib.seeds_db import UPSERT_SQL, build_seed_rows, dedupe_rows, order_rows
+from lib.tracing import span
+from lib.profiling import profile_stage
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresSink:
+    """
+    Batch-upserts Tier 3 seeds over a psycopg AsyncConnection.
+
+    Each submission carries a key naming the seeds it delivers (the
+    generator's sink_key(): checkpoint file plus a digest of the seeds).
+    Keys are appended to a ledger file only after their batch commits, so a
+    resumed run re-submits exactly the checkpoints that never reached the
+    database. A crash between commit and ledger write re-sends one batch,
+    which the idempotent ON CONFLICT upsert absorbs.
+
+    submit() blocks once max_pending submissions are queued, which applies
+    backpressure to the generator when the database falls behind.
+    """
+
+    def __init__(
+        self,
+        conn_str: str,
+        category: str,
+        platform: str,
+        ledger_path: Path,
+        batch_size: int = 500,
+        max_pending: int = 8,
+        default_priority: int = 0,
+    ):
+        self.conn_str = conn_str
+        self.category = category
+        self.platform = platform
+        self.ledger_path = Path(ledger_path)
+        self.batch_size = batch_size
+        self.default_priority = default_priority
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._delivered: Set[str] = self._load_ledger()
+        self._conn: Optional[psycopg.AsyncConnection] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        # Set when the writer fails, so producers waiting on a full queue give up
+        self._failed = asyncio.Event()
+
+        self.rows_written = 0
+        self.rows_collapsed = 0
+
+    async def __aenter__(self) -> "PostgresSink":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Open the connection and start the background writer"""
+        self._conn = await psycopg.AsyncConnection.connect(self.conn_str)
+        self._worker = asyncio.create_task(self._run())
+        logger.info(f"PostgreSQL sink started ({len(self._delivered)} checkpoints already delivered)")
+
+    def is_delivered(self, key: str) -> bool:
+        """Check whether a checkpoint has already been committed to the database"""
+        return key in self._delivered
+
+    async def submit(self, key: str, seeds: List[Dict[str, Any]]):
+        """
+        Queue the seeds of one Tier 3 checkpoint for upsert.
+
+        Already-delivered keys are ignored. Waits while the queue is full.
+
+        Raises:
+            SinkError: If the background writer has failed, including while waiting
+        """
+        self._raise_if_failed()
+        if key in self._delivered or not seeds:
+            return
+
+        await self._put((key, seeds))
+        self._raise_if_failed()
+
+    async def close(self):
+        """Flush pending submissions, stop the writer and close the connection"""
+        if self._worker is not None:
+            if not self._worker.done():
+                await self._put(None)
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+        logger.info(f"PostgreSQL sink closed: {self.rows_written} rows written, {self.rows_collapsed} collapsed")
+        self._raise_if_failed()
+
+    async def _run(self):
+        """Drain the queue into batches until the close sentinel arrives"""
+        try:
+            closing = False
+            while not closing:
+                batch = [await self._queue.get()]
+
+                # Greedily take whatever else is already queued, up to the batch size
+                while batch[-1] is not None and sum(len(seeds) for _, seeds in batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                if batch[-1] is None:
+                    closing = True
+                    batch.pop()
+
+                if batch:
+                    await self._flush(batch)
+        except Exception as e:
+            logger.error(f"PostgreSQL sink failed: {e}")
+            self._error = e
+            # Wake every producer waiting on a full queue, however many there are
+            self._failed.set()
+
+    async def _put(self, item: Optional[Tuple[str, List[Dict[str, Any]]]]):
+        """Queue an item, waiting for space unless the writer fails first"""
+        try:
+            self._queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+        put = asyncio.ensure_future(self._queue.put(item))
+        failed = asyncio.ensure_future(self._failed.wait())
+        try:
+            await asyncio.wait({put, failed}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (put, failed):
+                if not task.done():
+                    task.cancel()
+
+    async def _flush(self, batch: List[Tuple[str, List[Dict[str, Any]]]]):
+        """Upsert one batch in a single transaction, then record its keys"""
+        seeds = [
+            {**seed, "category": self.category}
+            for _, item_seeds in batch
+            for seed in item_seeds
+        ]
+        with profile_stage("row_building"):
+            rows, collapsed = dedupe_rows(build_seed_rows(seeds, self.platform, self.default_priority))
+
+        with span("upsert.batch", category=self.category, platform=self.platform,
+                  rows=len(rows), checkpoints=len(batch)):
+            async with self._conn.transaction():
+                async with self._conn.cursor() as cur:
+                    await cur.executemany(UPSERT_SQL, order_rows(rows))
+
+        keys = [key for key, _ in batch]
+        self._record_delivered(keys)
+        self.rows_written += len(rows)
+        self.rows_collapsed += collapsed
+        logger.info(f"PostgreSQL sink upserted {len(rows)} seeds from {len(keys)} checkpoints")
+
+    def _load_ledger(self) -> Set[str]:
+        """Load delivered checkpoint keys from the ledger file"""
+        if not self.ledger_path.exists():
+            return set()
+
+        with open(self.ledger_path, 'r', encoding='utf-8') as f:
+            return {json.loads(line)["key"] for line in f if line.strip()}
+
+    def _record_delivered(self, keys: List[str]):
+        """Append committed checkpoint keys to the ledger file"""
+        with open(self.ledger_path, 'a', encoding='utf-8') as f:
+            for key in keys:
+                f.write(json.dumps({"key": key}) + "\n")
+            f.flush()
+        self._delivered.update(keys)
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise SinkError(f"PostgreSQL sink failed: {self._error}") from self._error
+
+
+class SinkError(Exception):
+    """Custom exception for streaming sink errors"""
+    pass
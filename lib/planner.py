@@ -0,0 +1,260 @@
+"""
+Dry-run planner: estimated calls, tokens, cost and wall-clock of a run
+
+Walks the same checkpoint layout as DataGenerator without creating files or
+calling Bedrock. Tiers that are not generated yet are filled with
+placeholder names of typical length, so every pending prompt can be
+rendered through prompt_registry and measured.
+"""
+
+import csv
+import json
+import math
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lib.config import config
+from lib.fingerprints import FingerprintStore, tier_fingerprints
+from lib.generator import tier2_checkpoint_name, tier3_checkpoint_name
+from lib.registry import prompt_registry
+from lib.routing import model_pricing, resolve_routes
+from lib.telemetry import estimate_cost
+from lib.tokens import CHARS_PER_TOKEN, estimate_tokens
+
+# Items per response when neither MAX_TIER_*_ITEMS nor "Generate exactly N-M" is found
+DEFAULT_TIER_ITEMS = {"tier1": 10, "tier2": 8, "tier3": 15}
+
+# Latency model used when the output directory has no previous run_report.json
+DEFAULT_CALL_OVERHEAD_S = 1.0
+DEFAULT_OUTPUT_TOKENS_PER_S = 150.0
+
+_ITEM_COUNT_PATTERN = re.compile(r"Generate exactly (\d+)(?:\s*-\s*(\d+))?")
+
+
+@dataclass
+class StagePlan:
+    """Estimated work for one tier"""
+    stage: str
+    model_id: str = ""  # Model of the tier's route
+    items: int = 0  # Known or expected work items (Tier 1: the single Tier 1 call)
+    checkpointed: int = 0  # Items already on disk
+    stale: int = 0  # Checkpoints whose prompt fingerprint changed (pending, not checkpointed)
+    calls: int = 0  # Pending model calls
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_s: float = 0.0  # Estimated latency per call
+    wall_clock_s: float = 0.0
+    cost_usd: float = 0.0
+
+
+@dataclass
+class RunPlan:
+    """Estimated work for one category/platform run"""
+    category: str
+    platform: str
+    max_concurrency: int
+    requests_per_minute: Optional[float]
+    stages: Dict[str, StagePlan] = field(default_factory=dict)
+
+    @property
+    def calls(self) -> int:
+        return sum(stage.calls for stage in self.stages.values())
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(stage.input_tokens for stage in self.stages.values())
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(stage.output_tokens for stage in self.stages.values())
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(stage.cost_usd for stage in self.stages.values())
+
+    @property
+    def wall_clock_s(self) -> float:
+        return sum(stage.wall_clock_s for stage in self.stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "estimated_cost_usd": round(self.cost_usd, 6),
+            "wall_clock_s": round(self.wall_clock_s, 1),
+        }
+
+
+def expected_items(prompts, tier: str, prompt: str) -> int:
+    """Items a response is expected to contain: MAX_TIER_*_ITEMS, else the prompt's upper bound"""
+    constant = getattr(prompts, f"MAX_TIER_{tier[-1]}_ITEMS", None)
+    if constant:
+        return constant
+    matches = _ITEM_COUNT_PATTERN.findall(prompt)
+    if matches:
+        low, high = matches[-1]
+        return int(high or low)
+    return DEFAULT_TIER_ITEMS[tier]
+
+
+def plan_run(
+    category: str,
+    platform: str,
+    base_output_dir: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    requests_per_minute: Optional[float] = None,
+) -> RunPlan:
+    """
+    Estimate the pending work of one category/platform run.
+
+    Args:
+        category: Prompt category
+        platform: youtube or instagram
+        base_output_dir: Data root (defaults to config.base_output_dir)
+        max_concurrency: In-flight call limit (defaults to config.max_concurrency)
+        requests_per_minute: Rate limit (defaults to config.requests_per_minute)
+    """
+    prompts = prompt_registry.get_prompts(category)
+    output_dir = Path(base_output_dir or config.base_output_dir) / platform / category
+    plan = RunPlan(
+        category=category,
+        platform=platform,
+        max_concurrency=max_concurrency or config.max_concurrency,
+        requests_per_minute=requests_per_minute if requests_per_minute is not None else config.requests_per_minute,
+    )
+    seed_length = (config.min_seed_length + config.max_seed_length) // 2
+    observed_latency = _observed_latencies(output_dir / config.run_report_filename)
+    routes = resolve_routes(config, category)
+    fingerprints = tier_fingerprints(prompts, platform, config, routes)
+    store = FingerprintStore(output_dir / config.fingerprints_filename)
+    
+    def is_current(stage: StagePlan, path: Path) -> bool:
+        # Same rules as DataGenerator: unrecorded (legacy) checkpoints count as current
+        if not path.exists():
+            return False
+        if store.get(path.name) in (None, fingerprints[stage.stage]):
+            return True
+        stage.stale += 1
+        return False
+
+    # Tier 1
+    tier1 = plan.stages["tier1"] = StagePlan("tier1", routes["tier1"].model_id, items=1)
+    tier1_file = output_dir / f"tier1_{category}.json"
+    if is_current(tier1, tier1_file):
+        tier1.checkpointed = 1
+        with open(tier1_file, 'r', encoding='utf-8') as f:
+            tier1_names = json.load(f)
+    else:
+        prompt = prompts.build_tier1_prompt()
+        tier1_names = [_placeholder("Tier One Category", i) for i in range(expected_items(prompts, "tier1", prompt))]
+        _add_call(tier1, prompt, {"tier1_categories": tier1_names})
+
+    # Tier 2
+    tier2 = plan.stages["tier2"] = StagePlan("tier2", routes["tier2"].model_id, items=len(tier1_names))
+    tier2_items: List[Dict[str, str]] = []
+    for tier1_name in tier1_names:
+        checkpoint = output_dir / tier2_checkpoint_name(category, tier1_name)
+        if is_current(tier2, checkpoint):
+            tier2.checkpointed += 1
+            tier2_items.extend(_read_csv(checkpoint))
+            continue
+        prompt = prompts.build_tier2_prompt(tier1_name)
+        names = [_placeholder("Tier Two Practice", i) for i in range(expected_items(prompts, "tier2", prompt))]
+        _add_call(tier2, prompt, {"tier1_name": tier1_name, "tier2_items": names})
+        tier2_items.extend({"tier1_name": tier1_name, "tier2_name": name} for name in names)
+
+    # Tier 3
+    tier3 = plan.stages["tier3"] = StagePlan("tier3", routes["tier3"].model_id, items=len(tier2_items))
+    for item in tier2_items:
+        if is_current(tier3, output_dir / tier3_checkpoint_name(category, platform, item["tier2_name"])):
+            tier3.checkpointed += 1
+            continue
+        prompt = prompts.build_tier3_prompt(item["tier1_name"], item["tier2_name"], platform)
+        seeds = ["s" * seed_length] * expected_items(prompts, "tier3", prompt)
+        _add_call(tier3, prompt, {**item, "search_seeds": seeds})
+
+    for stage in plan.stages.values():
+        pricing = model_pricing(config, stage.model_id)
+        stage.cost_usd = estimate_cost(stage.input_tokens, stage.output_tokens, pricing.input_per_1k, pricing.output_per_1k)
+        if stage.calls:
+            stage.latency_s = observed_latency.get(stage.stage) or (
+                DEFAULT_CALL_OVERHEAD_S + stage.output_tokens / stage.calls / DEFAULT_OUTPUT_TOKENS_PER_S
+            )
+        # Tier 1 is a single call; Tier 2/3 items run max_concurrency at a time
+        concurrency = 1 if stage.stage == "tier1" else plan.max_concurrency
+        stage.wall_clock_s = math.ceil(stage.calls / concurrency) * stage.latency_s
+        if plan.requests_per_minute:
+            stage.wall_clock_s = max(stage.wall_clock_s, stage.calls * 60 / plan.requests_per_minute)
+
+    return plan
+
+
+def format_plans(plans: List[RunPlan]) -> str:
+    """Render plans as a table with totals"""
+    lines = [
+        f"{'category':<26} {'platform':<9} {'calls':>7} {'pending items':>15} "
+        f"{'input tok':>11} {'output tok':>11} {'cost USD':>10} {'wall-clock':>11}"
+    ]
+    for plan in plans:
+        pending = sum(stage.items - stage.checkpointed for stage in plan.stages.values())
+        total = sum(stage.items for stage in plan.stages.values())
+        lines.append(
+            f"{plan.category:<26} {plan.platform:<9} {plan.calls:>7} {f'{pending}/{total}':>15} "
+            f"{plan.input_tokens:>11,} {plan.output_tokens:>11,} {plan.cost_usd:>10.4f} "
+            f"{_format_duration(plan.wall_clock_s):>11}"
+        )
+    if len(plans) > 1:
+        lines.append(
+            f"{'TOTAL (sequential)':<36} {sum(p.calls for p in plans):>7} {'':>15} "
+            f"{sum(p.input_tokens for p in plans):>11,} {sum(p.output_tokens for p in plans):>11,} "
+            f"{sum(p.cost_usd for p in plans):>10.4f} {_format_duration(sum(p.wall_clock_s for p in plans)):>11}"
+        )
+    if plans:
+        rate = f"{plans[0].requests_per_minute:g} requests/min" if plans[0].requests_per_minute else "no rate limit"
+        lines.append(
+            f"Assumes max_concurrency={plans[0].max_concurrency}, {rate}, ~{CHARS_PER_TOKEN} chars/token, "
+            f"no retries; Tier 2/3 counts for ungenerated tiers are expected, not known."
+        )
+        stale = sum(stage.stale for plan in plans for stage in plan.stages.values())
+        if stale:
+            lines.append(f"{stale} checkpoints were made by an older prompt or model setting and count as pending.")
+    return "\n".join(lines)
+
+
+def _add_call(stage: StagePlan, prompt: str, expected_response: Dict[str, Any]):
+    stage.calls += 1
+    stage.input_tokens += estimate_tokens(prompt)
+    stage.output_tokens += estimate_tokens(json.dumps(expected_response, indent=2))
+
+
+def _placeholder(prefix: str, index: int) -> str:
+    """Stand-in for a name that has not been generated yet"""
+    return f"{prefix} {index + 1}"
+
+
+def _read_csv(path: Path) -> List[Dict[str, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [{"tier1_name": row["tier1_name"], "tier2_name": row["tier2_name"]} for row in csv.DictReader(f)]
+
+
+def _observed_latencies(report_path: Path) -> Dict[str, float]:
+    """Median latency in seconds per stage from a previous run report, if any"""
+    if not report_path.exists():
+        return {}
+    with open(report_path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    return {
+        stage: stats["latency_ms"]["p50"] / 1000
+        for stage, stats in report.get("stages", {}).items()
+        if stats.get("latency_ms", {}).get("p50")
+    }
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
@@ -0,0 +1,270 @@
+"""
+Opt-in per-stage profiling for the generation and upsert entry points
+
+profile_stage() is a no-op until configure_profiling() is called. Each
+stage (tier1, tier2, tier3, filter, aggregation, row_building, db_write)
+gets its own profile and a line in summary.json with wall time and peak
+memory, written under logs/profiles/ by finish_profiling().
+
+Modes:
+    cprofile     One cProfile.Profile per stage (<stage>.prof, <stage>.txt).
+                 Nested stages are excluded from their parent's profile.
+    tracemalloc  Peak traced memory per stage and the top allocation sites
+                 still alive when the stage ends (<stage>_allocations.txt).
+    sampling     A background thread samples the stack of every thread in a
+                 stage every few milliseconds and writes collapsed stacks
+                 (<stage>.collapsed) for flamegraph.pl or speedscope.
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("cprofile", "tracemalloc", "sampling")
+
+_profiler: Optional["StageProfiler"] = None
+
+
+class StageProfiler:
+    """
+    Collects profiles per named stage.
+
+    Stages may nest and may be entered from several threads; each thread
+    keeps its own stack of active stages.
+
+    Args:
+        mode: One of PROFILE_MODES
+        output_dir: Directory the profiles are written to
+        sample_interval: Seconds between stack samples in sampling mode
+    """
+
+    def __init__(self, mode: str, output_dir: Path, sample_interval: float = 0.005):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Invalid profile mode: {mode}. Must be one of {', '.join(PROFILE_MODES)}")
+        self.mode = mode
+        self.output_dir = Path(output_dir)
+        self.sample_interval = sample_interval
+
+        self._lock = threading.Lock()
+        self._stacks: Dict[int, List[str]] = defaultdict(list)
+        self._stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"calls": 0, "wall_s": 0.0})
+        # cprofile: one Profile per (stage, thread), merged when written
+        self._profiles: Dict[tuple, cProfile.Profile] = {}
+        # tracemalloc: peak traced bytes per stage and allocation snapshots at stage end
+        self._peaks: Dict[str, int] = defaultdict(int)
+        self._snapshots: Dict[str, tracemalloc.Snapshot] = {}
+        # sampling: collapsed stack -> sample count, per stage
+        self._samples: Dict[str, Counter] = defaultdict(Counter)
+        self._sampler: Optional[threading.Thread] = None
+        self._stop_sampling = threading.Event()
+
+    def start(self):
+        """Start process-wide collection (tracemalloc tracing or the sampler thread)"""
+        if self.mode == "tracemalloc":
+            tracemalloc.start(25)
+        elif self.mode == "sampling":
+            self._sampler = threading.Thread(target=self._sample_loop, name="stage-sampler", daemon=True)
+            self._sampler.start()
+
+    def stop(self):
+        """Stop collection; active stages are left as they are"""
+        if self.mode == "tracemalloc":
+            self._fold_peak()
+            tracemalloc.stop()
+        elif self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+            self._sampler = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """Attribute the enclosed block to stage name"""
+        thread_id = threading.get_ident()
+        stack = self._stacks[thread_id]
+        parent = stack[-1] if stack else None
+
+        if self.mode == "cprofile" and parent is not None:
+            self._profile(parent, thread_id).disable()
+        if self.mode == "tracemalloc":
+            self._fold_peak()
+
+        with self._lock:
+            stack.append(name)
+        start = time.perf_counter()
+        if self.mode == "cprofile":
+            self._profile(name, thread_id).enable()
+        try:
+            yield
+        finally:
+            if self.mode == "cprofile":
+                self._profile(name, thread_id).disable()
+            if self.mode == "tracemalloc":
+                self._fold_peak()
+                self._snapshots[name] = tracemalloc.take_snapshot()
+
+            with self._lock:
+                # Stages normally exit in LIFO order; remove by position to stay safe if not
+                index = len(stack) - 1 - stack[::-1].index(name)
+                del stack[index]
+                stats = self._stats[name]
+                stats["calls"] += 1
+                stats["wall_s"] += time.perf_counter() - start
+                stats["max_rss_bytes"] = max(stats.get("max_rss_bytes", 0), _max_rss_bytes())
+
+            if self.mode == "cprofile" and parent is not None and stack and stack[-1] == parent:
+                self._profile(parent, thread_id).enable()
+
+    def write(self) -> Path:
+        """Write every stage's profile and summary.json to output_dir"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary = {"mode": self.mode, "stages": {}}
+
+        for name, stats in sorted(self._stats.items()):
+            entry = {"calls": stats["calls"], "wall_s": round(stats["wall_s"], 6)}
+            if stats.get("max_rss_bytes"):
+                entry["max_rss_bytes"] = stats["max_rss_bytes"]
+            if self.mode == "tracemalloc":
+                entry["peak_traced_bytes"] = self._peaks.get(name, 0)
+            if self.mode == "sampling":
+                entry["samples"] = sum(self._samples[name].values())
+            summary["stages"][name] = entry
+
+        if self.mode == "cprofile":
+            self._write_cprofile()
+        elif self.mode == "tracemalloc":
+            self._write_tracemalloc()
+        else:
+            self._write_samples()
+
+        with open(self.output_dir / "summary.json", 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return self.output_dir
+
+    def _profile(self, name: str, thread_id: int) -> cProfile.Profile:
+        key = (name, thread_id)
+        if key not in self._profiles:
+            self._profiles[key] = cProfile.Profile()
+        return self._profiles[key]
+
+    def _fold_peak(self):
+        """Credit the peak since the last reset to every active stage, then reset it"""
+        if not tracemalloc.is_tracing():
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        with self._lock:
+            for stack in self._stacks.values():
+                for name in stack:
+                    self._peaks[name] = max(self._peaks[name], peak)
+        tracemalloc.reset_peak()
+
+    def _sample_loop(self):
+        while not self._stop_sampling.wait(self.sample_interval):
+            frames = sys._current_frames()
+            with self._lock:
+                active = {thread_id: stack[-1] for thread_id, stack in self._stacks.items() if stack}
+            for thread_id, name in active.items():
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self._samples[name][_collapse(frame)] += 1
+
+    def _write_cprofile(self):
+        by_stage: Dict[str, List[cProfile.Profile]] = defaultdict(list)
+        for (name, _), profile in self._profiles.items():
+            by_stage[name].append(profile)
+
+        for name, profiles in by_stage.items():
+            report = io.StringIO()
+            stats = pstats.Stats(profiles[0], stream=report)
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(self.output_dir / f"{name}.prof")
+            stats.sort_stats("cumulative").print_stats(40)
+            (self.output_dir / f"{name}.txt").write_text(report.getvalue(), encoding='utf-8')
+
+    def _write_tracemalloc(self):
+        for name, snapshot in self._snapshots.items():
+            lines = [f"Peak traced memory: {self._peaks.get(name, 0)} bytes", "Top allocation sites at stage end:"]
+            for stat in snapshot.statistics("lineno")[:25]:
+                lines.append(str(stat))
+            (self.output_dir / f"{name}_allocations.txt").write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    def _write_samples(self):
+        for name, samples in self._samples.items():
+            with open(self.output_dir / f"{name}.collapsed", 'w', encoding='utf-8') as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+
+
+def _collapse(frame) -> str:
+    """Render a frame's stack root-first in the collapsed-stack format"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _max_rss_bytes() -> int:
+    """Process peak resident set size so far (0 where unavailable)"""
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def configure_profiling(mode: str, run_name: str, logs_dir: Path = Path("logs")) -> StageProfiler:
+    """
+    Enable stage profiling for this process.
+
+    Profiles are written to logs_dir/profiles/<run_name>_<timestamp>/ by
+    finish_profiling().
+    """
+    global _profiler
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    _profiler = StageProfiler(mode, Path(logs_dir) / "profiles" / f"{run_name}_{timestamp}")
+    _profiler.start()
+    logger.info(f"Profiling enabled ({mode})")
+    return _profiler
+
+
+def finish_profiling() -> Optional[Path]:
+    """Stop profiling and write the collected profiles; returns their directory"""
+    global _profiler
+    if _profiler is None:
+        return None
+    profiler, _profiler = _profiler, None
+    profiler.stop()
+    output_dir = profiler.write()
+    logger.info(f"Profiles written to: {output_dir}")
+    return output_dir
+
+
+@contextmanager
+def profile_stage(name: str):
+    """Attribute the enclosed block to a profiling stage; no-op when profiling is disabled"""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.stage(name):
+        yield
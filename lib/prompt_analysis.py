@@ -0,0 +1,182 @@
+"""
+Prompt token footprints and max_tokens recommendations
+
+Renders every category/tier/platform prompt through prompt_registry with
+item names of typical length and estimates its tokens (lib.tokens), so
+prompts that outgrow the budget are caught before a run pays for them.
+
+Response sizes observed in run_report.json files are turned into per-tier
+max_tokens recommendations: the largest p99 output seen for the tier (or
+twice the expected response size when no run has been reported yet) plus
+headroom, rounded up. A max_tokens close to actual response sizes lowers
+latency and the tokens reserved against the account's TPM quota.
+"""
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from lib.config import config
+from lib.planner import expected_items
+from lib.registry import prompt_registry
+from lib.tokens import CHARS_PER_TOKEN, estimate_tokens
+
+# Stand-ins for generated names when rendering Tier 2/Tier 3 prompts
+TYPICAL_TIER1_NAME = "Home Cooking Basics"
+TYPICAL_TIER2_NAME = "Weeknight Pasta Recipes"
+
+# Run report stages whose responses count towards a tier
+REPORT_STAGES = {"tier1": ("tier1",), "tier2": ("tier2",), "tier3": ("tier3", "tier3_topup")}
+
+# Recommendations are rounded up to a multiple of this
+MAX_TOKENS_STEP = 256
+
+# Expected sizes are rough (estimated tokens, typical names), so without observations they get extra margin
+EXPECTED_SIZE_MARGIN = 2.0
+
+
+@dataclass
+class PromptFootprint:
+    """Estimated size of one rendered prompt and its expected response"""
+    category: str
+    tier: str
+    platform: Optional[str]  # None for Tier 1/Tier 2, which are platform-independent
+    prompt_tokens: int
+    expected_output_tokens: int
+    over_budget: bool
+
+
+@dataclass
+class MaxTokensRecommendation:
+    """Suggested max_tokens for one tier"""
+    tier: str
+    observed_p99: Optional[int]  # Largest per-report p99 output tokens, if any run was reported
+    observed_max: Optional[int]
+    expected: int  # Largest expected response across the analyzed prompts
+    recommended: int
+    source: str  # "observed" or "expected"
+
+
+def analyze_prompts(
+    categories: Iterable[str],
+    platforms: Iterable[str],
+    budget: int,
+) -> List[PromptFootprint]:
+    """Footprint of every Tier 1, Tier 2 and per-platform Tier 3 prompt of the categories"""
+    platforms = list(platforms)
+    seed = "s" * ((config.min_seed_length + config.max_seed_length) // 2)
+    footprints = []
+    for category in categories:
+        prompts = prompt_registry.get_prompts(category)
+        rendered = [
+            ("tier1", None, prompts.build_tier1_prompt(), "tier1_categories", TYPICAL_TIER1_NAME),
+            ("tier2", None, prompts.build_tier2_prompt(TYPICAL_TIER1_NAME), "tier2_items", TYPICAL_TIER2_NAME),
+        ] + [
+            ("tier3", platform, prompts.build_tier3_prompt(TYPICAL_TIER1_NAME, TYPICAL_TIER2_NAME, platform),
+             "search_seeds", seed)
+            for platform in platforms
+        ]
+        for tier, platform, prompt, key, item in rendered:
+            response = {key: [item] * expected_items(prompts, tier, prompt)}
+            prompt_tokens = estimate_tokens(prompt)
+            footprints.append(PromptFootprint(
+                category=category,
+                tier=tier,
+                platform=platform,
+                prompt_tokens=prompt_tokens,
+                expected_output_tokens=estimate_tokens(json.dumps(response, indent=2)),
+                over_budget=prompt_tokens > budget,
+            ))
+    return footprints
+
+
+def observed_output_tokens(data_dir: Path) -> Dict[str, Dict[str, int]]:
+    """Largest per-report p99 and max output tokens per call of each tier, over every run_report.json"""
+    observed: Dict[str, Dict[str, int]] = {}
+    for report_path in sorted(Path(data_dir).rglob(config.run_report_filename)):
+        with open(report_path, 'r', encoding='utf-8') as f:
+            stages = json.load(f).get("stages", {})
+        for tier, stage_names in REPORT_STAGES.items():
+            for stage in stage_names:
+                sizes = stages.get(stage, {}).get("output_tokens_per_call", {})
+                if sizes.get("max") is None:
+                    continue
+                tier_observed = observed.setdefault(tier, {"p99": 0, "max": 0})
+                tier_observed["p99"] = max(tier_observed["p99"], sizes["p99"])
+                tier_observed["max"] = max(tier_observed["max"], sizes["max"])
+    return observed
+
+
+def recommend_max_tokens(
+    footprints: List[PromptFootprint],
+    observed: Dict[str, Dict[str, int]],
+    headroom: float = 1.25,
+) -> List[MaxTokensRecommendation]:
+    """Per-tier max_tokens: observed p99 (else twice the expected size) times headroom, rounded up"""
+    recommendations = []
+    for tier in REPORT_STAGES:
+        expected = max((f.expected_output_tokens for f in footprints if f.tier == tier), default=0)
+        tier_observed = observed.get(tier)
+        basis = tier_observed["p99"] if tier_observed else expected * EXPECTED_SIZE_MARGIN
+        recommended = max(MAX_TOKENS_STEP, math.ceil(basis * headroom / MAX_TOKENS_STEP) * MAX_TOKENS_STEP)
+        recommendations.append(MaxTokensRecommendation(
+            tier=tier,
+            observed_p99=tier_observed["p99"] if tier_observed else None,
+            observed_max=tier_observed["max"] if tier_observed else None,
+            expected=expected,
+            recommended=recommended,
+            source="observed" if tier_observed else "expected",
+        ))
+    return recommendations
+
+
+def format_analysis(
+    footprints: List[PromptFootprint],
+    recommendations: List[MaxTokensRecommendation],
+    budget: int,
+    max_tokens: Dict[str, int],
+) -> str:
+    """Render footprints and recommendations as tables, against each tier's configured max_tokens"""
+    lines = [f"{'category':<26} {'tier':<6} {'platform':<9} {'prompt tok':>10} {'expected out':>12}  budget"]
+    for f in footprints:
+        lines.append(
+            f"{f.category:<26} {f.tier:<6} {f.platform or '-':<9} {f.prompt_tokens:>10,} "
+            f"{f.expected_output_tokens:>12,}  {'OVER' if f.over_budget else 'ok'}"
+        )
+    over = sum(1 for f in footprints if f.over_budget)
+    lines.append(
+        f"{len(footprints)} prompts, {over} over the {budget:,}-token budget "
+        f"(~{CHARS_PER_TOKEN} chars/token, item names of typical length)."
+    )
+    lines.append("")
+    lines.append(f"{'tier':<6} {'observed p99':>12} {'observed max':>12} {'expected':>9} {'recommended':>11} {'configured':>10}")
+    for r in recommendations:
+        note = ""
+        if r.observed_max is not None and r.observed_max >= max_tokens[r.tier] * 0.95:
+            note = "  responses reach max_tokens (truncated?); do not lower"
+        elif r.source == "expected":
+            note = "  no run report yet; based on the expected response size"
+        lines.append(
+            f"{r.tier:<6} {_format_optional(r.observed_p99):>12} {_format_optional(r.observed_max):>12} "
+            f"{r.expected:>9,} {r.recommended:>11,} {max_tokens[r.tier]:>10,}{note}"
+        )
+    return "\n".join(lines)
+
+
+def analysis_to_dict(
+    footprints: List[PromptFootprint],
+    recommendations: List[MaxTokensRecommendation],
+    budget: int,
+) -> Dict[str, Any]:
+    return {
+        "budget_tokens": budget,
+        "chars_per_token": CHARS_PER_TOKEN,
+        "prompts": [vars(f) for f in footprints],
+        "max_tokens": {r.tier: vars(r) for r in recommendations},
+    }
+
+
+def _format_optional(value: Optional[int]) -> str:
+    return f"{value:,}" if value is not None else "-"
@@ -0,0 +1,176 @@
+"""
+Declarative prompt specs and their compiled renderer
+
+A category's prompts are data: a PromptSpec holds the Tier 1, Tier 2 and
+per-platform Tier 3 templates plus constant values (e.g. item limits).
+Category specs are layered on a shared base spec with extend(), which
+overrides fields and merges the Tier 3 platforms and values.
+
+Compiling a spec validates every template once, at import time of its
+prompts module: placeholders must be a constant or one of the tier's item
+names, and item names the tier needs must appear. Constants are substituted
+at compile time, so rendering only joins pre-split literal segments with the
+item names. Each compiled template keeps its static prefix, the text before
+the first item name, which is identical across all calls of a tier.
+
+For prompt caching, a template can also be sent as item-independent
+instructions, with every item name replaced by a <placeholder> reference,
+plus a short item message giving the references' values.
+"""
+
+import string
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+# Item names each tier's template is rendered with; all of them must appear
+TIER_PLACEHOLDERS = {
+    "tier1": (),
+    "tier2": ("tier1_name",),
+    "tier3": ("tier1_name", "tier2_name"),
+}
+
+
+@dataclass(frozen=True)
+class PromptSpec:
+    """
+    Prompt templates of one category, in str.format syntax (literal braces doubled).
+
+    Args:
+        category: Category the prompts belong to
+        tier1: Tier 1 template
+        tier2: Tier 2 template
+        tier3: Tier 3 template per platform
+        values: Constants substituted at compile time, e.g. {"max_tier1": 20}
+        default_platform: Tier 3 platform used for platforms without a template
+    """
+    category: str = ""
+    tier1: str = ""
+    tier2: str = ""
+    tier3: Dict[str, str] = field(default_factory=dict)
+    values: Dict[str, Any] = field(default_factory=dict)
+    default_platform: str = "youtube"
+
+    def extend(self, **overrides) -> "PromptSpec":
+        """Layer overrides on this spec; tier3 and values are merged rather than replaced"""
+        for name in ("tier3", "values"):
+            if name in overrides:
+                overrides[name] = {**getattr(self, name), **overrides[name]}
+        return replace(self, **overrides)
+
+    def compile(self) -> "CompiledPrompts":
+        return CompiledPrompts(self)
+
+
+class CompiledTemplate:
+    """
+    One template split into literal segments and item-name fields.
+
+    Args:
+        template: Template in str.format syntax
+        values: Constants substituted now
+        placeholders: Item names supplied at render time; all must appear
+        name: Template name used in validation errors
+    """
+
+    def __init__(self, template: str, values: Dict[str, Any], placeholders: Tuple[str, ...], name: str):
+        self.name = name
+        self.placeholders = placeholders
+        # Alternating literal text and item names, starting and ending with literal text
+        self._segments: List[str] = [""]
+        try:
+            parsed = list(string.Formatter().parse(template))
+        except ValueError as e:
+            raise PromptSpecError(f"{name}: {e}") from e
+
+        seen = set()
+        for literal, field_name, format_spec, conversion in parsed:
+            self._segments[-1] += literal
+            if field_name is None:
+                continue
+            if not field_name.isidentifier():
+                raise PromptSpecError(f"{name}: unescaped brace before {field_name[:30]!r}; double literal braces")
+            if format_spec or conversion:
+                raise PromptSpecError(f"{name}: format specs and conversions are not supported ({{{field_name}}})")
+            if field_name in placeholders:
+                seen.add(field_name)
+                self._segments.extend([field_name, ""])
+            elif field_name in values:
+                self._segments[-1] += str(values[field_name])
+            else:
+                raise PromptSpecError(
+                    f"{name}: unknown placeholder {{{field_name}}}; "
+                    f"expected one of {sorted(set(placeholders) | set(values))}"
+                )
+        missing = [placeholder for placeholder in placeholders if placeholder not in seen]
+        if missing:
+            raise PromptSpecError(f"{name}: missing placeholders {missing}")
+
+    @property
+    def static_prefix(self) -> str:
+        """Text before the first item name, identical for every render"""
+        return self._segments[0]
+
+    @property
+    def instructions(self) -> str:
+        """The template with item names as <placeholder> references, identical for every render"""
+        return "".join(
+            f"<{segment}>" if index % 2 else segment for index, segment in enumerate(self._segments)
+        )
+
+    def item_message(self, **items: str) -> str:
+        """Values of the <placeholder> references in instructions"""
+        lines = "\n".join(f"<{placeholder}>: {items[placeholder]}" for placeholder in self.placeholders)
+        return f"Use these values for the placeholders in the instructions:\n{lines}"
+
+    def split(self, **items: str) -> Tuple[str, str]:
+        """(static prefix, item-specific rest) of the rendered prompt"""
+        rest = self._segments[1:]
+        return self._segments[0], "".join(
+            items[segment] if index % 2 == 0 else segment for index, segment in enumerate(rest)
+        )
+
+    def render(self, **items: str) -> str:
+        prefix, suffix = self.split(**items)
+        return prefix + suffix
+
+
+class CompiledPrompts:
+    """Compiled templates of a PromptSpec, with the build_*_prompt interface of a prompts module"""
+
+    def __init__(self, spec: PromptSpec):
+        self.spec = spec
+        where = spec.category or "prompt spec"
+        if spec.default_platform not in spec.tier3:
+            raise PromptSpecError(f"{where}: no Tier 3 template for default platform '{spec.default_platform}'")
+        self.templates: Dict[str, CompiledTemplate] = {
+            "tier1": CompiledTemplate(spec.tier1, spec.values, TIER_PLACEHOLDERS["tier1"], f"{where} tier1"),
+            "tier2": CompiledTemplate(spec.tier2, spec.values, TIER_PLACEHOLDERS["tier2"], f"{where} tier2"),
+        }
+        for platform, template in spec.tier3.items():
+            self.templates[f"tier3.{platform}"] = CompiledTemplate(
+                template, spec.values, TIER_PLACEHOLDERS["tier3"], f"{where} tier3.{platform}"
+            )
+
+    def template(self, tier: str, platform: Optional[str] = None) -> CompiledTemplate:
+        """Compiled template of a tier; Tier 3 falls back to the default platform"""
+        if tier != "tier3":
+            return self.templates[tier]
+        platform = (platform or self.spec.default_platform).lower()
+        return self.templates.get(f"tier3.{platform}") or self.templates[f"tier3.{self.spec.default_platform}"]
+
+    def build_tier1_prompt(self) -> str:
+        """Build the Tier 1 generation prompt"""
+        return self.templates["tier1"].render()
+
+    def build_tier2_prompt(self, tier1_name: str) -> str:
+        """Build the Tier 2 generation prompt for a specific Tier 1 category"""
+        return self.templates["tier2"].render(tier1_name=tier1_name)
+
+    def build_tier3_prompt(self, tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
+        """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
+        return self.template("tier3", platform).render(tier1_name=tier1_name, tier2_name=tier2_name)
+
+
+class PromptSpecError(ValueError):
+    """Raised when a prompt template is malformed"""
+    pass
@@ -0,0 +1,30 @@
+"""
+Client-side request rate limiting
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Spaces request starts evenly so at most requests_per_minute begin per minute.
+
+    Shared by all coroutines of a client; acquire() waits for the next free slot.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the caller may start a request"""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
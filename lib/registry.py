@@ -1,10 +1,15 @@
 """
 Prompt registry for dynamic category-based prompt loading
+
+Nothing happens at import time: categories are discovered on first use
+(one directory listing, cached for the process) and a category's prompt
+module is only imported when its prompts are requested.
 """
 
 import importlib
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -13,23 +18,27 @@ logger = logging.getLogger(__name__)
 class PromptRegistry:
     """Registry for managing category-specific prompts"""
     
-    def __init__(self):
+    def __init__(self, prompts_dir: Optional[Path] = None):
+        # Get the project root (parent of lib directory)
+        self.prompts_dir = prompts_dir or Path(__file__).parent.parent / "prompts"
         self._prompt_modules: Dict[str, Any] = {}
-        self._available_categories = self._discover_categories()
+        self._categories: Optional[List[str]] = None
     
-    def _discover_categories(self) -> list:
-        """Discover available categories by scanning for prompt files"""
-        categories = []
-        # Get the project root (parent of lib directory)
-        project_root = Path(__file__).parent.parent
-        prompts_dir = project_root / "prompts"
-        
-        # Look for prompt files in the prompts subdirectory
-        for file_path in prompts_dir.glob("*_prompts.py"):
-            category_name = file_path.stem.replace("_prompts", "")
-            categories.append(category_name)
-        
-        logger.info(f"Discovered categories: {categories}")
+    @property
+    def _available_categories(self) -> List[str]:
+        """Category manifest, discovered on first use"""
+        if self._categories is None:
+            self._categories = self._discover_categories()
+        return self._categories
+    
+    def _discover_categories(self) -> List[str]:
+        """Discover available categories by listing the prompt files (without importing them)"""
+        categories = sorted(
+            name[:-len("_prompts.py")]
+            for name in os.listdir(self.prompts_dir)
+            if name.endswith("_prompts.py")
+        )
+        logger.debug(f"Discovered categories: {categories}")
         return categories
     
     def get_prompts(self, category: str):
@@ -53,7 +62,7 @@ class PromptRegistry:
                 raise ImportError(f"Category '{category}' is missing required functions: {missing_functions}")
             
             self._prompt_modules[category] = module
-            logger.info(f"Loaded prompts for category: {category}")
+            logger.debug(f"Loaded prompts for category: {category}")
             
         except ImportError as e:
             logger.error(f"Failed to load prompts for category '{category}': {e}")
@@ -0,0 +1,224 @@
+"""
+Retry budget and circuit breaker for model calls
+
+BedrockClient retries each call, and the generator retries calls whose
+response is not valid JSON, so a single item can take up to
+max_retries * max_retries attempts. During an outage that multiplies the
+load on an already degraded service.
+
+RetryBudget caps retries of both kinds, across all items, at a ratio of the
+successful calls in a sliding window (plus a small reserve, so a run that
+has not succeeded yet can still retry). CircuitBreaker tracks the outcome
+of recent calls; when the share of failures (errors and throttles) crosses
+a threshold it opens. While it is open, new calls wait for the cooldown
+instead of being sent, which pauses scheduling, and calls that would wait
+longer than max_pause_s fail fast. After the cooldown, one probe call is let
+through (half-open): its success closes the breaker, its failure reopens it.
+Every call holds a CallPermit from the breaker and gives it back with its
+outcome, or with release() when it ends without one, so only the probe's
+own outcome or release frees the probe slot.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+from lib.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+# Values of the seedgen_circuit_state gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class RetryBudget:
+    """
+    Shared allowance of retries, as a ratio of successful calls.
+
+    Args:
+        ratio: Retries allowed per successful call in the window
+        min_retries: Retries allowed per window regardless of successes
+        window_s: Length of the sliding window in seconds
+        clock: Time source (time.monotonic)
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window_s: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ratio < 0 or min_retries < 0 or window_s <= 0:
+            raise ValueError("ratio and min_retries must not be negative and window_s must be positive")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_s = window_s
+        self.clock = clock
+        self._successes: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.rejected = 0
+
+    def record_success(self):
+        self._successes.append(self.clock())
+
+    def try_retry(self, kind: str = "api") -> bool:
+        """Spend one retry; False (and counted as rejected) when the budget is exhausted"""
+        now = self.clock()
+        self._expire(now)
+        if len(self._retries) >= self.min_retries + self.ratio * len(self._successes):
+            self.rejected += 1
+            metrics.inc("seedgen_retries_rejected_total", kind=kind)
+            return False
+        self._retries.append(now)
+        return True
+
+    def summary(self) -> Dict[str, object]:
+        """Budget settings and rejected retries for the run report"""
+        return {"ratio": self.ratio, "min_retries": self.min_retries, "window_s": self.window_s, "rejected": self.rejected}
+
+    def _expire(self, now: float):
+        cutoff = now - self.window_s
+        for events in (self._successes, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+
+class CallPermit:
+    """A call slot handed out by CircuitBreaker.acquire(); probe is True for the half-open probe"""
+
+    __slots__ = ("probe",)
+
+    def __init__(self, probe: bool = False):
+        self.probe = probe
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker shared by all calls of a client.
+
+    Args:
+        failure_threshold: Share of failed calls in the window that opens the breaker
+        window: Number of recent call outcomes considered
+        min_calls: Outcomes needed in the window before the breaker can open
+        cooldown_s: Seconds the breaker stays open before a probe call
+        max_pause_s: Longest a call waits for the breaker before failing fast
+        clock: Time source (time.monotonic)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        cooldown_s: float = 30.0,
+        max_pause_s: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.cooldown_s = cooldown_s
+        self.max_pause_s = max_pause_s
+        self.clock = clock
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True for failures
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe: Optional[CallPermit] = None  # The half-open probe call in flight
+        self.times_opened = 0
+        self.fast_failures = 0
+        metrics.set("seedgen_circuit_state", STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self.clock() - self._opened_at >= self.cooldown_s:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def allow(self) -> Optional[CallPermit]:
+        """A permit if a call may be sent now, else None; in half-open state only one probe at a time"""
+        state = self.state
+        if state == CLOSED:
+            return CallPermit()
+        if state == HALF_OPEN and self._probe is None:
+            self._probe = CallPermit(probe=True)
+            return self._probe
+        return None
+
+    async def acquire(self) -> Optional[CallPermit]:
+        """Wait until a call may be sent; None (fail fast) if that takes longer than max_pause_s"""
+        waited = 0.0
+        while (permit := self.allow()) is None:
+            if self._state == OPEN:
+                wait = self._opened_at + self.cooldown_s - self.clock()
+            else:
+                # Half-open with the probe still running
+                wait = min(1.0, self.cooldown_s)
+            wait = max(wait, 0.01)
+            if waited + wait > self.max_pause_s:
+                self.fast_failures += 1
+                return None
+            await asyncio.sleep(wait)
+            waited += wait
+        return permit
+
+    def record_success(self, permit: CallPermit):
+        self._record(permit, failed=False)
+
+    def record_failure(self, permit: CallPermit):
+        self._record(permit, failed=True)
+
+    def release(self, permit: CallPermit):
+        """
+        Give back a call slot without an outcome, e.g. when the call was
+        cancelled or failed with an error that says nothing about the service.
+        Only frees the probe slot for the probe's own permit, and is a no-op
+        once the permit's outcome was recorded.
+        """
+        if permit is self._probe:
+            self._probe = None
+
+    def _record(self, permit: CallPermit, failed: bool):
+        if permit is self._probe:
+            self._probe = None
+            if failed:
+                self._open()
+            else:
+                self._outcomes.clear()
+                self._transition(CLOSED)
+            return
+        if self._state != CLOSED:
+            # Calls started before the breaker opened
+            return
+        self._outcomes.append(failed)
+        failures = sum(self._outcomes)
+        if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        self._opened_at = self.clock()
+        self.times_opened += 1
+        metrics.inc("seedgen_circuit_opened_total")
+        logger.warning("Circuit breaker open: pausing model calls for %.0fs", self.cooldown_s)
+        self._transition(OPEN)
+
+    def _transition(self, state: str):
+        if state != self._state:
+            logger.info("Circuit breaker %s -> %s", self._state, state)
+        self._state = state
+        metrics.set("seedgen_circuit_state", STATE_VALUES[state])
+
+    def summary(self) -> Dict[str, object]:
+        """Breaker state and counts for the run report"""
+        return {
+            "state": self.state,
+            "times_opened": self.times_opened,
+            "fast_failures": self.fast_failures,
+        }
@@ -0,0 +1,129 @@
+"""
+Per-tier model routing and per-model pricing
+
+Each tier's calls go to a route: model ID, max_tokens and sampling
+parameters. Routes start from the global DataGenerationConfig settings,
+take config.tier_routes overrides for the tier, then config.category_routes
+overrides for the category and tier. With no overrides every tier uses the
+global settings, as before.
+
+Costs are estimated per model from MODEL_PRICING; models missing from the
+table are priced with the config's input/output/cache prices.
+MIN_CACHE_TOKENS holds each model's minimum tokens per prompt-cache
+checkpoint; Bedrock processes shorter cached prefixes uncached.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from lib.fingerprints import TIERS
+from lib.telemetry import ModelPricing
+
+# Settings a route can override
+ROUTE_FIELDS = ("model_id", "max_tokens", "temperature", "top_p")
+
+# On-demand USD per 1,000 tokens: input, output, cache read, cache write
+MODEL_PRICING: Dict[str, ModelPricing] = {
+    "amazon.nova-micro-v1:0": ModelPricing(0.000035, 0.00014, 0.00000875, 0.000035),
+    "amazon.nova-lite-v1:0": ModelPricing(0.00006, 0.00024, 0.000015, 0.00006),
+    "amazon.nova-pro-v1:0": ModelPricing(0.0008, 0.0032, 0.0002, 0.0008),
+    "anthropic.claude-3-haiku-20240307-v1:0": ModelPricing(0.00025, 0.00125, 0.00025, 0.00025),
+    "anthropic.claude-3-5-haiku-20241022-v1:0": ModelPricing(0.0008, 0.004, 0.00008, 0.001),
+}
+
+# Minimum tokens before a prompt-cache checkpoint; models missing from the
+# table use DEFAULT_MIN_CACHE_TOKENS
+MIN_CACHE_TOKENS: Dict[str, int] = {
+    "amazon.nova-micro-v1:0": 1000,
+    "amazon.nova-lite-v1:0": 1000,
+    "amazon.nova-pro-v1:0": 1000,
+    "anthropic.claude-3-5-haiku-20241022-v1:0": 2048,
+}
+DEFAULT_MIN_CACHE_TOKENS = 1024
+
+
+@dataclass(frozen=True)
+class TierRoute:
+    """Model and inference settings for one tier's calls"""
+    tier: str
+    model_id: str
+    max_tokens: int
+    temperature: float
+    top_p: float
+
+    @property
+    def name(self) -> str:
+        return f"{self.tier}:{self.model_id}"
+
+
+def stage_tier(stage: str) -> str:
+    """Tier whose route a telemetry stage uses (top-up calls are Tier 3 calls)"""
+    return "tier3" if stage.startswith("tier3") else stage
+
+
+def resolve_route(config, tier: str, category: Optional[str] = None) -> TierRoute:
+    """Route of a tier: global settings < config.tier_routes < config.category_routes"""
+    if tier not in TIERS:
+        raise RoutingError(f"Unknown tier '{tier}'; expected one of {list(TIERS)}")
+    settings: Dict[str, Any] = {name: getattr(config, name) for name in ROUTE_FIELDS}
+    settings.update(config.tier_routes.get(tier, {}))
+    if category is not None:
+        settings.update(config.category_routes.get(category, {}).get(tier, {}))
+    return TierRoute(tier=tier, **settings)
+
+
+def resolve_routes(config, category: Optional[str] = None) -> Dict[str, TierRoute]:
+    """Route of every tier for a category"""
+    return {tier: resolve_route(config, tier, category) for tier in TIERS}
+
+
+def model_pricing(config, model_id: str) -> ModelPricing:
+    """Prices of a model; unknown models use the config's prices"""
+    return MODEL_PRICING.get(model_id) or ModelPricing(
+        config.input_cost_per_1k_tokens,
+        config.output_cost_per_1k_tokens,
+        config.cache_read_cost_per_1k_tokens,
+        config.cache_write_cost_per_1k_tokens,
+    )
+
+
+def min_cache_tokens(model_id: str) -> int:
+    """Minimum tokens a model needs before a cache checkpoint to cache anything"""
+    return MIN_CACHE_TOKENS.get(model_id, DEFAULT_MIN_CACHE_TOKENS)
+
+
+def load_routes(path: Path) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Dict[str, Any]]]]:
+    """
+    Read (tier_routes, category_routes) from a JSON file of the form
+
+        {"tiers": {"tier1": {"model_id": "amazon.nova-pro-v1:0"}},
+         "categories": {"food": {"tier3": {"max_tokens": 1024}}}}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        routes = json.load(f)
+    unknown = set(routes) - {"tiers", "categories"}
+    if unknown:
+        raise RoutingError(f"{path}: unknown keys {sorted(unknown)}; expected 'tiers' and 'categories'")
+    tier_routes = routes.get("tiers", {})
+    category_routes = routes.get("categories", {})
+    validate_routes(tier_routes)
+    for category, overrides in category_routes.items():
+        validate_routes(overrides, where=f"category '{category}'")
+    return tier_routes, category_routes
+
+
+def validate_routes(overrides: Dict[str, Dict[str, Any]], where: str = "routes"):
+    """Reject unknown tiers and settings in a tier -> overrides mapping"""
+    for tier, settings in overrides.items():
+        if tier not in TIERS:
+            raise RoutingError(f"{where}: unknown tier '{tier}'; expected one of {list(TIERS)}")
+        unknown = set(settings) - set(ROUTE_FIELDS)
+        if unknown:
+            raise RoutingError(f"{where}: unknown {tier} settings {sorted(unknown)}; expected {list(ROUTE_FIELDS)}")
+
+
+class RoutingError(ValueError):
+    """Raised when a route override is malformed"""
+    pass
@@ -0,0 +1,118 @@
+"""
+Deadline-aware scheduling for generation runs
+
+With a deadline, work is ordered breadth-first across Tier 1 branches, so
+every branch gets its first Tier 3 item before any branch gets its second.
+A call is only started if the remaining time covers the latency observed
+so far (p90 by default). A run cut off by its batch window therefore ends
+with even coverage and no half-finished calls, and can be resumed from its
+checkpoints.
+"""
+
+import re
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
+
+from lib.telemetry import CallTelemetry, percentile
+
+T = TypeVar("T")
+
+_DURATION_PATTERN = re.compile(r"^(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m)?(?:(\d+(?:\.\d+)?)s?)?$")
+
+
+class DeadlineScheduler:
+    """
+    Admission control for model calls under a wall-clock deadline.
+
+    Args:
+        deadline: Deadline as a Unix timestamp
+        telemetry: Call telemetry of the client, used for observed latencies
+        default_latency_s: Expected call latency before any call has completed
+        latency_percentile: Percentile of observed latencies a call must fit in
+        clock: Time source (time.time)
+    """
+
+    def __init__(
+        self,
+        deadline: float,
+        telemetry: CallTelemetry,
+        default_latency_s: float = 20.0,
+        latency_percentile: float = 90.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.deadline = deadline
+        self.telemetry = telemetry
+        self.default_latency_s = default_latency_s
+        self.latency_percentile = latency_percentile
+        self.clock = clock
+
+    def remaining(self) -> float:
+        """Seconds until the deadline (negative once passed)"""
+        return self.deadline - self.clock()
+
+    def expected_latency(self, stage: str) -> float:
+        """Observed latency percentile of the stage, else of all stages, else the default"""
+        latencies = self.telemetry.latencies(stage) or self.telemetry.latencies()
+        if not latencies:
+            return self.default_latency_s
+        return percentile(latencies, self.latency_percentile)
+
+    def can_start(self, stage: str, extra_s: float = 0.0) -> bool:
+        """Whether a call of this stage (after waiting extra_s) is expected to finish in time"""
+        return self.remaining() >= self.expected_latency(stage) + extra_s
+
+
+def breadth_first(
+    items: Sequence[T],
+    branch: Callable[[T], Hashable],
+    covered: Optional[Dict[Hashable, int]] = None,
+) -> List[T]:
+    """
+    Order items round-robin across branches, keeping their order within a branch.
+
+    Args:
+        items: Items in their original order
+        branch: Branch key of an item (e.g. its Tier 1 name)
+        covered: Items per branch already done, so resumed runs favour the
+            branches with the least coverage first
+    """
+    depth = Counter(covered or {})
+    keyed = []
+    for index, item in enumerate(items):
+        key = branch(item)
+        keyed.append((depth[key], index, item))
+        depth[key] += 1
+    return [item for _, _, item in sorted(keyed, key=lambda entry: entry[:2])]
+
+
+def parse_duration(text: str) -> float:
+    """Parse a time budget such as "5400", "90m", "1h30m" or "45s" into seconds"""
+    match = _DURATION_PATTERN.match(text.strip().lower())
+    if not text.strip() or not match or not any(match.groups()):
+        raise ValueError(f"Invalid duration: {text!r} (use e.g. 5400, 90m, 1h30m)")
+    hours, minutes, seconds = (float(group) if group else 0.0 for group in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def parse_deadline(text: str, now: Optional[datetime] = None) -> float:
+    """
+    Parse a deadline into a Unix timestamp.
+
+    Accepts an ISO 8601 date-time ("2025-06-01T06:00", local time unless an
+    offset is given) or a local time of day ("06:00"), which means its next
+    occurrence.
+    """
+    now = now or datetime.now()
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            clock_time = datetime.strptime(text, "%H:%M").time()
+        except ValueError:
+            raise ValueError(f"Invalid deadline: {text!r} (use e.g. 06:00 or 2025-06-01T06:00)") from None
+        moment = datetime.combine(now.date(), clock_time)
+        if moment <= now:
+            moment += timedelta(days=1)
+    return moment.timestamp()
@@ -1,25 +1,166 @@
-import boto3
+import json
+import logging
 import os
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# SSM GetParameters accepts at most 10 names per request
+SSM_BATCH_SIZE = 10
+
 
 class SecretHandler:
+    """
+    Secret lookup with a pluggable provider and optional encrypted disk cache.
+
+    The provider is chosen with AFLEAU_SECRET_PROVIDER:
+      - "ssm" (default): AWS SSM Parameter Store, fetched in batches
+      - "env": environment variables named after the secret key
+      - "file": a JSON object of key/value pairs at AFLEAU_SECRETS_FILE
+
+    For the SSM provider, setting AFLEAU_SECRET_CACHE_KEY to a Fernet key
+    enables an encrypted on-disk cache (AFLEAU_SECRET_CACHE_FILE, entries
+    expire after AFLEAU_SECRET_CACHE_TTL seconds) so short-lived scripts skip
+    SSM entirely. The disk cache needs the optional ``cryptography`` package.
+    """
     _client = None
     _cache = {}
 
     @classmethod
     def _get_client(cls):
         if cls._client is None:
+            import boto3  # Deferred so non-SSM providers never pay for the import
+
             region_name = os.getenv("AWS_REGION_NAME", "us-east-1")
             cls._client = boto3.client("ssm", region_name=region_name)
         return cls._client
 
     @classmethod
     def get_secret_value(cls, secret_key):
-        if secret_key in cls._cache:
-            return cls._cache[secret_key]
+        return cls.get_secret_values([secret_key])[secret_key]
+
+    @classmethod
+    def get_secret_values(cls, secret_keys):
+        """
+        Get several secrets at once, fetching only the ones not yet cached.
+
+        Returns:
+            Dictionary of secret key to value
+
+        Raises:
+            KeyError: If the provider does not know one of the keys
+        """
+        missing = [key for key in dict.fromkeys(secret_keys) if key not in cls._cache]
+        if missing:
+            provider = os.getenv("AFLEAU_SECRET_PROVIDER", "ssm").lower()
+            if provider == "env":
+                fetched = cls._fetch_from_env(missing)
+            elif provider == "file":
+                fetched = cls._fetch_from_file(missing)
+            elif provider == "ssm":
+                fetched = cls._fetch_from_ssm(missing)
+            else:
+                raise ValueError(f"Invalid AFLEAU_SECRET_PROVIDER: {provider}. Must be 'ssm', 'env' or 'file'")
+            cls._cache.update(fetched)
+
+        return {key: cls._cache[key] for key in secret_keys}
+
+    @staticmethod
+    def _fetch_from_env(secret_keys):
+        missing = [key for key in secret_keys if key not in os.environ]
+        if missing:
+            raise KeyError(f"Secrets not set in environment: {missing}")
+        return {key: os.environ[key] for key in secret_keys}
+
+    @staticmethod
+    def _fetch_from_file(secret_keys):
+        secrets_file = Path(os.getenv("AFLEAU_SECRETS_FILE", "secrets.local.json"))
+        with open(secrets_file, "r", encoding="utf-8") as f:
+            secrets = json.load(f)
+
+        missing = [key for key in secret_keys if key not in secrets]
+        if missing:
+            raise KeyError(f"Secrets not found in {secrets_file}: {missing}")
+        return {key: secrets[key] for key in secret_keys}
+
+    @classmethod
+    def _fetch_from_ssm(cls, secret_keys):
+        disk_cache = _DiskCache.from_env()
+        fetched = disk_cache.load(secret_keys) if disk_cache else {}
+
+        remaining = [key for key in secret_keys if key not in fetched]
+        if remaining:
+            client = cls._get_client()
+            for start in range(0, len(remaining), SSM_BATCH_SIZE):
+                names = remaining[start:start + SSM_BATCH_SIZE]
+                response = client.get_parameters(Names=names, WithDecryption=True)
+                if response.get("InvalidParameters"):
+                    raise KeyError(f"SSM parameters not found: {response['InvalidParameters']}")
+                for parameter in response["Parameters"]:
+                    fetched[parameter["Name"]] = parameter["Value"]
+
+            if disk_cache:
+                disk_cache.store({key: fetched[key] for key in remaining})
+
+        return fetched
+
+
+class _DiskCache:
+    """Fernet-encrypted secret cache file with per-entry expiry"""
+
+    def __init__(self, path, fernet, ttl):
+        self.path = Path(path)
+        self.fernet = fernet
+        self.ttl = ttl
+
+    @classmethod
+    def from_env(cls):
+        key = os.getenv("AFLEAU_SECRET_CACHE_KEY")
+        if not key:
+            return None
+
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            logger.warning("AFLEAU_SECRET_CACHE_KEY is set but cryptography is not installed; secret disk cache disabled")
+            return None
+
+        path = os.getenv("AFLEAU_SECRET_CACHE_FILE", str(Path.home() / ".cache" / "afleau" / "secrets.bin"))
+        ttl = int(os.getenv("AFLEAU_SECRET_CACHE_TTL", "3600"))
+        return cls(path, Fernet(key.encode()), ttl)
+
+    def _read(self):
+        from cryptography.fernet import InvalidToken
+
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.fernet.decrypt(self.path.read_bytes()))
+        except (InvalidToken, ValueError):
+            # Wrong key or corrupt file: treat as empty and overwrite on next store
+            return {}
+
+    def load(self, secret_keys):
+        now = time.time()
+        entries = self._read()
+        return {
+            key: entries[key]["value"]
+            for key in secret_keys
+            if key in entries and now - entries[key]["fetched_at"] < self.ttl
+        }
 
-        client = cls._get_client()        
-        response = client.get_parameter(Name=secret_key, WithDecryption=True)
-        secret_value = response["Parameter"]["Value"]
-        cls._cache[secret_key] = secret_value
+    def store(self, secrets):
+        now = time.time()
+        entries = {
+            key: entry for key, entry in self._read().items()
+            if now - entry["fetched_at"] < self.ttl
+        }
+        entries.update({key: {"value": value, "fetched_at": now} for key, value in secrets.items()})
 
-        return secret_value
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.fernet.encrypt(json.dumps(entries).encode()))
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,207 @@
+"""
+Shared seeds_posts SQL and row building for batch and streaming upserts
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+import psycopg
+from psycopg.rows import tuple_row
+
+
+UPSERT_SQL = """
+INSERT INTO afleau.seeds_posts (platform, raw_input, parsed_json, priority)
+VALUES (%(platform)s, %(raw_input)s, %(parsed_json)s::jsonb, %(priority)s)
+ON CONFLICT (platform, lower(btrim(raw_input)))
+DO UPDATE SET
+    parsed_json = COALESCE(EXCLUDED.parsed_json, afleau.seeds_posts.parsed_json),
+    priority    = GREATEST(afleau.seeds_posts.priority, COALESCE(EXCLUDED.priority, 0)),
+    updated_at  = now();
+"""
+
+# Variant for the normalized layout (migrations/001_seed_hierarchy.sql)
+NORMALIZED_UPSERT_SQL = """
+INSERT INTO afleau.seeds_posts (platform, raw_input, parsed_json, priority, tier1_id, tier2_id)
+VALUES (%(platform)s, %(raw_input)s, %(parsed_json)s::jsonb, %(priority)s, %(tier1_id)s, %(tier2_id)s)
+ON CONFLICT (platform, lower(btrim(raw_input)))
+DO UPDATE SET
+    parsed_json = COALESCE(EXCLUDED.parsed_json, afleau.seeds_posts.parsed_json),
+    priority    = GREATEST(afleau.seeds_posts.priority, COALESCE(EXCLUDED.priority, 0)),
+    tier1_id    = COALESCE(EXCLUDED.tier1_id, afleau.seeds_posts.tier1_id),
+    tier2_id    = COALESCE(EXCLUDED.tier2_id, afleau.seeds_posts.tier2_id),
+    updated_at  = now();
+"""
+
+# The no-op DO UPDATE makes RETURNING yield ids for existing rows too
+TIER1_UPSERT_SQL = """
+INSERT INTO afleau.seed_tier1 (category, name)
+SELECT * FROM unnest(%(categories)s::text[], %(names)s::text[])
+ON CONFLICT (category, name) DO UPDATE SET name = EXCLUDED.name
+RETURNING id, category, name;
+"""
+
+TIER2_UPSERT_SQL = """
+INSERT INTO afleau.seed_tier2 (tier1_id, name)
+SELECT * FROM unnest(%(tier1_ids)s::int[], %(names)s::text[])
+ON CONFLICT (tier1_id, name) DO UPDATE SET name = EXCLUDED.name
+RETURNING id, tier1_id, name;
+"""
+
+
+def in_schema(query: str, schema: str) -> str:
+    """Point one of the afleau.* statements above at another schema, e.g. a benchmark's scratch copy"""
+    return query.replace("afleau.", f"{schema}.")
+
+
+def build_seed_rows(
+    seeds: Iterable[Dict[str, Any]],
+    platform: str,
+    default_priority: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Build seeds_posts parameter rows from seed dictionaries.
+
+    Each seed item should look like:
+      {
+        "category": "health_wellbeing",
+        "tier1_name": "Fitness",
+        "tier2_name": "Yoga",
+        "seed_text": "beginner yoga for flexibility"
+      }
+    """
+    rows = []
+    for s in seeds:
+        seed_text = (s.get("seed_text") or s.get("text") or "").strip()
+        if not seed_text:
+            continue
+
+        category = (s.get("category") or "").strip() or None
+        tier1_name = (s.get("tier1_name") or "").strip() or None
+        tier2_name = (s.get("tier2_name") or "").strip() or None
+        priority = s.get("priority", default_priority)
+
+        # Build parsed_json with category hierarchy
+        parsed_json = {}
+        if category:
+            parsed_json["category"] = category
+        if tier1_name:
+            parsed_json["tier1_name"] = tier1_name
+        if tier2_name:
+            parsed_json["tier2_name"] = tier2_name
+
+        rows.append(
+            {
+                "platform": platform,
+                "raw_input": seed_text,
+                "parsed_json": psycopg.types.json.Json(parsed_json) if parsed_json else None,
+                "priority": int(priority) if priority is not None else default_priority,
+            }
+        )
+
+    return rows
+
+
+def conflict_key(platform: str, raw_input: str) -> Tuple[str, str]:
+    """
+    Canonicalize a row the same way as the seeds_posts unique index.
+
+    Mirrors ``(platform, lower(btrim(raw_input)))``; note that Postgres
+    ``btrim`` without a character list only strips spaces.
+    """
+    return (platform, raw_input.strip(" ").lower())
+
+
+def dedupe_rows(rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Collapse rows that hit the same conflict key within one batch.
+
+    Duplicates are merged with the same rules as the ON CONFLICT clause,
+    applied in file order: a later non-NULL parsed_json replaces an earlier
+    one and priority keeps GREATEST(priority, COALESCE(new priority, 0)).
+    The first row's raw_input is kept, as the database keeps the existing one.
+
+    Returns:
+        Tuple of (deduplicated rows in first-seen order, number of rows collapsed)
+    """
+    merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for row in rows:
+        key = conflict_key(row["platform"], row["raw_input"])
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = dict(row)
+            continue
+
+        if row["parsed_json"] is not None:
+            existing["parsed_json"] = row["parsed_json"]
+        existing["priority"] = max(existing["priority"] or 0, row["priority"] or 0)
+
+    return list(merged.values()), len(rows) - len(merged)
+
+
+def order_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort rows by conflict key so concurrent writers lock rows in the same order"""
+    return sorted(rows, key=lambda row: conflict_key(row["platform"], row["raw_input"]))
+
+
+def attach_hierarchy_ids(
+    conn: psycopg.Connection,
+    rows: List[Dict[str, Any]],
+    schema: str = "afleau",
+) -> List[Dict[str, Any]]:
+    """
+    Load the Tier 1/Tier 2 dimension rows used by a batch and link seeds to them.
+
+    Each distinct (category, tier1_name) and (tier1, tier2_name) pair is
+    upserted once with a single unnest() statement per table. Rows whose
+    hierarchy resolves to a Tier 1 id get tier1_id/tier2_id set and their
+    parsed_json dropped; rows without a category or Tier 1 keep parsed_json.
+    The dimension tables are looked up in ``schema``.
+
+    Returns:
+        New row dictionaries ready for NORMALIZED_UPSERT_SQL
+    """
+    hierarchies = [
+        row["parsed_json"].obj if row["parsed_json"] is not None else {}
+        for row in rows
+    ]
+
+    tier1_keys = sorted({
+        (h["category"], h["tier1_name"])
+        for h in hierarchies if h.get("category") and h.get("tier1_name")
+    })
+    tier1_ids: Dict[Tuple[str, str], int] = {}
+    tier2_ids: Dict[Tuple[int, str], int] = {}
+
+    with conn.cursor(row_factory=tuple_row) as cur:
+        if tier1_keys:
+            cur.execute(in_schema(TIER1_UPSERT_SQL, schema), {
+                "categories": [category for category, _ in tier1_keys],
+                "names": [name for _, name in tier1_keys],
+            })
+            tier1_ids = {(category, name): tier1_id for tier1_id, category, name in cur.fetchall()}
+
+        tier2_keys = sorted({
+            (tier1_ids[(h["category"], h["tier1_name"])], h["tier2_name"])
+            for h in hierarchies
+            if (h.get("category"), h.get("tier1_name")) in tier1_ids and h.get("tier2_name")
+        })
+        if tier2_keys:
+            cur.execute(in_schema(TIER2_UPSERT_SQL, schema), {
+                "tier1_ids": [tier1_id for tier1_id, _ in tier2_keys],
+                "names": [name for _, name in tier2_keys],
+            })
+            tier2_ids = {(tier1_id, name): tier2_id for tier2_id, tier1_id, name in cur.fetchall()}
+
+    normalized = []
+    for row, h in zip(rows, hierarchies):
+        tier1_id = tier1_ids.get((h.get("category"), h.get("tier1_name")))
+        if tier1_id is None:
+            normalized.append({**row, "tier1_id": None, "tier2_id": None})
+            continue
+        normalized.append({
+            **row,
+            "parsed_json": None,
+            "tier1_id": tier1_id,
+            "tier2_id": tier2_ids.get((tier1_id, h.get("tier2_name"))),
+        })
+
+    return normalized
@@ -0,0 +1,42 @@
+"""
+Deterministic sharding of Tier 3 work across hosts
+
+Tier 2 items are assigned to shards by a stable hash of (category,
+platform, tier1, tier2), so every host computes the same partition without
+coordination. Tier 1 and Tier 2 are generated once beforehand
+(--prepare-shards) and shared, because two hosts generating them
+independently would get different hierarchies.
+"""
+
+import hashlib
+from typing import Tuple
+
+# Shard-local outputs live in {output_dir}/shards/shard_{i}_of_{N}/
+SHARDS_DIRNAME = "shards"
+
+
+def shard_of(category: str, platform: str, tier1_name: str, tier2_name: str, shard_count: int) -> int:
+    """Shard index (0-based) of a Tier 2 item; stable across hosts and Python versions"""
+    key = "\x1f".join((category, platform, tier1_name, tier2_name)).encode("utf-8")
+    return int.from_bytes(hashlib.sha1(key).digest()[:8], "big") % shard_count
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """Parse "i/N" (0 <= i < N) into (index, count)"""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {text!r} (use INDEX/COUNT, e.g. 0/4)") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard: {text!r} (INDEX must be between 0 and COUNT - 1)")
+    return index, count
+
+
+def shard_dir_name(index: int, count: int) -> str:
+    """Directory of one shard's outputs, relative to the canonical output directory"""
+    return f"{SHARDS_DIRNAME}/shard_{index}_of_{count}"
+
+
+class ShardingError(Exception):
+    """Raised when shard preparation or merging cannot proceed"""
+    pass
@@ -0,0 +1,220 @@
+"""
+Per-call telemetry for Bedrock invocations and the end-of-run report
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [100, 250, 500, 1000, 2000, 5000, 10000, 30000]
+
+# Error codes that Bedrock uses for rate limiting
+THROTTLE_ERROR_CODES = {"ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException"}
+
+
+@dataclass
+class CallRecord:
+    """One model invocation attempt"""
+    model_id: str
+    stage: str
+    category: str
+    attempt: int
+    latency_s: float
+    outcome: str  # "ok", "throttled", "error" or "parse_failure"
+    input_tokens: int = 0  # Uncached input tokens
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0  # Input tokens served from the prompt cache
+    cache_write_input_tokens: int = 0  # Input tokens written to the prompt cache
+    tags: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """On-demand USD per 1,000 tokens of one model"""
+    input_per_1k: float
+    output_per_1k: float
+    cache_read_per_1k: float
+    cache_write_per_1k: float
+
+    def cost(self, record: CallRecord) -> float:
+        return (
+            estimate_cost(record.input_tokens, record.output_tokens, self.input_per_1k, self.output_per_1k)
+            + record.cache_read_input_tokens / 1000 * self.cache_read_per_1k
+            + record.cache_write_input_tokens / 1000 * self.cache_write_per_1k
+        )
+
+
+class CallTelemetry:
+    """Collects CallRecords for a run"""
+
+    def __init__(self):
+        self.records: List[CallRecord] = []
+
+    def record(self, record: CallRecord) -> CallRecord:
+        self.records.append(record)
+        return record
+
+    def latencies(self, stage: Optional[str] = None, outcome: str = "ok") -> List[float]:
+        """Latencies in seconds of calls with the given outcome, optionally for one stage"""
+        return [
+            r.latency_s for r in self.records
+            if r.outcome == outcome and (stage is None or r.stage == stage)
+        ]
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0-100) of values, or None if empty"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_histogram(latencies_ms: List[float]) -> Dict[str, int]:
+    """Bucket latencies into LATENCY_BUCKETS_MS, keyed by bucket upper bound"""
+    buckets = {f"le_{bound}": 0 for bound in LATENCY_BUCKETS_MS}
+    buckets["gt_max"] = 0
+    for latency in latencies_ms:
+        for bound in LATENCY_BUCKETS_MS:
+            if latency <= bound:
+                buckets[f"le_{bound}"] += 1
+                break
+        else:
+            buckets["gt_max"] += 1
+    return buckets
+
+
+def estimate_cost(input_tokens: int, output_tokens: int, input_cost_per_1k: float, output_cost_per_1k: float) -> float:
+    """Estimated on-demand cost in USD"""
+    return input_tokens / 1000 * input_cost_per_1k + output_tokens / 1000 * output_cost_per_1k
+
+
+def cache_token_summary(records: List[CallRecord]) -> Dict[str, Any]:
+    """Cached vs uncached input tokens of call records"""
+    uncached = sum(r.input_tokens for r in records)
+    cache_read = sum(r.cache_read_input_tokens for r in records)
+    cache_write = sum(r.cache_write_input_tokens for r in records)
+    total = uncached + cache_read + cache_write
+    return {
+        "uncached_input_tokens": uncached,
+        "cache_read_input_tokens": cache_read,
+        "cache_write_input_tokens": cache_write,
+        "cached_input_share": round(cache_read / total, 4) if total else None,
+    }
+
+
+def build_run_report(
+    records: List[CallRecord],
+    surviving_seeds: int,
+    input_cost_per_1k: float,
+    output_cost_per_1k: float,
+    extra: Optional[Dict[str, Any]] = None,
+    cache_read_cost_per_1k: Optional[float] = None,
+    cache_write_cost_per_1k: Optional[float] = None,
+    model_pricing: Optional[Dict[str, ModelPricing]] = None,
+) -> Dict[str, Any]:
+    """
+    Summarize call records into a JSON-serializable run report.
+
+    Latency percentiles and histograms only include successful calls; token
+    totals and cost include every attempt, since failed parses are billed too.
+
+    Args:
+        records: Call records of the run
+        surviving_seeds: Tier 3 seeds kept after filtering in this run
+        input_cost_per_1k: USD per 1,000 input tokens
+        output_cost_per_1k: USD per 1,000 output tokens
+        extra: Additional top-level fields (e.g. category and platform)
+        cache_read_cost_per_1k: USD per 1,000 input tokens read from the prompt cache (default: input price)
+        cache_write_cost_per_1k: USD per 1,000 input tokens written to the prompt cache (default: input price)
+        model_pricing: Prices per model ID; models not listed use the prices above
+    """
+    default_pricing = ModelPricing(
+        input_cost_per_1k,
+        output_cost_per_1k,
+        input_cost_per_1k if cache_read_cost_per_1k is None else cache_read_cost_per_1k,
+        input_cost_per_1k if cache_write_cost_per_1k is None else cache_write_cost_per_1k,
+    )
+    model_pricing = model_pricing or {}
+
+    def cost(selected: List[CallRecord]) -> float:
+        return round(sum(model_pricing.get(r.model_id, default_pricing).cost(r) for r in selected), 6)
+
+    by_stage: Dict[str, List[CallRecord]] = defaultdict(list)
+    for record in records:
+        by_stage[record.stage].append(record)
+
+    stages = {}
+    for stage, stage_records in sorted(by_stage.items()):
+        outcomes: Dict[str, int] = defaultdict(int)
+        for record in stage_records:
+            outcomes[record.outcome] += 1
+        latencies_ms = [r.latency_s * 1000 for r in stage_records if r.outcome == "ok"]
+        output_sizes = [r.output_tokens for r in stage_records if r.outcome in ("ok", "parse_failure")]
+        input_tokens = sum(r.input_tokens for r in stage_records)
+        output_tokens = sum(r.output_tokens for r in stage_records)
+        stages[stage] = {
+            "attempts": len(stage_records),
+            "outcomes": dict(outcomes),
+            "retries": sum(1 for r in stage_records if r.attempt > 1),
+            "latency_ms": {
+                "p50": percentile(latencies_ms, 50),
+                "p95": percentile(latencies_ms, 95),
+                "p99": percentile(latencies_ms, 99),
+                "max": max(latencies_ms) if latencies_ms else None,
+            },
+            "latency_histogram_ms": latency_histogram(latencies_ms),
+            "output_tokens_per_call": {
+                "p50": percentile(output_sizes, 50),
+                "p95": percentile(output_sizes, 95),
+                "p99": percentile(output_sizes, 99),
+                "max": max(output_sizes) if output_sizes else None,
+            },
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "prompt_cache": cache_token_summary(stage_records),
+            "estimated_cost_usd": cost(stage_records),
+        }
+
+    # One route per stage and model, so tiers can be compared across models
+    by_route: Dict[str, List[CallRecord]] = defaultdict(list)
+    for record in records:
+        by_route[f"{record.stage}:{record.model_id}"].append(record)
+    total_cost = cost(records)
+    routes = {}
+    for route, route_records in sorted(by_route.items()):
+        latencies_ms = [r.latency_s * 1000 for r in route_records if r.outcome == "ok"]
+        route_cost = cost(route_records)
+        routes[route] = {
+            "stage": route_records[0].stage,
+            "model_id": route_records[0].model_id,
+            "attempts": len(route_records),
+            "latency_ms": {"p50": percentile(latencies_ms, 50), "p95": percentile(latencies_ms, 95)},
+            "input_tokens": sum(r.input_tokens for r in route_records),
+            "output_tokens": sum(r.output_tokens for r in route_records),
+            "estimated_cost_usd": route_cost,
+            "cost_share": round(route_cost / total_cost, 4) if total_cost else None,
+        }
+
+    input_tokens = sum(r.input_tokens for r in records)
+    output_tokens = sum(r.output_tokens for r in records)
+    total_tokens = input_tokens + output_tokens
+    report = dict(extra or {})
+    report.update({
+        "attempts": len(records),
+        "throttled": sum(1 for r in records if r.outcome == "throttled"),
+        "parse_failures": sum(1 for r in records if r.outcome == "parse_failure"),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "prompt_cache": cache_token_summary(records),
+        "surviving_seeds": surviving_seeds,
+        "tokens_per_surviving_seed": round(total_tokens / surviving_seeds, 2) if surviving_seeds else None,
+        "estimated_cost_usd": total_cost,
+        "stages": stages,
+        "routes": routes,
+    })
+    return report
+
@@ -0,0 +1,16 @@
+"""
+Offline token estimates for prompts and responses
+
+Bedrock bills by model tokenizer counts, which are not available offline;
+~4 characters per token is close enough for English prompts and JSON to
+plan runs and compare prompt sizes.
+"""
+
+import math
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of text"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
@@ -0,0 +1,120 @@
+"""
+Opt-in OpenTelemetry tracing
+
+span() is a no-op until configure_tracing() is called, so instrumented code
+pays nothing by default and opentelemetry-sdk stays an optional dependency.
+Spans can be exported to an OTLP collector (needs
+opentelemetry-exporter-otlp-proto-http) or to a local JSON-lines file.
+"""
+
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_tracer = None
+_provider = None
+
+
+def configure_tracing(
+    exporter: str,
+    file_path: Optional[Path] = None,
+    endpoint: Optional[str] = None,
+    service_name: str = "seed-generation",
+):
+    """
+    Enable tracing for this process.
+
+    Args:
+        exporter: "otlp" or "file"
+        file_path: Output path for the "file" exporter
+        endpoint: OTLP/HTTP traces endpoint (defaults to the exporter's own default,
+            http://localhost:4318/v1/traces, or OTEL_EXPORTER_OTLP_* env vars)
+        service_name: service.name resource attribute
+
+    Raises:
+        RuntimeError: If the required OpenTelemetry packages are not installed
+    """
+    global _tracer, _provider
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError as e:
+        raise RuntimeError("Tracing requires the opentelemetry-sdk package") from e
+
+    if exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            raise RuntimeError("OTLP export requires the opentelemetry-exporter-otlp-proto-http package") from e
+        span_exporter = OTLPSpanExporter(endpoint=endpoint) if endpoint else OTLPSpanExporter()
+    elif exporter == "file":
+        span_exporter = _json_file_exporter(Path(file_path or "logs/traces.jsonl"))
+    else:
+        raise ValueError(f"Invalid trace exporter: {exporter}. Must be 'otlp' or 'file'")
+
+    _provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    _provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    _tracer = _provider.get_tracer("seed-generation")
+    logger.info(f"Tracing enabled with {exporter} exporter")
+
+
+def shutdown_tracing():
+    """Flush pending spans and disable tracing"""
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+@contextmanager
+def span(name: str, **attributes: Any):
+    """
+    Trace a block as a span, with None-valued attributes dropped.
+
+    Yields the span (or None when tracing is disabled) so callers can add
+    attributes known only at the end, e.g. outcome.
+    """
+    if _tracer is None:
+        yield None
+        return
+
+    clean = {key: value for key, value in attributes.items() if value is not None}
+    with _tracer.start_as_current_span(name, attributes=clean) as current:
+        yield current
+
+
+def set_attributes(current, **attributes: Any):
+    """Set attributes on a span yielded by span(); no-op when tracing is disabled"""
+    if current is not None:
+        for key, value in attributes.items():
+            if value is not None:
+                current.set_attribute(key, value)
+
+
+def _json_file_exporter(path: Path):
+    """Build a SpanExporter that appends one JSON object per span to path"""
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+    class JsonFileSpanExporter(SpanExporter):
+        def __init__(self):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock = threading.Lock()
+
+        def export(self, spans):
+            with self._lock, open(path, 'a', encoding='utf-8') as f:
+                for finished in spans:
+                    f.write(json.dumps(json.loads(finished.to_json())) + "\n")
+            return SpanExportResult.SUCCESS
+
+        def shutdown(self):
+            pass
+
+    return JsonFileSpanExporter()
@@ -13,15 +13,17 @@ def get_pg_conn_string(in_vpc=False, env='dev'):
     Returns:
         PostgreSQL connection string
     """
-    afleau_user = SecretHandler.get_secret_value("AFLEAU_PG_USER")
-    afleau_pass = SecretHandler.get_secret_value("AFLEAU_PG_PASS")
-    ip_key = "AFLEAU_PG_IP_PRIVATE" if in_vpc else "AFLEAU_PG_IP"
-    afleau_ip = SecretHandler.get_secret_value(ip_key)
-    
     # Validate env parameter
     if env not in ['dev', 'prod']:
         raise ValueError(f"Invalid env parameter: {env}. Must be 'dev' or 'prod'")
     
+    # Fetch all three secrets in one batched lookup
+    ip_key = "AFLEAU_PG_IP_PRIVATE" if in_vpc else "AFLEAU_PG_IP"
+    secrets = SecretHandler.get_secret_values(["AFLEAU_PG_USER", "AFLEAU_PG_PASS", ip_key])
+    afleau_user = secrets["AFLEAU_PG_USER"]
+    afleau_pass = secrets["AFLEAU_PG_PASS"]
+    afleau_ip = secrets[ip_key]
+    
     # Database name - currently the same for both environments
     db_name = "afleau"
     
@@ -0,0 +1,296 @@
+"""
+Shared job queue for --worker mode
+
+Item-level jobs (Tier 2 for a Tier 1 category, Tier 3 for a Tier 2 item)
+live in a queue table: PostgreSQL when workers run on many hosts, SQLite
+when they share one. A worker leases a job for a visibility timeout and
+extends the lease with heartbeats while its model call runs. If the worker
+dies (e.g. a reclaimed spot instance), the lease expires and the job goes
+to the next worker. Results are stored with the job and only accepted from
+the current lease holder, so every job completes exactly once; --collect
+writes them out as normal checkpoints and aggregates.
+
+Lease expiry compares timestamps taken on different hosts, so worker
+clocks must be synchronised (NTP) to well within the visibility timeout.
+"""
+
+import abc
+import json
+import sqlite3
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+STATUSES = (QUEUED, LEASED, DONE, FAILED)
+
+# Completing a job of the key's kind enqueues jobs of the value's kind
+FOLLOW_UP_KIND = {"tier2": "tier3"}
+
+SQLITE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS seedgen_jobs (
+        id               INTEGER PRIMARY KEY AUTOINCREMENT,
+        category         TEXT NOT NULL,
+        platform         TEXT NOT NULL,
+        kind             TEXT NOT NULL,
+        tier1_name       TEXT NOT NULL,
+        tier2_name       TEXT NOT NULL DEFAULT '',
+        status           TEXT NOT NULL DEFAULT 'queued',
+        attempts         INTEGER NOT NULL DEFAULT 0,
+        lease_token      TEXT,
+        leased_by        TEXT,
+        lease_expires_at REAL,
+        result           TEXT,
+        last_error       TEXT,
+        UNIQUE (category, platform, kind, tier1_name, tier2_name)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS seedgen_jobs_pending ON seedgen_jobs (category, platform, status, id)",
+)
+
+INSERT_SQL = """
+INSERT INTO {table} (category, platform, kind, tier1_name, tier2_name)
+VALUES (%s, %s, %s, %s, %s)
+ON CONFLICT (category, platform, kind, tier1_name, tier2_name) DO NOTHING
+"""
+
+# Queued jobs, and leased jobs whose worker stopped sending heartbeats
+SELECT_NEXT_SQL = """
+SELECT id, kind, tier1_name, tier2_name, attempts FROM {table}
+WHERE category = %s AND platform = %s
+  AND (status = 'queued' OR (status = 'leased' AND lease_expires_at < %s))
+ORDER BY id
+LIMIT 1
+"""
+
+LEASE_SQL = """
+UPDATE {table}
+SET status = 'leased', lease_token = %s, leased_by = %s, lease_expires_at = %s, attempts = attempts + 1
+WHERE id = %s
+"""
+
+HEARTBEAT_SQL = """
+UPDATE {table} SET lease_expires_at = %s
+WHERE id = %s AND lease_token = %s AND status = 'leased'
+"""
+
+COMPLETE_SQL = """
+UPDATE {table}
+SET status = 'done', result = %s, lease_token = NULL, lease_expires_at = NULL
+WHERE id = %s AND lease_token = %s AND status = 'leased'
+"""
+
+FAIL_SQL = """
+UPDATE {table}
+SET status = %s, last_error = %s, lease_token = NULL, lease_expires_at = NULL
+WHERE id = %s AND lease_token = %s AND status = 'leased'
+"""
+
+REQUEUE_FAILED_SQL = """
+UPDATE {table} SET status = 'queued', attempts = 0
+WHERE category = %s AND platform = %s AND status = 'failed'
+"""
+
+COUNTS_SQL = """
+SELECT status, COUNT(*) FROM {table}
+WHERE category = %s AND platform = %s
+GROUP BY status
+"""
+
+RESULTS_SQL = """
+SELECT tier1_name, tier2_name, result FROM {table}
+WHERE category = %s AND platform = %s AND kind = %s AND status = 'done'
+ORDER BY id
+"""
+
+
+@dataclass
+class Job:
+    """A leased job; tier2 jobs have an empty tier2_name"""
+    id: int
+    kind: str
+    tier1_name: str
+    tier2_name: str
+    attempts: int  # Including the current lease
+    lease_token: str
+
+
+class WorkQueue(abc.ABC):
+    """
+    Lease-based job queue for one category/platform run.
+
+    Subclasses provide _transaction(), a context manager yielding a cursor
+    inside a write transaction, plus the table name, parameter placeholder
+    and row-locking clause of their database.
+
+    Args:
+        category: Category the jobs belong to
+        platform: Platform the jobs belong to
+        clock: Time source for lease expiry (time.time)
+    """
+
+    table = "seedgen_jobs"
+    placeholder = "%s"
+    lock_clause = ""
+
+    def __init__(self, category: str, platform: str, clock: Callable[[], float] = time.time):
+        self.category = category
+        self.platform = platform
+        self.clock = clock
+
+    def enqueue(self, kind: str, items: Sequence[Tuple[str, str]]) -> int:
+        """Queue jobs for (tier1_name, tier2_name) items; existing jobs are left alone. Returns jobs added"""
+        with self._transaction() as cur:
+            return self._insert(cur, kind, items)
+
+    def lease(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        """Lease the oldest available job for visibility_timeout seconds, or None if there is none"""
+        now = self.clock()
+        with self._transaction() as cur:
+            cur.execute(self._sql(SELECT_NEXT_SQL + self.lock_clause), (self.category, self.platform, now))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            job_id, kind, tier1_name, tier2_name, attempts = row
+            token = uuid.uuid4().hex
+            cur.execute(self._sql(LEASE_SQL), (token, worker_id, now + visibility_timeout, job_id))
+        return Job(job_id, kind, tier1_name, tier2_name, attempts + 1, token)
+
+    def heartbeat(self, job: Job, visibility_timeout: float) -> bool:
+        """Extend the job's lease; False if the lease was lost to another worker"""
+        with self._transaction() as cur:
+            cur.execute(self._sql(HEARTBEAT_SQL), (self.clock() + visibility_timeout, job.id, job.lease_token))
+            return cur.rowcount == 1
+
+    def complete(self, job: Job, result: Any, follow_ups: Sequence[Tuple[str, str]] = ()) -> bool:
+        """
+        Store the job's result and queue its follow-up jobs in one transaction.
+
+        Returns False (and stores nothing) if the lease was lost in the meantime.
+        """
+        with self._transaction() as cur:
+            cur.execute(self._sql(COMPLETE_SQL), (json.dumps(result), job.id, job.lease_token))
+            if cur.rowcount != 1:
+                return False
+            if follow_ups:
+                self._insert(cur, FOLLOW_UP_KIND[job.kind], follow_ups)
+        return True
+
+    def fail(self, job: Job, error: str, max_attempts: int) -> str:
+        """Re-queue the job after an error, or mark it failed after max_attempts; returns the new status"""
+        status = FAILED if job.attempts >= max_attempts else QUEUED
+        with self._transaction() as cur:
+            cur.execute(self._sql(FAIL_SQL), (status, error, job.id, job.lease_token))
+        return status
+
+    def requeue_failed(self) -> int:
+        """Give failed jobs a fresh set of attempts; returns jobs re-queued"""
+        with self._transaction() as cur:
+            cur.execute(self._sql(REQUEUE_FAILED_SQL), (self.category, self.platform))
+            return max(cur.rowcount, 0)
+
+    def counts(self) -> Counter:
+        """Jobs per status (leases that have expired still count as leased)"""
+        with self._transaction() as cur:
+            cur.execute(self._sql(COUNTS_SQL), (self.category, self.platform))
+            counts = Counter({status: 0 for status in STATUSES})
+            counts.update(dict(cur.fetchall()))
+        return counts
+
+    def results(self, kind: str) -> List[Tuple[str, str, Any]]:
+        """(tier1_name, tier2_name, result) of every completed job of a kind, in queue order"""
+        with self._transaction() as cur:
+            cur.execute(self._sql(RESULTS_SQL), (self.category, self.platform, kind))
+            rows = cur.fetchall()
+        return [(tier1_name, tier2_name, json.loads(result)) for tier1_name, tier2_name, result in rows]
+
+    def close(self):
+        """Release database resources"""
+        pass
+
+    def _insert(self, cur, kind: str, items: Sequence[Tuple[str, str]]) -> int:
+        added = 0
+        for tier1_name, tier2_name in items:
+            cur.execute(self._sql(INSERT_SQL), (self.category, self.platform, kind, tier1_name, tier2_name))
+            added += max(cur.rowcount, 0)
+        return added
+
+    def _sql(self, query: str) -> str:
+        return query.format(table=self.table).replace("%s", self.placeholder)
+
+    @abc.abstractmethod
+    def _transaction(self) -> Iterator[Any]:
+        """Context manager yielding a cursor inside one committed transaction"""
+
+
+class SqliteWorkQueue(WorkQueue):
+    """Work queue in a SQLite file, for workers on a single host"""
+
+    placeholder = "?"
+
+    def __init__(self, path: Path, category: str, platform: str, clock: Callable[[], float] = time.time):
+        super().__init__(category, platform, clock)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.path) as conn:
+            # WAL lets workers read counts while another worker holds the write lock
+            conn.execute("PRAGMA journal_mode=WAL")
+        with self._transaction() as cur:
+            for statement in SQLITE_SCHEMA:
+                cur.execute(statement)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        # BEGIN IMMEDIATE takes the write lock up front, so two workers never select the same job
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn.cursor()
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+
+class PostgresWorkQueue(WorkQueue):
+    """
+    Work queue in afleau.seedgen_jobs (migrations/002_seedgen_jobs.sql), for workers on many hosts.
+
+    Workers lock candidate rows with FOR UPDATE SKIP LOCKED, so concurrent
+    leases never block on or hand out the same job.
+    """
+
+    table = "afleau.seedgen_jobs"
+    lock_clause = " FOR UPDATE SKIP LOCKED"
+
+    def __init__(
+        self,
+        conn_str: str,
+        category: str,
+        platform: str,
+        max_connections: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(category, platform, clock)
+        from psycopg_pool import ConnectionPool  # Deferred so SQLite queues never import psycopg
+        self.pool = ConnectionPool(conn_str, min_size=1, max_size=max_connections, open=True)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[Any]:
+        # The pool commits when the block succeeds and rolls back when it raises
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            yield cur
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,34 @@
+-- Normalized Tier 1 / Tier 2 dimension tables for afleau.seeds_posts
+--
+-- Seeds loaded with `scripts/upsert_to_pg.py --normalized` reference these
+-- tables through integer foreign keys instead of repeating category,
+-- tier1_name and tier2_name in every row's parsed_json.
+--
+-- Apply with: psql "$AFLEAU_PG_URL" -f migrations/001_seed_hierarchy.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS afleau.seed_tier1 (
+    id          serial PRIMARY KEY,
+    category    text NOT NULL,
+    name        text NOT NULL,
+    created_at  timestamptz NOT NULL DEFAULT now(),
+    UNIQUE (category, name)
+);
+
+CREATE TABLE IF NOT EXISTS afleau.seed_tier2 (
+    id          serial PRIMARY KEY,
+    tier1_id    integer NOT NULL REFERENCES afleau.seed_tier1 (id),
+    name        text NOT NULL,
+    created_at  timestamptz NOT NULL DEFAULT now(),
+    UNIQUE (tier1_id, name)
+);
+
+ALTER TABLE afleau.seeds_posts
+    ADD COLUMN IF NOT EXISTS tier1_id integer REFERENCES afleau.seed_tier1 (id),
+    ADD COLUMN IF NOT EXISTS tier2_id integer REFERENCES afleau.seed_tier2 (id);
+
+CREATE INDEX IF NOT EXISTS seeds_posts_tier1_id_idx ON afleau.seeds_posts (tier1_id);
+CREATE INDEX IF NOT EXISTS seeds_posts_tier2_id_idx ON afleau.seeds_posts (tier2_id);
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- Shared job queue for `scripts/generate_seeds.py --worker --queue-pg`
+--
+-- One row per item-level job (Tier 2 for a Tier 1 category, Tier 3 for a
+-- Tier 2 item). Workers lease rows with FOR UPDATE SKIP LOCKED and extend
+-- lease_expires_at (Unix seconds) with heartbeats; rows whose lease expired
+-- are handed to the next worker. See lib/work_queue.py.
+--
+-- Apply with: psql "$AFLEAU_PG_URL" -f migrations/002_seedgen_jobs.sql
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS afleau.seedgen_jobs (
+    id                bigserial PRIMARY KEY,
+    category          text NOT NULL,
+    platform          text NOT NULL,
+    kind              text NOT NULL,
+    tier1_name        text NOT NULL,
+    tier2_name        text NOT NULL DEFAULT '',
+    status            text NOT NULL DEFAULT 'queued',
+    attempts          integer NOT NULL DEFAULT 0,
+    lease_token       text,
+    leased_by         text,
+    lease_expires_at  double precision,
+    result            text,
+    last_error        text,
+    created_at        timestamptz NOT NULL DEFAULT now(),
+    UNIQUE (category, platform, kind, tier1_name, tier2_name)
+);
+
+CREATE INDEX IF NOT EXISTS seedgen_jobs_pending
+    ON afleau.seedgen_jobs (category, platform, status, id);
+
+COMMIT;
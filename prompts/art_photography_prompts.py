@@ -3,149 +3,68 @@ Prompt templates for Art & Photography data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Art & Photography domains. Generate a comprehensive list of broad categories that cover the entire spectrum of art and photography topics.
-
-TASK: Create 12-15 broad Tier 1 categories for Art & Photography that are:
-- Comprehensive and cover major art and photography areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to general audience seeking art and photography information
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly technical or academic terminology
-- Focus on accessible, popular art and photography categories
-- Include both traditional and digital art
-- Cover different photography styles and artistic mediums
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Photography",
-    "Digital Art",
-    "Painting"
-  ]
-}
-
-Generate exactly 12-15 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Art & Photography domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 8-12 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, practical art and photography topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Portrait Photography",
-    "Landscape Photography",
-    "Street Photography"
-  ]
-}}
-
-Generate exactly 8-12 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Art & Photography content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 10-15 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different styles and techniques
-- Cover different contexts (tutorials, tips, inspiration, gear reviews, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "portrait photography tips",
-    "how to take better portraits",
-    "portrait photography lighting",
-    "portrait photography camera settings",
-    "portrait photography editing"
-  ]
-}}
-
-Generate exactly 10-15 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Art & Photography content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 10-15 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and creative-focused
-- Include popular hashtag variations
-- Cover different contexts (tips, inspiration, behind the scenes, etc.)
-- Include quick tips and visual content-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and creative inspiration
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "photography tips",
-    "art inspiration",
-    "creative ideas",
-    "photo editing",
-    "art tutorials"
-  ]
-}}
-
-Generate exactly 10-15 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
-
+from prompts.base import BASE_SPEC, bullets, json_items
+
+
+SPEC = BASE_SPEC.extend(
+    category="art_photography",
+    values={
+        "domain": "Art & Photography",
+        "tier1_scope": "art and photography",
+        "tier1_count": "12-15",
+        "tier1_areas": "art and photography",
+        "tier1_audience": "general audience seeking art and photography information",
+        "tier1_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on accessible, popular art and photography categories",
+            "Include both traditional and digital art",
+            "Cover different photography styles and artistic mediums",
+        ),
+        "tier1_examples": json_items(
+            "Photography",
+            "Digital Art",
+            "Painting",
+        ),
+        "tier2_count": "8-12",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, practical art and photography topics",
+        ),
+        "tier2_examples": json_items(
+            "Portrait Photography",
+            "Landscape Photography",
+            "Street Photography",
+        ),
+        "tier3_count": "10-15",
+        "youtube_traits": bullets(
+            "Include different styles and techniques",
+            "Cover different contexts (tutorials, tips, inspiration, gear reviews, etc.)",
+        ),
+        "youtube_examples": json_items(
+            "portrait photography tips",
+            "how to take better portraits",
+            "portrait photography lighting",
+            "portrait photography camera settings",
+            "portrait photography editing",
+        ),
+        "instagram_traits": bullets(
+            "Visual and creative-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (tips, inspiration, behind the scenes, etc.)",
+            "Include quick tips and visual content-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and creative inspiration"),
+        "instagram_examples": json_items(
+            "photography tips",
+            "art inspiration",
+            "creative ideas",
+            "photo editing",
+            "art tutorials",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
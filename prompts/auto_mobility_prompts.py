@@ -3,146 +3,66 @@ Prompt templates for Auto & Mobility data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Auto & Mobility domains. Generate a comprehensive list of broad categories that cover the entire spectrum of automotive and transportation topics.
-
-TASK: Create 8-12 broad Tier 1 categories for Auto & Mobility that are:
-- Comprehensive and cover major automotive/transportation areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to general audience seeking automotive information
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly technical or academic terminology
-- Focus on accessible, practical automotive categories
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Vehicle Maintenance",
-    "Driving Skills",
-    "Car Buying"
-  ]
-}
-
-Generate exactly 8-12 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Auto & Mobility domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 5-8 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, practical automotive topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Oil Changes",
-    "Tire Care",
-    "Engine Maintenance"
-  ]
-}}
-
-Generate exactly 5-8 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Auto & Mobility content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 6-10 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different skill levels (beginner, intermediate, advanced)
-- Cover different contexts (DIY, professional, emergency, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "car maintenance tips",
-    "DIY oil change guide",
-    "tire pressure check",
-    "engine troubleshooting basics",
-    "car cleaning hacks"
-  ]
-}}
-
-Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Auto & Mobility content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 6-10 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and car-focused
-- Include popular hashtag variations
-- Cover different contexts (tips, inspiration, reviews, etc.)
-- Include quick tips and visual content-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and car inspiration
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "car maintenance",
-    "auto tips",
-    "car care",
-    "vehicle hacks",
-    "car inspiration"
-  ]
-}}
-
-Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
+from prompts.base import BASE_SPEC, bullets, json_items
+
+
+SPEC = BASE_SPEC.extend(
+    category="auto_mobility",
+    values={
+        "domain": "Auto & Mobility",
+        "tier1_scope": "automotive and transportation",
+        "tier1_count": "8-12",
+        "tier1_areas": "automotive/transportation",
+        "tier1_audience": "general audience seeking automotive information",
+        "tier1_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on accessible, practical automotive categories",
+        ),
+        "tier1_examples": json_items(
+            "Vehicle Maintenance",
+            "Driving Skills",
+            "Car Buying",
+        ),
+        "tier2_count": "5-8",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, practical automotive topics",
+        ),
+        "tier2_examples": json_items(
+            "Oil Changes",
+            "Tire Care",
+            "Engine Maintenance",
+        ),
+        "tier3_count": "6-10",
+        "youtube_traits": bullets(
+            "Include different skill levels (beginner, intermediate, advanced)",
+            "Cover different contexts (DIY, professional, emergency, etc.)",
+        ),
+        "youtube_examples": json_items(
+            "car maintenance tips",
+            "DIY oil change guide",
+            "tire pressure check",
+            "engine troubleshooting basics",
+            "car cleaning hacks",
+        ),
+        "instagram_traits": bullets(
+            "Visual and car-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (tips, inspiration, reviews, etc.)",
+            "Include quick tips and visual content-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and car inspiration"),
+        "instagram_examples": json_items(
+            "car maintenance",
+            "auto tips",
+            "car care",
+            "vehicle hacks",
+            "car inspiration",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
@@ -0,0 +1,145 @@
+"""
+Shared base spec that every category's prompt spec extends
+
+The base templates hold the sections every category shares: the task and
+requirement lines common to all categories, the JSON output formats and the
+closing instructions. A category fills in its own parts through the spec's
+values (domain name, item counts, category-specific bullet lines, example
+items, optional safety guidelines), or overrides a whole template where its
+wording departs from the shared one.
+"""
+
+from lib.prompt_spec import PromptSpec
+
+# Tier 1 Prompt Template
+TIER_1_PROMPT = """You are an expert in {domain} domains. Generate a comprehensive list of broad categories that cover the entire spectrum of {tier1_scope} topics.
+
+TASK: Create {tier1_count} broad Tier 1 categories for {domain} that are:
+- Comprehensive and cover major {tier1_areas} areas
+- Mutually exclusive (minimal overlap)
+- Broad enough to contain multiple sub-topics
+- Relevant to {tier1_audience}
+
+REQUIREMENTS:
+- Each category should have a clear, descriptive name
+{tier1_requirements}{tier1_guidelines}
+
+Return ONLY valid JSON in this exact format:
+
+{{
+  "tier1_categories": [
+{tier1_examples}
+  ]
+}}
+
+Generate exactly {tier1_count} categories. Return ONLY the JSON, no additional text."""
+
+# Tier 2 Prompt Template
+TIER_2_PROMPT = """You are an expert in {domain} domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
+
+TASK: Create {tier2_count} specific Tier 2 items for the category "{tier1_name}" that are:
+- Specific practices, methods, or sub-areas within the category
+- Popular and commonly searched topics
+- Accessible to general audience
+- Distinct from each other (minimal overlap)
+
+REQUIREMENTS:
+- Each item should be a specific practice or topic area
+{tier2_requirements}{tier2_guidelines}
+
+Return ONLY valid JSON in this exact format:
+
+{{
+  "tier1_name": "{tier1_name}",
+  "tier2_items": [
+{tier2_examples}
+  ]
+}}
+
+Generate exactly {tier2_count} items for "{tier1_name}". Return ONLY the JSON, no additional text."""
+
+# Tier 3 Prompt Template - YouTube
+TIER_3_YOUTUBE_PROMPT = """You are an expert in {domain} content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
+
+TASK: Create {tier3_count} natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
+- Natural, conversational search phrases
+- Varied in specificity and approach
+{youtube_traits}
+- Include time-based variations (5 min, 10 min, 30 min, etc.)
+
+REQUIREMENTS:
+- Each query should be 3-8 words long
+- Sound like real user searches on YouTube
+- Include variations in difficulty, duration, and context
+- Avoid overly {tier3_jargon} language
+- Be specific enough to generate targeted results{youtube_guidelines}
+
+Return ONLY valid JSON in this exact format:
+
+{{
+  "tier1_name": "{tier1_name}",
+  "tier2_name": "{tier2_name}",
+  "search_seeds": [
+{youtube_examples}
+  ]
+}}
+
+Generate exactly {tier3_count} search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
+
+# Tier 3 Prompt Template - Instagram
+TIER_3_INSTAGRAM_PROMPT = """You are an expert in {domain} content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
+
+TASK: Create {tier3_count} natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
+- Short, hashtag-friendly phrases
+{instagram_traits}
+
+REQUIREMENTS:
+- Each query should be 2-6 words long
+- Sound like real user searches on Instagram
+- Include variations that work well with hashtags
+- Avoid overly {tier3_jargon} language
+- Be specific enough to generate targeted results
+{instagram_requirements}{instagram_guidelines}
+
+Return ONLY valid JSON in this exact format:
+
+{{
+  "tier1_name": "{tier1_name}",
+  "tier2_name": "{tier2_name}",
+  "search_seeds": [
+{instagram_examples}
+  ]
+}}
+
+Generate exactly {tier3_count} search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
+
+
+def bullets(*lines: str) -> str:
+    """Lines of a task or requirements list, as "- " items"""
+    return "\n".join(f"- {line}" for line in lines)
+
+
+def safety_guidelines(*lines: str) -> str:
+    """A SAFETY GUIDELINES section, placed after a template's requirements"""
+    return "\n\nSAFETY GUIDELINES:\n" + bullets(*lines)
+
+
+def json_items(*examples: str) -> str:
+    """Example items of a JSON output format, one quoted string per line"""
+    return ",\n".join(f'    "{example}"' for example in examples)
+
+
+# Tier 3 prompts for platforms without their own template use the YouTube one
+BASE_SPEC = PromptSpec(
+    tier1=TIER_1_PROMPT,
+    tier2=TIER_2_PROMPT,
+    tier3={"youtube": TIER_3_YOUTUBE_PROMPT, "instagram": TIER_3_INSTAGRAM_PROMPT},
+    values={
+        "tier3_jargon": "technical or academic",
+        "tier1_guidelines": "",
+        "tier2_guidelines": "",
+        "youtube_guidelines": "",
+        "instagram_guidelines": "",
+    },
+    default_platform="youtube",
+)
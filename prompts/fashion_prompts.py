@@ -3,149 +3,68 @@ Prompt templates for Fashion data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Fashion domains. Generate a comprehensive list of broad categories that cover the entire spectrum of fashion topics.
-
-TASK: Create 12-15 broad Tier 1 categories for Fashion that are:
-- Comprehensive and cover major fashion areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to general audience seeking fashion information
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly technical or academic terminology
-- Focus on accessible, practical fashion categories
-- Include both clothing and accessories
-- Cover different fashion styles and contexts
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Women's Clothing",
-    "Men's Clothing",
-    "Streetwear"
-  ]
-}
-
-Generate exactly 12-15 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Fashion domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 8-12 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, practical fashion topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Casual Wear",
-    "Formal Attire",
-    "Seasonal Trends"
-  ]
-}}
-
-Generate exactly 8-12 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Fashion content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 10-15 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different styles, occasions, and price points
-- Cover different contexts (styling, shopping, trends, reviews, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "how to style casual outfits",
-    "fashion trends 2025",
-    "budget friendly fashion tips",
-    "outfit ideas for work",
-    "fashion hauls and reviews"
-  ]
-}}
-
-Generate exactly 10-15 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Fashion content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 10-15 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and style-focused
-- Include popular hashtag variations
-- Cover different contexts (outfits, inspiration, shopping, trends, etc.)
-- Include quick tips and visual content-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and fashion inspiration
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "outfit ideas",
-    "fashion trends",
-    "style inspiration",
-    "fashion hauls",
-    "ootd outfits"
-  ]
-}}
-
-Generate exactly 10-15 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
-
+from prompts.base import BASE_SPEC, bullets, json_items
+
+
+SPEC = BASE_SPEC.extend(
+    category="fashion",
+    values={
+        "domain": "Fashion",
+        "tier1_scope": "fashion",
+        "tier1_count": "12-15",
+        "tier1_areas": "fashion",
+        "tier1_audience": "general audience seeking fashion information",
+        "tier1_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on accessible, practical fashion categories",
+            "Include both clothing and accessories",
+            "Cover different fashion styles and contexts",
+        ),
+        "tier1_examples": json_items(
+            "Women's Clothing",
+            "Men's Clothing",
+            "Streetwear",
+        ),
+        "tier2_count": "8-12",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, practical fashion topics",
+        ),
+        "tier2_examples": json_items(
+            "Casual Wear",
+            "Formal Attire",
+            "Seasonal Trends",
+        ),
+        "tier3_count": "10-15",
+        "youtube_traits": bullets(
+            "Include different styles, occasions, and price points",
+            "Cover different contexts (styling, shopping, trends, reviews, etc.)",
+        ),
+        "youtube_examples": json_items(
+            "how to style casual outfits",
+            "fashion trends 2025",
+            "budget friendly fashion tips",
+            "outfit ideas for work",
+            "fashion hauls and reviews",
+        ),
+        "instagram_traits": bullets(
+            "Visual and style-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (outfits, inspiration, shopping, trends, etc.)",
+            "Include quick tips and visual content-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and fashion inspiration"),
+        "instagram_examples": json_items(
+            "outfit ideas",
+            "fashion trends",
+            "style inspiration",
+            "fashion hauls",
+            "ootd outfits",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
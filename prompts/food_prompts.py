@@ -3,6 +3,8 @@ Prompt templates for Food data generation
 Each prompt enforces strict JSON output with validation
 """
 
+from prompts.base import BASE_SPEC
+
 # Configuration constants
 MAX_TIER_1_ITEMS = 20
 MAX_TIER_2_ITEMS = 20
@@ -190,26 +192,15 @@ Return ONLY valid JSON in this exact format:
 Generate up to {max_tier3} diverse search seeds for "{tier2_name}" that cover broad ground. Return ONLY the JSON, no additional text."""
 
 
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT.format(max_tier1=MAX_TIER_1_ITEMS)
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name, max_tier2=MAX_TIER_2_ITEMS)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name,
-        max_tier3=MAX_TIER_3_ITEMS
-    )
+SPEC = BASE_SPEC.extend(
+    category="food",
+    tier1=TIER_1_PROMPT,
+    tier2=TIER_2_PROMPT,
+    tier3={"youtube": TIER_3_YOUTUBE_PROMPT, "instagram": TIER_3_INSTAGRAM_PROMPT},
+    values={"max_tier1": MAX_TIER_1_ITEMS, "max_tier2": MAX_TIER_2_ITEMS, "max_tier3": MAX_TIER_3_ITEMS},
+)
+PROMPTS = SPEC.compile()
 
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
@@ -3,174 +3,96 @@ Prompt templates for Health & Wellbeing data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Health & Wellbeing domains. Generate a comprehensive list of broad categories that cover the entire spectrum of health and wellness topics.
-
-TASK: Create 8-12 broad Tier 1 categories for Health & Wellbeing that are:
-- Comprehensive and cover major health/wellness areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to general audience seeking health information
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly medical or clinical terminology
-- Focus on accessible, lifestyle-oriented categories
-
-SAFETY GUIDELINES:
-- NO specific medical advice or diagnostic claims
-- NO brand names or commercial products
-- NO potentially harmful recommendations
-- Focus on general wellness and lifestyle topics
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Fitness",
-    "Nutrition",
-    "Mental Health"
-  ]
-}
-
-Generate exactly 8-12 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Health & Wellbeing domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 5-8 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or medical terminology
-- Focus on actionable, lifestyle-oriented topics
-
-SAFETY GUIDELINES:
-- NO specific medical advice or diagnostic claims
-- NO brand names or commercial products
-- NO potentially harmful recommendations
-- NO claims about curing or treating medical conditions
-- Focus on general wellness and educational content
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Yoga",
-    "Strength Training",
-    "Cardio"
-  ]
-}}
-
-Generate exactly 5-8 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Health & Wellbeing content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 6-10 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different skill levels (beginner, intermediate)
-- Cover different contexts (home, gym, office, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly technical or clinical language
-- Be specific enough to generate targeted results
-
-SAFETY GUIDELINES:
-- NO specific medical advice or diagnostic claims
-- NO brand names or commercial products
-- NO potentially harmful recommendations
-- NO claims about curing or treating medical conditions
-- NO extreme or dangerous practices
-- Focus on general wellness and educational content
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "beginner yoga for flexibility",
-    "10 minute morning yoga routine",
-    "yoga for back pain relief",
-    "yoga workout for beginners",
-    "bedtime yoga routine"
-  ]
-}}
-
-Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Health & Wellbeing content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 6-10 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and lifestyle-focused
-- Include popular hashtag variations
-- Cover different contexts (home, gym, office, etc.)
-- Include quick tips and inspiration-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly technical or clinical language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and lifestyle inspiration
-
-SAFETY GUIDELINES:
-- NO specific medical advice or diagnostic claims
-- NO brand names or commercial products
-- NO potentially harmful recommendations
-- NO claims about curing or treating medical conditions
-- NO extreme or dangerous practices
-- Focus on general wellness and educational content
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "yoga poses",
-    "yoga inspiration",
-    "morning yoga flow",
-    "yoga transformation",
-    "yoga at home"
-  ]
-}}
-
-Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
+from prompts.base import BASE_SPEC, bullets, json_items, safety_guidelines
+
+
+SPEC = BASE_SPEC.extend(
+    category="health_wellbeing",
+    values={
+        "domain": "Health & Wellbeing",
+        "tier1_scope": "health and wellness",
+        "tier1_count": "8-12",
+        "tier1_areas": "health/wellness",
+        "tier1_audience": "general audience seeking health information",
+        "tier1_requirements": bullets(
+            "Avoid overly medical or clinical terminology",
+            "Focus on accessible, lifestyle-oriented categories",
+        ),
+        "tier1_guidelines": safety_guidelines(
+            "NO specific medical advice or diagnostic claims",
+            "NO brand names or commercial products",
+            "NO potentially harmful recommendations",
+            "Focus on general wellness and lifestyle topics",
+        ),
+        "tier1_examples": json_items(
+            "Fitness",
+            "Nutrition",
+            "Mental Health",
+        ),
+        "tier2_count": "5-8",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or medical terminology",
+            "Focus on actionable, lifestyle-oriented topics",
+        ),
+        "tier2_guidelines": safety_guidelines(
+            "NO specific medical advice or diagnostic claims",
+            "NO brand names or commercial products",
+            "NO potentially harmful recommendations",
+            "NO claims about curing or treating medical conditions",
+            "Focus on general wellness and educational content",
+        ),
+        "tier2_examples": json_items(
+            "Yoga",
+            "Strength Training",
+            "Cardio",
+        ),
+        "tier3_count": "6-10",
+        "youtube_traits": bullets(
+            "Include different skill levels (beginner, intermediate)",
+            "Cover different contexts (home, gym, office, etc.)",
+        ),
+        "tier3_jargon": "technical or clinical",
+        "youtube_guidelines": safety_guidelines(
+            "NO specific medical advice or diagnostic claims",
+            "NO brand names or commercial products",
+            "NO potentially harmful recommendations",
+            "NO claims about curing or treating medical conditions",
+            "NO extreme or dangerous practices",
+            "Focus on general wellness and educational content",
+        ),
+        "youtube_examples": json_items(
+            "beginner yoga for flexibility",
+            "10 minute morning yoga routine",
+            "yoga for back pain relief",
+            "yoga workout for beginners",
+            "bedtime yoga routine",
+        ),
+        "instagram_traits": bullets(
+            "Visual and lifestyle-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (home, gym, office, etc.)",
+            "Include quick tips and inspiration-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and lifestyle inspiration"),
+        "instagram_guidelines": safety_guidelines(
+            "NO specific medical advice or diagnostic claims",
+            "NO brand names or commercial products",
+            "NO potentially harmful recommendations",
+            "NO claims about curing or treating medical conditions",
+            "NO extreme or dangerous practices",
+            "Focus on general wellness and educational content",
+        ),
+        "instagram_examples": json_items(
+            "yoga poses",
+            "yoga inspiration",
+            "morning yoga flow",
+            "yoga transformation",
+            "yoga at home",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
@@ -3,60 +3,8 @@ Prompt templates for Luxury & High-End Lifestyle data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Luxury & High-End Lifestyle domains. Generate a comprehensive list of broad categories that cover the entire spectrum of luxury and premium lifestyle topics.
+from prompts.base import BASE_SPEC, bullets, json_items
 
-TASK: Create 8-12 broad Tier 1 categories for Luxury & High-End Lifestyle that are:
-- Comprehensive and cover major luxury/premium areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to general audience seeking luxury lifestyle information
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly technical or academic terminology
-- Focus on accessible, aspirational luxury categories
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Luxury Fashion",
-    "Fine Dining",
-    "Premium Travel"
-  ]
-}
-
-Generate exactly 8-12 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Luxury & High-End Lifestyle domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 5-8 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, aspirational luxury topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Haute Couture",
-    "Luxury Watches",
-    "Designer Accessories"
-  ]
-}}
-
-Generate exactly 5-8 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template
 # Tier 3 Prompt Template - YouTube
 TIER_3_YOUTUBE_PROMPT = """You are an expert in Luxury & High-End Lifestyle content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
 
@@ -125,24 +73,38 @@ Return ONLY valid JSON in this exact format:
 Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
 
 
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
+SPEC = BASE_SPEC.extend(
+    category="luxury_lifestyle",
+    tier3={"youtube": TIER_3_YOUTUBE_PROMPT, "instagram": TIER_3_INSTAGRAM_PROMPT},
+    values={
+        "domain": "Luxury & High-End Lifestyle",
+        "tier1_scope": "luxury and premium lifestyle",
+        "tier1_count": "8-12",
+        "tier1_areas": "luxury/premium",
+        "tier1_audience": "general audience seeking luxury lifestyle information",
+        "tier1_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on accessible, aspirational luxury categories",
+        ),
+        "tier1_examples": json_items(
+            "Luxury Fashion",
+            "Fine Dining",
+            "Premium Travel",
+        ),
+        "tier2_count": "5-8",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, aspirational luxury topics",
+        ),
+        "tier2_examples": json_items(
+            "Haute Couture",
+            "Luxury Watches",
+            "Designer Accessories",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
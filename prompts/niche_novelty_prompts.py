@@ -3,146 +3,66 @@ Prompt templates for Niche & Novelty data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Niche & Novelty domains. Generate a comprehensive list of broad categories that cover the entire spectrum of unique, specialized, and unusual topics.
-
-TASK: Create 8-12 broad Tier 1 categories for Niche & Novelty that are:
-- Comprehensive and cover major niche/specialized areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to audiences seeking unique and specialized content
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly technical or academic terminology
-- Focus on accessible, interesting niche categories
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Collectibles",
-    "Hobbies",
-    "Unusual Skills"
-  ]
-}
-
-Generate exactly 8-12 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Niche & Novelty domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 5-8 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, interesting niche topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Vintage Collecting",
-    "Rare Items",
-    "Artisan Crafts"
-  ]
-}}
-
-Generate exactly 5-8 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Niche & Novelty content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 8-12 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different skill levels and interests
-- Cover different contexts (beginner, advanced, rare, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "rare collectibles guide",
-    "unique hobby ideas",
-    "unusual skills tutorial",
-    "niche market tips",
-    "specialized techniques"
-  ]
-}}
-
-Generate exactly 8-12 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Niche & Novelty content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 8-12 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and unique-focused
-- Include popular hashtag variations
-- Cover different contexts (tips, inspiration, rare finds, etc.)
-- Include quick tips and visual content-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and niche inspiration
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "rare collectibles",
-    "unique hobbies",
-    "niche interests",
-    "specialized skills",
-    "unusual finds"
-  ]
-}}
-
-Generate exactly 8-12 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
+from prompts.base import BASE_SPEC, bullets, json_items
+
+
+SPEC = BASE_SPEC.extend(
+    category="niche_novelty",
+    values={
+        "domain": "Niche & Novelty",
+        "tier1_scope": "unique, specialized, and unusual",
+        "tier1_count": "8-12",
+        "tier1_areas": "niche/specialized",
+        "tier1_audience": "audiences seeking unique and specialized content",
+        "tier1_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on accessible, interesting niche categories",
+        ),
+        "tier1_examples": json_items(
+            "Collectibles",
+            "Hobbies",
+            "Unusual Skills",
+        ),
+        "tier2_count": "5-8",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, interesting niche topics",
+        ),
+        "tier2_examples": json_items(
+            "Vintage Collecting",
+            "Rare Items",
+            "Artisan Crafts",
+        ),
+        "tier3_count": "8-12",
+        "youtube_traits": bullets(
+            "Include different skill levels and interests",
+            "Cover different contexts (beginner, advanced, rare, etc.)",
+        ),
+        "youtube_examples": json_items(
+            "rare collectibles guide",
+            "unique hobby ideas",
+            "unusual skills tutorial",
+            "niche market tips",
+            "specialized techniques",
+        ),
+        "instagram_traits": bullets(
+            "Visual and unique-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (tips, inspiration, rare finds, etc.)",
+            "Include quick tips and visual content-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and niche inspiration"),
+        "instagram_examples": json_items(
+            "rare collectibles",
+            "unique hobbies",
+            "niche interests",
+            "specialized skills",
+            "unusual finds",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
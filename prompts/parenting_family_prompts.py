@@ -3,163 +3,85 @@ Prompt templates for Parenting & Family data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Parenting & Family domains. Generate a comprehensive list of broad categories that cover the entire spectrum of parenting and family topics.
-
-TASK: Create 8-12 broad Tier 1 categories for Parenting & Family that are:
-- Comprehensive and cover major parenting/family areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to parents and families seeking guidance
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly clinical or academic terminology
-- Focus on accessible, practical parenting categories
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Child Development",
-    "Parenting Strategies",
-    "Family Activities"
-  ]
-}
-
-Generate exactly 8-12 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Parenting & Family domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 5-8 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly clinical or academic terminology
-- Focus on actionable, practical parenting topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Early Childhood Development",
-    "Teenage Parenting",
-    "Special Needs Parenting"
-  ]
-}}
-
-Generate exactly 5-8 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Parenting & Family content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 6-10 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different age groups (toddlers, kids, teens, etc.)
-- Cover different contexts (home, school, activities, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly clinical or academic language
-- Be specific enough to generate targeted results
-
-SAFETY GUIDELINES:
-- NO specific medical advice or diagnostic claims
-- NO content that could be harmful to children
-- NO extreme or controversial parenting methods
-- NO content promoting unsafe practices
-- NO content that could be inappropriate for children
-- Focus on evidence-based, positive parenting approaches
-- Ensure all content is family-friendly and age-appropriate
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "toddler activities at home",
-    "positive parenting tips",
-    "family bonding activities",
-    "child development milestones",
-    "parenting challenges solutions"
-  ]
-}}
-
-Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Parenting & Family content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 6-10 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and family-focused
-- Include popular hashtag variations
-- Cover different contexts (tips, inspiration, activities, etc.)
-- Include quick tips and visual content-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly clinical or academic language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and family inspiration
-
-SAFETY GUIDELINES:
-- NO specific medical advice or diagnostic claims
-- NO content that could be harmful to children
-- NO extreme or controversial parenting methods
-- NO content promoting unsafe practices
-- NO content that could be inappropriate for children
-- Focus on evidence-based, positive parenting approaches
-- Ensure all content is family-friendly and age-appropriate
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "toddler activities",
-    "parenting tips",
-    "family fun",
-    "kids activities",
-    "parenting hacks"
-  ]
-}}
-
-Generate exactly 6-10 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
+from prompts.base import BASE_SPEC, bullets, json_items, safety_guidelines
+
+
+SPEC = BASE_SPEC.extend(
+    category="parenting_family",
+    values={
+        "domain": "Parenting & Family",
+        "tier1_scope": "parenting and family",
+        "tier1_count": "8-12",
+        "tier1_areas": "parenting/family",
+        "tier1_audience": "parents and families seeking guidance",
+        "tier1_requirements": bullets(
+            "Avoid overly clinical or academic terminology",
+            "Focus on accessible, practical parenting categories",
+        ),
+        "tier1_examples": json_items(
+            "Child Development",
+            "Parenting Strategies",
+            "Family Activities",
+        ),
+        "tier2_count": "5-8",
+        "tier2_requirements": bullets(
+            "Avoid overly clinical or academic terminology",
+            "Focus on actionable, practical parenting topics",
+        ),
+        "tier2_examples": json_items(
+            "Early Childhood Development",
+            "Teenage Parenting",
+            "Special Needs Parenting",
+        ),
+        "tier3_count": "6-10",
+        "youtube_traits": bullets(
+            "Include different age groups (toddlers, kids, teens, etc.)",
+            "Cover different contexts (home, school, activities, etc.)",
+        ),
+        "tier3_jargon": "clinical or academic",
+        "youtube_guidelines": safety_guidelines(
+            "NO specific medical advice or diagnostic claims",
+            "NO content that could be harmful to children",
+            "NO extreme or controversial parenting methods",
+            "NO content promoting unsafe practices",
+            "NO content that could be inappropriate for children",
+            "Focus on evidence-based, positive parenting approaches",
+            "Ensure all content is family-friendly and age-appropriate",
+        ),
+        "youtube_examples": json_items(
+            "toddler activities at home",
+            "positive parenting tips",
+            "family bonding activities",
+            "child development milestones",
+            "parenting challenges solutions",
+        ),
+        "instagram_traits": bullets(
+            "Visual and family-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (tips, inspiration, activities, etc.)",
+            "Include quick tips and visual content-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and family inspiration"),
+        "instagram_guidelines": safety_guidelines(
+            "NO specific medical advice or diagnostic claims",
+            "NO content that could be harmful to children",
+            "NO extreme or controversial parenting methods",
+            "NO content promoting unsafe practices",
+            "NO content that could be inappropriate for children",
+            "Focus on evidence-based, positive parenting approaches",
+            "Ensure all content is family-friendly and age-appropriate",
+        ),
+        "instagram_examples": json_items(
+            "toddler activities",
+            "parenting tips",
+            "family fun",
+            "kids activities",
+            "parenting hacks",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
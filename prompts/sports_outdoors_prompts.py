@@ -3,6 +3,8 @@ Prompt templates for Sports & Outdoors data generation
 Each prompt enforces strict JSON output with validation
 """
 
+from prompts.base import BASE_SPEC, bullets, json_items
+
 # Tier 1 Prompt Template
 TIER_1_PROMPT = """You are an expert in Sports & Outdoors domains. Generate a comprehensive list of broad categories that cover the entire spectrum of sports and outdoor activities.
 
@@ -21,131 +23,62 @@ REQUIREMENTS:
 
 Return ONLY valid JSON in this exact format:
 
-{
+{{
   "tier1_categories": [
     "Team Sports",
     "Individual Sports",
     "Outdoor Adventures"
   ]
-}
-
-Generate exactly 12-15 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Sports & Outdoors domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 8-12 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, practical sports and outdoor topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Basketball",
-    "Soccer",
-    "Tennis"
-  ]
-}}
-
-Generate exactly 8-12 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template
-# Tier 3 Prompt Template - YouTube
-TIER_3_YOUTUBE_PROMPT = """You are an expert in Sports & Outdoors content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 10-15 natural search queries for "{tier2_name}" that sound like real YouTube searches. These should be:
-- Natural, conversational search phrases
-- Varied in specificity and approach
-- Include different skill levels and training styles
-- Cover different contexts (tutorials, highlights, tips, gear reviews, etc.)
-- Include time-based variations (5 min, 10 min, 30 min, etc.)
-
-REQUIREMENTS:
-- Each query should be 3-8 words long
-- Sound like real user searches on YouTube
-- Include variations in difficulty, duration, and context
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "basketball training tips",
-    "how to improve shooting",
-    "basketball drills for beginners",
-    "basketball highlights",
-    "basketball gear reviews"
-  ]
 }}
 
-Generate exactly 10-15 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-# Tier 3 Prompt Template - Instagram
-TIER_3_INSTAGRAM_PROMPT = """You are an expert in Sports & Outdoors content creation. Generate natural Instagram-style search queries (seeds) for the given Tier 2 practice.
-
-TASK: Create 10-15 natural search queries for "{tier2_name}" that sound like real Instagram searches. These should be:
-- Short, hashtag-friendly phrases
-- Visual and action-focused
-- Include popular hashtag variations
-- Cover different contexts (highlights, tips, training, gear, etc.)
-- Include quick tips and visual content-focused queries
-
-REQUIREMENTS:
-- Each query should be 2-6 words long
-- Sound like real user searches on Instagram
-- Include variations that work well with hashtags
-- Avoid overly technical or academic language
-- Be specific enough to generate targeted results
-- Focus on visual content, quick tips, and sports inspiration
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_name": "{tier2_name}",
-  "search_seeds": [
-    "basketball tips",
-    "sports highlights",
-    "training motivation",
-    "outdoor adventures",
-    "fitness goals"
-  ]
-}}
-
-Generate exactly 10-15 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
-
-
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
+Generate exactly 12-15 categories. Return ONLY the JSON, no additional text."""
 
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
 
+SPEC = BASE_SPEC.extend(
+    category="sports_outdoors",
+    tier1=TIER_1_PROMPT,
+    values={
+        "domain": "Sports & Outdoors",
+        "tier2_count": "8-12",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, practical sports and outdoor topics",
+        ),
+        "tier2_examples": json_items(
+            "Basketball",
+            "Soccer",
+            "Tennis",
+        ),
+        "tier3_count": "10-15",
+        "youtube_traits": bullets(
+            "Include different skill levels and training styles",
+            "Cover different contexts (tutorials, highlights, tips, gear reviews, etc.)",
+        ),
+        "youtube_examples": json_items(
+            "basketball training tips",
+            "how to improve shooting",
+            "basketball drills for beginners",
+            "basketball highlights",
+            "basketball gear reviews",
+        ),
+        "instagram_traits": bullets(
+            "Visual and action-focused",
+            "Include popular hashtag variations",
+            "Cover different contexts (highlights, tips, training, gear, etc.)",
+            "Include quick tips and visual content-focused queries",
+        ),
+        "instagram_requirements": bullets("Focus on visual content, quick tips, and sports inspiration"),
+        "instagram_examples": json_items(
+            "basketball tips",
+            "sports highlights",
+            "training motivation",
+            "outdoor adventures",
+            "fitness goals",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
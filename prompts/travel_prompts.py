@@ -3,58 +3,7 @@ Prompt templates for Travel data generation
 Each prompt enforces strict JSON output with validation
 """
 
-# Tier 1 Prompt Template
-TIER_1_PROMPT = """You are an expert in Travel domains. Generate a comprehensive list of broad categories that cover the entire spectrum of travel and tourism topics.
-
-TASK: Create 8-12 broad Tier 1 categories for Travel that are:
-- Comprehensive and cover major travel/tourism areas
-- Mutually exclusive (minimal overlap)
-- Broad enough to contain multiple sub-topics
-- Relevant to general audience seeking travel information
-
-REQUIREMENTS:
-- Each category should have a clear, descriptive name
-- Avoid overly technical or academic terminology
-- Focus on accessible, practical travel categories
-
-Return ONLY valid JSON in this exact format:
-
-{
-  "tier1_categories": [
-    "Destination Guides",
-    "Travel Planning",
-    "Cultural Experiences"
-  ]
-}
-
-Generate exactly 8-12 categories. Return ONLY the JSON, no additional text."""
-
-# Tier 2 Prompt Template
-TIER_2_PROMPT = """You are an expert in Travel domains. Generate specific practices, sub-topics, or areas within the given Tier 1 category.
-
-TASK: Create 5-8 specific Tier 2 items for the category "{tier1_name}" that are:
-- Specific practices, methods, or sub-areas within the category
-- Popular and commonly searched topics
-- Accessible to general audience
-- Distinct from each other (minimal overlap)
-
-REQUIREMENTS:
-- Each item should be a specific practice or topic area
-- Avoid overly technical or academic terminology
-- Focus on actionable, practical travel topics
-
-Return ONLY valid JSON in this exact format:
-
-{{
-  "tier1_name": "{tier1_name}",
-  "tier2_items": [
-    "Budget Travel",
-    "Luxury Destinations",
-    "Adventure Tourism"
-  ]
-}}
-
-Generate exactly 5-8 items for "{tier1_name}". Return ONLY the JSON, no additional text."""
+from prompts.base import BASE_SPEC, bullets, json_items
 
 # Tier 3 Prompt Template - YouTube
 TIER_3_YOUTUBE_PROMPT = """You are an expert in Travel content creation. Generate natural YouTube-style search queries (seeds) for the given Tier 2 practice.
@@ -124,25 +73,38 @@ Return ONLY valid JSON in this exact format:
 Generate exactly 8-12 search seeds for "{tier2_name}". Return ONLY the JSON, no additional text."""
 
 
-def build_tier1_prompt() -> str:
-    """Build the Tier 1 generation prompt"""
-    return TIER_1_PROMPT
-
-
-def build_tier2_prompt(tier1_name: str) -> str:
-    """Build the Tier 2 generation prompt for a specific Tier 1 category"""
-    return TIER_2_PROMPT.format(tier1_name=tier1_name)
-
-
-def build_tier3_prompt(tier1_name: str, tier2_name: str, platform: str = "youtube") -> str:
-    """Build the Tier 3 generation prompt for a specific Tier 2 item and platform"""
-    if platform.lower() == "instagram":
-        prompt_template = TIER_3_INSTAGRAM_PROMPT
-    else:
-        prompt_template = TIER_3_YOUTUBE_PROMPT
-    
-    return prompt_template.format(
-        tier1_name=tier1_name,
-        tier2_name=tier2_name
-    )
-
+SPEC = BASE_SPEC.extend(
+    category="travel",
+    tier3={"youtube": TIER_3_YOUTUBE_PROMPT, "instagram": TIER_3_INSTAGRAM_PROMPT},
+    values={
+        "domain": "Travel",
+        "tier1_scope": "travel and tourism",
+        "tier1_count": "8-12",
+        "tier1_areas": "travel/tourism",
+        "tier1_audience": "general audience seeking travel information",
+        "tier1_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on accessible, practical travel categories",
+        ),
+        "tier1_examples": json_items(
+            "Destination Guides",
+            "Travel Planning",
+            "Cultural Experiences",
+        ),
+        "tier2_count": "5-8",
+        "tier2_requirements": bullets(
+            "Avoid overly technical or academic terminology",
+            "Focus on actionable, practical travel topics",
+        ),
+        "tier2_examples": json_items(
+            "Budget Travel",
+            "Luxury Destinations",
+            "Adventure Tourism",
+        ),
+    },
+)
+PROMPTS = SPEC.compile()
+
+build_tier1_prompt = PROMPTS.build_tier1_prompt
+build_tier2_prompt = PROMPTS.build_tier2_prompt
+build_tier3_prompt = PROMPTS.build_tier3_prompt
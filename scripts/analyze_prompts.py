@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Report the token footprint of every prompt and recommend per-tier max_tokens
+
+Renders every category/tier/platform prompt through the prompt registry,
+estimates its tokens offline and flags prompts over the budget. Output
+token sizes recorded in run_report.json files under the data directory
+become per-tier max_tokens recommendations. Exits with status 1 when a
+prompt is over budget, so it can gate CI.
+
+Usage:
+    python3 scripts/analyze_prompts.py
+    python3 scripts/analyze_prompts.py --category food --platform youtube --budget 600
+    python3 scripts/analyze_prompts.py --data-dir data --output logs/prompt_footprint.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from lib.config import config
+from lib.prompt_analysis import (
+    analysis_to_dict,
+    analyze_prompts,
+    format_analysis,
+    observed_output_tokens,
+    recommend_max_tokens,
+)
+from lib.registry import prompt_registry
+from lib.routing import resolve_routes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Report prompt token footprints and recommend per-tier max_tokens')
+    parser.add_argument('--category', '-c',
+                       default='all',
+                       help='Category to analyze, or "all" (default: all)')
+    parser.add_argument('--platform', '-p',
+                       default='all',
+                       choices=['youtube', 'instagram', 'all'],
+                       help='Tier 3 platform to analyze, or "all" (default: all)')
+    parser.add_argument('--budget',
+                       type=int,
+                       default=config.max_prompt_tokens,
+                       help=f'Flag prompts estimated above this many tokens (default: {config.max_prompt_tokens})')
+    parser.add_argument('--data-dir',
+                       type=Path,
+                       default=Path(config.base_output_dir),
+                       help=f'Directory searched for run reports with observed response sizes (default: {config.base_output_dir})')
+    parser.add_argument('--headroom',
+                       type=float,
+                       default=1.25,
+                       help='Multiplier on the observed p99 response size (default: 1.25)')
+    parser.add_argument('--output',
+                       type=Path,
+                       help='Also write the analysis as JSON to this file')
+    args = parser.parse_args()
+
+    if args.category == 'all':
+        categories = prompt_registry.get_available_categories()
+    elif prompt_registry.is_category_available(args.category):
+        categories = [args.category]
+    else:
+        print(f"Category '{args.category}' not found. Available categories: "
+              f"{prompt_registry.get_available_categories()}", file=sys.stderr)
+        return 2
+    platforms = ['youtube', 'instagram'] if args.platform == 'all' else [args.platform]
+
+    footprints = analyze_prompts(categories, platforms, args.budget)
+    recommendations = recommend_max_tokens(footprints, observed_output_tokens(args.data_dir), args.headroom)
+    configured = {tier: route.max_tokens for tier, route in resolve_routes(config).items()}
+    print(format_analysis(footprints, recommendations, args.budget, configured))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(analysis_to_dict(footprints, recommendations, args.budget), indent=2) + "\n")
+
+    return 1 if any(f.over_budget for f in footprints) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
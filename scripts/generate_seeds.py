@@ -3,7 +3,10 @@
 Main execution script for data generation across multiple categories
 """
 
-import asyncio
+import atexit
+import os
+import socket
+import time
 import logging
 import sys
 import argparse
@@ -13,44 +16,214 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from lib.bedrock_client import BedrockClient, BedrockError
-from lib.generator import DataGenerator
 from lib.config import config
 from lib.registry import prompt_registry
+from lib.util import get_pg_conn_string
+from lib.metrics import metrics, start_metrics_server
+from lib.tracing import configure_tracing, shutdown_tracing
+from lib.profiling import PROFILE_MODES, configure_profiling, finish_profiling
+from lib.logging_setup import configure_logging
+from lib.routing import load_routes
+from lib.scheduler import parse_deadline, parse_duration
+from lib.sharding import ShardingError, parse_shard
+from lib.work_queue import PostgresWorkQueue, SqliteWorkQueue
 
-# Ensure logs directory exists
-Path('logs').mkdir(exist_ok=True)
+logger = logging.getLogger(__name__)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/health_wellbeing_generation.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 
-logger = logging.getLogger(__name__)
+def print_plan(args) -> int:
+    """Print the estimated pending work for the selected categories and platforms"""
+    from lib.planner import format_plans, plan_run  # Deferred: the planner imports the generator
+    
+    categories = prompt_registry.get_available_categories() if args.category == 'all' else [args.category]
+    platforms = ['youtube', 'instagram'] if args.platform == 'all' else [args.platform]
+    
+    for category in categories:
+        if not prompt_registry.is_category_available(category):
+            logger.error(f"Category '{category}' not found. Available categories: {prompt_registry.get_available_categories()}")
+            return 1
+    if args.max_concurrency < 1:
+        logger.error("--max-concurrency must be at least 1")
+        return 1
+    
+    plans = [
+        plan_run(
+            category,
+            platform,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute
+        )
+        for category in sorted(categories)
+        for platform in platforms
+    ]
+    print(format_plans(plans))
+    return 0
 
 
-async def main():
-    """Main execution function"""
+def main() -> int:
+    """Parse arguments and run; --list-categories and --help return before the generator is imported"""
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Generate hierarchical data for various categories')
     parser.add_argument('--category', '-c', 
                        default='health_wellbeing',
-                       help='Category to generate data for (default: health_wellbeing)')
+                       help='Category to generate data for, or "all" with --plan (default: health_wellbeing)')
     parser.add_argument('--platform', '-p',
                        default='youtube',
-                       choices=['youtube', 'instagram'],
-                       help='Platform to generate seeds for (default: youtube)')
+                       choices=['youtube', 'instagram', 'all'],
+                       help='Platform to generate seeds for, or "all" with --plan (default: youtube)')
     parser.add_argument('--list-categories', '-l', 
                        action='store_true',
                        help='List available categories and exit')
+    parser.add_argument('--max-concurrency',
+                       type=int,
+                       default=config.max_concurrency,
+                       help=f'Maximum in-flight model calls for Tier 2/Tier 3 items (default: {config.max_concurrency})')
+    parser.add_argument('--requests-per-minute',
+                       type=float,
+                       default=config.requests_per_minute,
+                       help='Cap on model call attempts per minute, retries included (default: unlimited)')
+    parser.add_argument('--target-seeds',
+                       type=int,
+                       default=None,
+                       metavar='N',
+                       help='Stop once N unique Tier 3 seeds are kept, topping up Tier 2 items that fall short')
+    parser.add_argument('--prompt-cache',
+                       action='store_true',
+                       help='Send Tier 2/Tier 3 requests through the Converse API with the static instructions '
+                            'in a cached system block and only the item names in the user turn')
+    parser.add_argument('--routes',
+                       type=Path,
+                       metavar='FILE',
+                       help='JSON file of per-tier and per-category model/inference overrides '
+                            '({"tiers": {...}, "categories": {...}})')
+    parser.add_argument('--hedge',
+                       action='store_true',
+                       help='Send a duplicate of calls still running after the stage\'s p95 latency; '
+                            'the first valid JSON wins and the other copy is cancelled')
+    parser.add_argument('--hedge-budget',
+                       type=float,
+                       default=config.hedge_budget_ratio,
+                       metavar='RATIO',
+                       help=f'Maximum hedged calls as a share of all calls (default: {config.hedge_budget_ratio})')
+    parser.add_argument('--retry-budget',
+                       type=float,
+                       default=config.retry_budget_ratio,
+                       metavar='RATIO',
+                       help=f'Retries allowed per successful call, API and JSON retries together '
+                            f'(default: {config.retry_budget_ratio})')
+    parser.add_argument('--no-circuit-breaker',
+                       action='store_true',
+                       help='Keep sending calls while most recent calls fail, instead of pausing')
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument('--deadline',
+                       help='Stop starting model calls that would not finish by this local time (e.g. 06:00 or 2025-06-01T06:00); '
+                            'Tier 3 items are scheduled breadth-first across Tier 1 categories')
+    window.add_argument('--time-budget',
+                       help='Like --deadline, relative to now (e.g. 5400, 90m, 1h30m)')
+    # Distributed modes: static shards or a shared work queue
+    sharding = parser.add_mutually_exclusive_group()
+    sharding.add_argument('--shard',
+                       metavar='INDEX/COUNT',
+                       help='Generate Tier 3 only for this shard of the Tier 2 items (e.g. 0/4), '
+                            'writing to shards/shard_INDEX_of_COUNT/; requires --prepare-shards first')
+    sharding.add_argument('--prepare-shards',
+                       action='store_true',
+                       help='Generate Tier 1 and Tier 2 only, so shards can be started on other hosts')
+    sharding.add_argument('--merge-shards',
+                       type=int,
+                       metavar='COUNT',
+                       help='Merge the Tier 3 checkpoints of COUNT shards into the canonical aggregated files '
+                            'and seed index, without calling Bedrock')
+    sharding.add_argument('--enqueue',
+                       action='store_true',
+                       help='Generate Tier 1 and queue a Tier 2 job per Tier 1 category for --worker processes')
+    sharding.add_argument('--worker',
+                       action='store_true',
+                       help='Lease and run queued Tier 2/Tier 3 jobs until the queue is drained')
+    sharding.add_argument('--collect',
+                       action='store_true',
+                       help='Write the results of completed queue jobs as checkpoints and aggregated files')
+    queue_db = parser.add_mutually_exclusive_group()
+    queue_db.add_argument('--queue-db',
+                       type=Path,
+                       metavar='PATH',
+                       help='SQLite work queue for --enqueue/--worker/--collect on a single host')
+    queue_db.add_argument('--queue-pg',
+                       action='store_true',
+                       help='Work queue in afleau.seedgen_jobs, for workers on many hosts (see --in-vpc)')
+    parser.add_argument('--worker-id',
+                       default=f"{socket.gethostname()}-{os.getpid()}",
+                       help='Worker name recorded on its leases (default: HOSTNAME-PID)')
+    parser.add_argument('--visibility-timeout',
+                       type=float,
+                       default=config.queue_visibility_timeout_s,
+                       help=f'Seconds a job stays leased without a heartbeat (default: {config.queue_visibility_timeout_s:g})')
+    parser.add_argument('--plan',
+                       action='store_true',
+                       help='Estimate calls, tokens, cost and wall-clock of the pending work without calling Bedrock')
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record',
+                       type=Path,
+                       metavar='ARCHIVE',
+                       help='Record every Bedrock prompt/response pair to a JSONL fixture archive')
+    fixtures.add_argument('--replay',
+                       type=Path,
+                       metavar='ARCHIVE',
+                       help='Serve Bedrock responses from a fixture archive instead of calling AWS')
+    parser.add_argument('--replay-latency',
+                       type=float,
+                       default=0.0,
+                       help='Simulated mean latency per replayed call in seconds (default: 0)')
+    parser.add_argument('--replay-jitter',
+                       type=float,
+                       default=0.0,
+                       help='Replayed latency varies uniformly by +/- this many seconds (default: 0)')
+    parser.add_argument('--replay-throttle-rate',
+                       type=float,
+                       default=0.0,
+                       help='Probability of injecting a ThrottlingException per replayed call (default: 0)')
+    parser.add_argument('--replay-malformed-rate',
+                       type=float,
+                       default=0.0,
+                       help='Probability of returning truncated JSON per replayed call (default: 0)')
+    parser.add_argument('--replay-seed',
+                       type=int,
+                       default=None,
+                       help='Random seed for replay latency and fault injection')
+    parser.add_argument('--metrics-port',
+                       type=int,
+                       default=None,
+                       help='Serve Prometheus metrics at http://127.0.0.1:PORT/metrics during the run')
+    parser.add_argument('--pg-sink',
+                       action='store_true',
+                       help='Stream filtered Tier 3 seeds into afleau.seeds_posts as they are generated')
+    parser.add_argument('--in-vpc',
+                       action='store_true',
+                       help='Use VPC private IP for the --pg-sink database connection')
+    parser.add_argument('--trace',
+                       choices=['otlp', 'file'],
+                       default=None,
+                       help='Export OpenTelemetry spans to an OTLP collector or a JSON-lines file')
+    parser.add_argument('--trace-file',
+                       type=Path,
+                       default=Path('logs/traces.jsonl'),
+                       help='Span output file for --trace file (default: logs/traces.jsonl)')
+    parser.add_argument('--otlp-endpoint',
+                       default=None,
+                       help='OTLP/HTTP traces endpoint for --trace otlp (default: http://localhost:4318/v1/traces)')
+    parser.add_argument('--profile',
+                       choices=PROFILE_MODES,
+                       default=None,
+                       help='Write per-stage profiles (tiers, filter, aggregation) to logs/profiles/')
+    parser.add_argument('--log-json',
+                       action='store_true',
+                       help='Write log records as JSON lines')
     
     args = parser.parse_args()
     
+    # Console only until the arguments are validated; logging I/O runs on a background queue listener
+    configure_logging(json_format=args.log_json)
+    
     # Handle list categories request
     if args.list_categories:
         available_categories = prompt_registry.get_available_categories()
@@ -59,6 +232,32 @@ async def main():
             print(f"  - {category}")
         return 0
     
+    # Deferred: asyncio, botocore and the generator are most of the CLI's import time
+    import asyncio
+    
+    return asyncio.run(run(args))
+
+
+async def run(args) -> int:
+    """Main execution function"""
+    from lib.backends import BotoBackend, RecordingBackend, ReplayBackend
+    from lib.bedrock_client import BedrockClient, BedrockError
+    from lib.generator import DataGenerator
+    from lib.resilience import CircuitBreaker, RetryBudget
+    
+    if args.routes:
+        try:
+            config.tier_routes, config.category_routes = load_routes(args.routes)
+        except (OSError, ValueError) as e:
+            logger.error(f"Invalid --routes file: {e}")
+            return 1
+    
+    if args.plan:
+        return print_plan(args)
+    if args.category == 'all' or args.platform == 'all':
+        logger.error('"all" is only supported together with --plan')
+        return 1
+    
     # Validate category
     if not prompt_registry.is_category_available(args.category):
         available_categories = prompt_registry.get_available_categories()
@@ -70,19 +269,197 @@ async def main():
         logger.error(f"Platform '{args.platform}' is not valid. Supported platforms: youtube, instagram")
         return 1
     
+    if args.max_concurrency < 1:
+        logger.error("--max-concurrency must be at least 1")
+        return 1
+    config.max_concurrency = args.max_concurrency
+    config.requests_per_minute = args.requests_per_minute
+    
+    if args.target_seeds is not None and args.target_seeds < 1:
+        logger.error("--target-seeds must be at least 1")
+        return 1
+    config.target_seeds = args.target_seeds
+    config.prompt_caching = args.prompt_cache
+    
+    if not 0 <= args.hedge_budget <= 1:
+        logger.error("--hedge-budget must be between 0 and 1")
+        return 1
+    config.hedge_requests = args.hedge
+    config.hedge_budget_ratio = args.hedge_budget
+    
+    if args.retry_budget is not None and args.retry_budget < 0:
+        logger.error("--retry-budget must not be negative")
+        return 1
+    config.retry_budget_ratio = args.retry_budget
+    config.circuit_breaker = not args.no_circuit_breaker
+    
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    if args.merge_shards is not None and args.merge_shards < 1:
+        logger.error("--merge-shards must be at least 1")
+        return 1
+    
+    queue_mode = args.enqueue or args.worker or args.collect
+    if queue_mode and not (args.queue_db or args.queue_pg):
+        logger.error("--enqueue, --worker and --collect need --queue-db PATH or --queue-pg")
+        return 1
+    if args.visibility_timeout <= 0:
+        logger.error("--visibility-timeout must be positive")
+        return 1
+    config.queue_visibility_timeout_s = args.visibility_timeout
+    
+    try:
+        if args.deadline:
+            config.deadline = parse_deadline(args.deadline)
+        elif args.time_budget:
+            config.deadline = time.time() + parse_duration(args.time_budget)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    
+    # Add the per-category log file now that category and platform are known to be valid
+    log_name = f"{args.category}_{args.platform}_generation"
+    static_fields = {"category": args.category, "platform": args.platform}
+    if shard is not None:
+        log_name += f"_shard_{shard[0]}_of_{shard[1]}"
+        static_fields["shard"] = args.shard
+    if args.worker:
+        log_name += f"_worker_{args.worker_id}"
+        static_fields["worker_id"] = args.worker_id
+    configure_logging(
+        Path('logs') / f"{log_name}.log",
+        json_format=args.log_json,
+        static_fields=static_fields
+    )
     logger.info(f"Starting data generation process for category: {args.category}, platform: {args.platform}")
     
+    if args.metrics_port is not None:
+        metrics.set_constant_labels(category=args.category, platform=args.platform)
+        start_metrics_server(args.metrics_port)
+    
+    if args.trace:
+        try:
+            configure_tracing(args.trace, file_path=args.trace_file, endpoint=args.otlp_endpoint)
+        except RuntimeError as e:
+            logger.error(str(e))
+            return 1
+        # Flush buffered spans on every exit path, including sys.exit()
+        atexit.register(shutdown_tracing)
+    
+    if args.profile:
+        configure_profiling(args.profile, f"generate_{args.category}_{args.platform}")
+        atexit.register(finish_profiling)
+    
     try:
-        # Initialize Bedrock client
-        bedrock_client = BedrockClient(region=config.region)
+        # Initialize Bedrock client with a live, recording or replaying backend
+        if args.replay:
+            backend = ReplayBackend(
+                args.replay,
+                latency=args.replay_latency,
+                jitter=args.replay_jitter,
+                throttle_rate=args.replay_throttle_rate,
+                malformed_rate=args.replay_malformed_rate,
+                seed=args.replay_seed
+            )
+            logger.info(f"Replaying Bedrock responses from: {args.replay}")
+        else:
+            backend = BotoBackend(region=config.region, api="converse" if config.prompt_caching else "invoke")
+            if args.record:
+                backend = RecordingBackend(backend, args.record)
+                logger.info(f"Recording Bedrock responses to: {args.record}")
+        bedrock_client = BedrockClient(
+            region=config.region,
+            backend=backend,
+            requests_per_minute=config.requests_per_minute,
+            retry_budget=RetryBudget(
+                config.retry_budget_ratio,
+                min_retries=config.retry_budget_min_retries,
+                window_s=config.retry_budget_window_s
+            ) if config.retry_budget_ratio is not None else None,
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=config.circuit_failure_threshold,
+                window=config.circuit_window,
+                min_calls=config.circuit_min_calls,
+                cooldown_s=config.circuit_cooldown_s,
+                max_pause_s=config.circuit_max_pause_s
+            ) if config.circuit_breaker else None
+        )
         logger.info(f"Initialized Bedrock client for region: {config.region}")
         
         # Initialize data generator
-        generator = DataGenerator(bedrock_client, args.category, args.platform)
+        generator = DataGenerator(bedrock_client, args.category, args.platform, shard=shard)
         logger.info(f"Initialized data generator for category: {args.category}, platform: {args.platform}")
         
+        if args.merge_shards is not None:
+            summary = generator.merge_shards(args.merge_shards)
+            logger.info(
+                f"Merged {summary['merged_items']}/{summary['items']} Tier 2 items: {summary['seeds']} seeds, "
+                f"{summary['duplicates_dropped']} cross-shard duplicates dropped"
+            )
+            logger.info(f"  - {generator.tier3_aggregated_file}")
+            logger.info(f"  - {generator.seed_index_file}")
+            if summary['missing_items']:
+                logger.warning(f"{len(summary['missing_items'])} Tier 2 items are not finished by any shard yet")
+                return 1
+            return 0
+        
+        if queue_mode:
+            if args.queue_pg:
+                queue = PostgresWorkQueue(
+                    get_pg_conn_string(in_vpc=args.in_vpc),
+                    args.category,
+                    args.platform,
+                    max_connections=config.max_concurrency + 1
+                )
+            else:
+                queue = SqliteWorkQueue(args.queue_db, args.category, args.platform)
+            try:
+                if args.enqueue:
+                    summary = await generator.enqueue_jobs(queue)
+                    logger.info(f"Queued {summary['enqueued']} Tier 2 jobs; start workers with --worker")
+                elif args.worker:
+                    await generator.run_worker(queue, args.worker_id)
+                else:
+                    summary = generator.collect_jobs(queue)
+                    logger.info(f"Jobs by status: {summary['jobs']}")
+                    logger.info(f"  - {generator.tier3_aggregated_file} ({summary['seeds']} seeds)")
+                    if summary['jobs']['queued'] or summary['jobs']['leased'] or summary['jobs']['failed']:
+                        return 1
+            finally:
+                queue.close()
+            return 0
+        
+        if args.prepare_shards:
+            summary = await generator.prepare_shards()
+            logger.info(
+                f"Prepared {summary['tier1_count']} Tier 1 categories and {summary['tier2_count']} Tier 2 items; "
+                f"start shards with --shard INDEX/COUNT"
+            )
+            return 0
+        
+        # Optionally stream seeds into PostgreSQL while generating
+        sink = None
+        if args.pg_sink:
+            from lib.pg_sink import PostgresSink  # Deferred: psycopg is only needed with --pg-sink
+            sink = PostgresSink(
+                get_pg_conn_string(in_vpc=args.in_vpc),
+                args.category,
+                args.platform,
+                generator.tier3_dir / "pg_sink_ledger.jsonl"
+            )
+            await sink.start()
+            generator.attach_sink(sink)
+            logger.info(f"Streaming Tier 3 seeds to PostgreSQL (VPC: {args.in_vpc})")
+        
         # Generate all data
-        results = await generator.generate_all_data()
+        try:
+            results = await generator.generate_all_data()
+        finally:
+            if sink is not None:
+                await sink.close()
         
         # Print results summary
         logger.info("=" * 60)
@@ -105,6 +482,7 @@ async def main():
         logger.info(f"  - tier2_{args.category}_[category].csv files (separate file for each Tier 1 category)")
         logger.info(f"  - all_tier3_{args.category}_{args.platform}.csv (aggregated Tier 3 data for {args.platform})")
         logger.info(f"  - tier3_{args.category}_{args.platform}_[practice].csv files (separate file for each Tier 2 practice)")
+        logger.info(f"  - {config.run_report_filename} (call latency, token usage and estimated cost)")
         
         # Calculate totals
         total_items = results['tier1_count'] + results['tier2_count'] + results['tier3_count']
@@ -115,12 +493,15 @@ async def main():
     except BedrockError as e:
         logger.error(f"Bedrock API error: {e}")
         sys.exit(1)
+    except ShardingError as e:
+        logger.error(str(e))
+        sys.exit(1)
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = main()
     sys.exit(exit_code)
 
@@ -3,44 +3,43 @@
 Script to upsert generated seeds from CSV files to PostgreSQL seeds_posts table
 """
 
+import atexit
 import csv
 import sys
+import json
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Dict, Any, Optional
+from typing import Iterable, Dict, Any, List, Optional
 
 import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from lib.util import get_pg_conn_string
-from lib.config import config
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+from lib.seeds_db import (
+    UPSERT_SQL,
+    NORMALIZED_UPSERT_SQL,
+    attach_hierarchy_ids,
+    build_seed_rows,
+    dedupe_rows,
+    order_rows,
 )
+from lib.config import config
+from lib.tracing import configure_tracing, shutdown_tracing, span
+from lib.profiling import PROFILE_MODES, configure_profiling, finish_profiling, profile_stage
+from lib.logging_setup import configure_logging
+from lib.sharding import SHARDS_DIRNAME
 
 logger = logging.getLogger(__name__)
 
 
-UPSERT_SQL = """
-INSERT INTO afleau.seeds_posts (platform, raw_input, parsed_json, priority)
-VALUES (%(platform)s, %(raw_input)s, %(parsed_json)s::jsonb, %(priority)s)
-ON CONFLICT (platform, lower(btrim(raw_input)))
-DO UPDATE SET
-    parsed_json = COALESCE(EXCLUDED.parsed_json, afleau.seeds_posts.parsed_json),
-    priority    = GREATEST(afleau.seeds_posts.priority, COALESCE(EXCLUDED.priority, 0)),
-    updated_at  = now();
-"""
-
-
 def read_tier3_csv(file_path: Path, category: str) -> Iterable[Dict[str, Any]]:
     """
     Read Tier 3 CSV file and yield seed dictionaries.
@@ -66,63 +65,58 @@ def read_tier3_csv(file_path: Path, category: str) -> Iterable[Dict[str, Any]]:
             }
 
 
+def _write_rows(conn: psycopg.Connection, rows: List[Dict[str, Any]], normalized: bool = False):
+    """Write rows in conflict-key order so concurrent upserts lock rows consistently"""
+    with span("upsert.batch", rows=len(rows), normalized=normalized), profile_stage("db_write"):
+        sql = UPSERT_SQL
+        if normalized:
+            rows = attach_hierarchy_ids(conn, rows)
+            sql = NORMALIZED_UPSERT_SQL
+        with conn.cursor() as cur:
+            cur.executemany(sql, order_rows(rows))
+        conn.commit()
+
+
 def upsert_seeds(
     conn_str: str,
     seeds: Iterable[Dict[str, Any]],
     platform: str,
     default_priority: int = 0,
+    pool: Optional[ConnectionPool] = None,
+    normalized: bool = False,
 ) -> int:
     """
     Upsert seeds into afleau.seeds_posts.
 
-    Each seed item should look like:
-      {
-        "category": "health_wellbeing",
-        "tier1_name": "Fitness",
-        "tier2_name": "Yoga",
-        "seed_text": "beginner yoga for flexibility"
-      }
-    """
-    rows = []
-    for s in seeds:
-        seed_text = (s.get("seed_text") or s.get("text") or "").strip()
-        if not seed_text:
-            continue
+    Seeds are converted with build_seed_rows() and deduplicated on the
+    conflict key before being sent, so each key is written once per call.
+    When a connection pool is given, a pooled connection is used instead of
+    opening a new one from conn_str. With normalized=True the hierarchy is
+    written to the seed_tier1/seed_tier2 tables and referenced by id
+    (requires migrations/001_seed_hierarchy.sql).
 
-        category = (s.get("category") or "").strip() or None
-        tier1_name = (s.get("tier1_name") or "").strip() or None
-        tier2_name = (s.get("tier2_name") or "").strip() or None
-        priority = s.get("priority", default_priority)
-
-        # Build parsed_json with category hierarchy
-        parsed_json = {}
-        if category:
-            parsed_json["category"] = category
-        if tier1_name:
-            parsed_json["tier1_name"] = tier1_name
-        if tier2_name:
-            parsed_json["tier2_name"] = tier2_name
-
-        rows.append(
-            {
-                "platform": platform,
-                "raw_input": seed_text,
-                "parsed_json": psycopg.types.json.Json(parsed_json) if parsed_json else None,
-                "priority": int(priority) if priority is not None else default_priority,
-            }
-        )
+    Returns:
+        Number of rows sent to PostgreSQL
+    """
+    with profile_stage("row_building"):
+        rows, collapsed = dedupe_rows(build_seed_rows(seeds, platform, default_priority))
 
     if not rows:
         logger.warning("No rows to upsert")
         return 0
 
+    if collapsed:
+        logger.info(f"Collapsed {collapsed} duplicate seeds sharing a conflict key")
+
     logger.info(f"Upserting {len(rows)} seeds to PostgreSQL...")
     
     try:
-        with psycopg.connect(conn_str, row_factory=dict_row) as conn:
-            with conn.cursor() as cur:
-                cur.executemany(UPSERT_SQL, rows)
-                conn.commit()
+        if pool is not None:
+            with pool.connection() as conn:
+                _write_rows(conn, rows, normalized)
+        else:
+            with psycopg.connect(conn_str, row_factory=dict_row) as conn:
+                _write_rows(conn, rows, normalized)
         logger.info(f"Successfully upserted {len(rows)} seeds")
         return len(rows)
     except Exception as e:
@@ -140,6 +134,168 @@ def get_tier3_file_path(category: str, platform: str) -> Path:
     return output_dir / filename
 
 
+@dataclass
+class Tier3Artifact:
+    """An aggregated Tier 3 CSV file and the metadata needed to upsert it"""
+    file_path: Path
+    category: str
+    platform: str
+
+
+def load_manifest(directory: Path) -> Optional[Dict[str, Any]]:
+    """Load the generator manifest from an output directory, if present"""
+    manifest_path = directory / config.get_manifest_file()
+    if not manifest_path.exists():
+        return None
+    
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return None
+
+
+def resolve_artifact(file_path: Path, base_dir: Optional[Path] = None) -> Optional[Tier3Artifact]:
+    """
+    Resolve category and platform for an aggregated Tier 3 file.
+    
+    The manifest written next to the file by the generator is authoritative.
+    Outputs produced before manifests existed fall back to the
+    {base_output_dir}/{platform}/{category}/ directory layout, and files
+    outside it to their all_tier3_{category}_{platform}.csv name.
+    """
+    manifest = load_manifest(file_path.parent)
+    if manifest and manifest.get("tier3_aggregated_file") == file_path.name:
+        return Tier3Artifact(file_path, manifest["category"], manifest["platform"])
+    
+    if base_dir is not None:
+        try:
+            parts = file_path.resolve().relative_to(base_dir.resolve()).parts
+        except ValueError:
+            parts = ()
+        if len(parts) == 3 and config.is_valid_platform(parts[0]):
+            return Tier3Artifact(file_path, parts[1], parts[0])
+    
+    # Pattern: all_tier3_{category}_{platform}.csv
+    if file_path.stem.startswith('all_tier3_'):
+        category, _, platform = file_path.stem[len('all_tier3_'):].rpartition('_')
+        if category and config.is_valid_platform(platform):
+            return Tier3Artifact(file_path, category, platform)
+    
+    return None
+
+
+def discover_tier3_artifacts(base_dir: Path) -> List[Tier3Artifact]:
+    """Discover every aggregated Tier 3 file under the base output directory"""
+    artifacts = []
+    for file_path in sorted(base_dir.rglob("all_tier3_*.csv")):
+        # Shard-local aggregates are partial; only their merged output is canonical
+        if SHARDS_DIRNAME in file_path.relative_to(base_dir).parts:
+            continue
+        artifact = resolve_artifact(file_path, base_dir)
+        if artifact is None:
+            logger.warning(
+                f"Skipping {file_path}: no manifest, not in a {{platform}}/{{category}} directory "
+                f"and not named all_tier3_{{category}}_{{platform}}.csv"
+            )
+            continue
+        artifacts.append(artifact)
+    return artifacts
+
+
+def upsert_artifact(
+    artifact: Tier3Artifact,
+    conn_str: str,
+    default_priority: int = 0,
+    limit: Optional[int] = None,
+    pool: Optional[ConnectionPool] = None,
+    normalized: bool = False,
+) -> Dict[str, Any]:
+    """
+    Read and upsert one aggregated Tier 3 file.
+    
+    Returns:
+        Summary dictionary with seed, row and collapsed counts, and any error
+    """
+    summary = {
+        "file": str(artifact.file_path),
+        "category": artifact.category,
+        "platform": artifact.platform,
+        "seeds": 0,
+        "rows": 0,
+        "collapsed": 0,
+        "error": None,
+    }
+    
+    try:
+        seeds = list(read_tier3_csv(artifact.file_path, artifact.category))
+        if limit is not None and limit > 0:
+            seeds = seeds[:limit]
+        summary["seeds"] = len(seeds)
+        
+        summary["rows"] = upsert_seeds(
+            conn_str=conn_str,
+            seeds=seeds,
+            platform=artifact.platform,
+            default_priority=default_priority,
+            pool=pool,
+            normalized=normalized,
+        )
+        summary["collapsed"] = summary["seeds"] - summary["rows"]
+    except Exception as e:
+        logger.error(f"Failed to upsert {artifact.file_path}: {e}")
+        summary["error"] = str(e)
+    
+    return summary
+
+
+def upsert_all(
+    conn_str: str,
+    base_dir: Path,
+    default_priority: int = 0,
+    limit: Optional[int] = None,
+    workers: int = 4,
+    normalized: bool = False,
+) -> List[Dict[str, Any]]:
+    """Upsert every discovered Tier 3 artifact concurrently over a shared connection pool"""
+    artifacts = discover_tier3_artifacts(base_dir)
+    if not artifacts:
+        logger.warning(f"No all_tier3_* files found under {base_dir}")
+        return []
+    
+    logger.info(f"Discovered {len(artifacts)} Tier 3 files under {base_dir}")
+    workers = max(1, min(workers, len(artifacts)))
+    
+    with ConnectionPool(conn_str, min_size=1, max_size=workers, kwargs={"row_factory": dict_row}) as pool:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda artifact: upsert_artifact(artifact, conn_str, default_priority, limit, pool, normalized),
+                artifacts
+            ))
+
+
+def log_summary(summaries: List[Dict[str, Any]]):
+    """Log one consolidated summary for a multi-file upsert"""
+    logger.info("=" * 60)
+    logger.info("UPSERT COMPLETE - SUMMARY")
+    logger.info("=" * 60)
+    for summary in summaries:
+        status = f"FAILED ({summary['error']})" if summary["error"] else "ok"
+        logger.info(
+            f"{summary['platform']}/{summary['category']}: {summary['seeds']} seeds, "
+            f"{summary['rows']} rows, {summary['collapsed']} collapsed - {status}"
+        )
+    
+    failed = [summary for summary in summaries if summary["error"]]
+    logger.info("-" * 60)
+    logger.info(f"Files: {len(summaries)} ({len(failed)} failed)")
+    logger.info(f"Seeds read: {sum(summary['seeds'] for summary in summaries)}")
+    logger.info(f"Rows upserted: {sum(summary['rows'] for summary in summaries)}")
+    logger.info(f"Rows collapsed: {sum(summary['collapsed'] for summary in summaries)}")
+    logger.info("=" * 60)
+
+
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(
@@ -180,14 +336,77 @@ def main():
         action='store_false',
         help='Use public IP for database connection (default)'
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
         '--file',
         type=Path,
         help='Path to CSV file (overrides category/platform)'
     )
+    source.add_argument(
+        '--all',
+        action='store_true',
+        help='Upsert every all_tier3_* file under the base output directory'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=4,
+        help='Number of files to upsert concurrently with --all (default: 4)'
+    )
+    parser.add_argument(
+        '--normalized',
+        action='store_true',
+        help='Store tier metadata in seed_tier1/seed_tier2 tables and reference it by id '
+             '(requires migrations/001_seed_hierarchy.sql)'
+    )
+    parser.add_argument(
+        '--trace',
+        choices=['otlp', 'file'],
+        default=None,
+        help='Export OpenTelemetry spans to an OTLP collector or a JSON-lines file'
+    )
+    parser.add_argument(
+        '--trace-file',
+        type=Path,
+        default=Path('logs/traces.jsonl'),
+        help='Span output file for --trace file (default: logs/traces.jsonl)'
+    )
+    parser.add_argument(
+        '--otlp-endpoint',
+        default=None,
+        help='OTLP/HTTP traces endpoint for --trace otlp (default: http://localhost:4318/v1/traces)'
+    )
+    parser.add_argument(
+        '--profile',
+        choices=PROFILE_MODES,
+        default=None,
+        help='Write per-stage profiles (row building, DB write) to logs/profiles/'
+    )
+    parser.add_argument(
+        '--log-json',
+        action='store_true',
+        help='Write log records as JSON lines'
+    )
 
     args = parser.parse_args()
 
+    configure_logging(json_format=args.log_json)
+
+    if args.trace:
+        try:
+            configure_tracing(args.trace, file_path=args.trace_file, endpoint=args.otlp_endpoint,
+                              service_name="seed-upsert")
+        except RuntimeError as e:
+            logger.error(str(e))
+            sys.exit(1)
+        # Flush buffered spans on every exit path, including sys.exit()
+        atexit.register(shutdown_tracing)
+
+    if args.profile:
+        run_name = "upsert_all" if args.all else f"upsert_{args.category}_{args.platform}"
+        configure_profiling(args.profile, run_name)
+        atexit.register(finish_profiling)
+
     # Get connection string
     try:
         conn_str = get_pg_conn_string(in_vpc=args.in_vpc)
@@ -196,20 +415,27 @@ def main():
         logger.error(f"Failed to get connection string: {e}")
         sys.exit(1)
 
-    # Determine file path and extract category/platform
+    if args.all:
+        summaries = upsert_all(
+            conn_str=conn_str,
+            base_dir=Path(config.base_output_dir),
+            default_priority=args.priority,
+            limit=args.limit,
+            workers=args.workers,
+            normalized=args.normalized
+        )
+        log_summary(summaries)
+        if any(summary["error"] for summary in summaries):
+            sys.exit(1)
+        sys.exit(0)
+
+    # Determine file path and category/platform
     if args.file:
         file_path = args.file
-        # Try to extract category and platform from filename
-        # Pattern: all_tier3_{category}_{platform}.csv
-        filename = file_path.stem
-        if filename.startswith('all_tier3_'):
-            parts = filename.replace('all_tier3_', '').split('_')
-            if len(parts) >= 2:
-                category = '_'.join(parts[:-1])
-                platform = parts[-1]
-            else:
-                category = args.category
-                platform = args.platform
+        artifact = resolve_artifact(file_path, Path(config.base_output_dir))
+        if artifact is not None:
+            category = artifact.category
+            platform = artifact.platform
         else:
             category = args.category
             platform = args.platform
@@ -242,7 +468,8 @@ def main():
             conn_str=conn_str,
             seeds=seeds,
             platform=platform,
-            default_priority=args.priority
+            default_priority=args.priority,
+            normalized=args.normalized
         )
         logger.info(f"Successfully upserted {count} seeds to afleau.seeds_posts")
     except Exception as e:
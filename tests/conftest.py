@@ -0,0 +1,65 @@
+"""
+Shared test fixtures
+"""
+
+import asyncio
+import copy
+from dataclasses import fields
+
+import pytest
+
+from lib.backends import BedrockBackend, SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+
+# Response sizes of the pipeline run_generator runs: 2 Tier 1 categories, 6 Tier 2 items, 24 seeds
+RUN_SIZES = {"tier1_items": 2, "tier2_items": 3, "tier3_items": 4}
+
+
+class CapturingBackend(BedrockBackend):
+    """Records the model ID and request body of every call before passing it to a SyntheticBackend"""
+
+    def __init__(self):
+        self.inner = SyntheticBackend(**RUN_SIZES)
+        self.model_ids = []
+        self.requests = []
+
+    @property
+    def calls(self):
+        return self.inner.calls
+
+    async def invoke(self, model_id, request_body):
+        self.model_ids.append(model_id)
+        self.requests.append(request_body)
+        return await self.inner.invoke(model_id, request_body)
+
+
+@pytest.fixture
+def isolated_config(tmp_path, monkeypatch):
+    """The global config with every field restored after the test, writing outputs under tmp_path/data"""
+    for field in fields(config):
+        monkeypatch.setattr(config, field.name, copy.deepcopy(getattr(config, field.name)))
+    config.base_output_dir = str(tmp_path / "data")
+    return config
+
+
+@pytest.fixture
+def capturing_backend():
+    return CapturingBackend()
+
+
+@pytest.fixture
+def run_generator(isolated_config):
+    """
+    Run the food/youtube pipeline and return (generator, backend, results).
+
+    Each call without a backend uses a fresh SyntheticBackend of RUN_SIZES,
+    so backend.calls counts only that run's calls.
+    """
+    def run(backend=None):
+        backend = backend or SyntheticBackend(**RUN_SIZES)
+        generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+        return generator, backend, asyncio.run(generator.generate_all_data())
+
+    return run
@@ -0,0 +1,82 @@
+"""
+Tests for the record/replay Bedrock backends
+"""
+
+import asyncio
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lib.backends import BedrockBackend, RecordingBackend, ReplayBackend, FixtureNotFoundError
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+
+
+class CannedBackend(BedrockBackend):
+    """Answers each tier's prompt with a fixed, valid JSON payload"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def invoke(self, model_id, request_body):
+        self.calls += 1
+        prompt = request_body["messages"][0]["content"][0]["text"]
+        if "search_seeds" in prompt:
+            payload = {"search_seeds": [f"search seed {self.calls} number {i}" for i in range(3)]}
+        elif "tier2_items" in prompt:
+            payload = {"tier2_items": [f"Practice {self.calls}-{i}" for i in range(2)]}
+        else:
+            payload = {"tier1_categories": ["Fitness", "Nutrition"]}
+        return {"output": {"message": {"content": [{"text": json.dumps(payload)}]}}}
+
+
+def run_generator(backend, output_dir):
+    """Run a full generation into output_dir and return the aggregated Tier 3 CSV"""
+    config.base_output_dir = str(output_dir)
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+    results = asyncio.run(generator.generate_all_data())
+    assert results["errors"] == []
+    return generator.tier3_aggregated_file.read_text()
+
+
+def test_record_then_replay_reproduces_run(isolated_config, tmp_path):
+    """A replayed run produces the same outputs without calling the live backend"""
+    archive = tmp_path / "fixtures.jsonl"
+    live = CannedBackend()
+
+    recorded = run_generator(RecordingBackend(live, archive), tmp_path / "recorded")
+    replayed = run_generator(ReplayBackend(archive), tmp_path / "replayed")
+
+    # Tier 1 + one Tier 2 call per Tier 1 + one Tier 3 call per Tier 2
+    assert live.calls == 1 + 2 + 4
+    assert replayed == recorded
+
+
+def test_replay_fault_injection(tmp_path):
+    """Throttles surface as ClientError and malformed responses fail to parse"""
+    archive = tmp_path / "fixtures.jsonl"
+    body = {"messages": [{"role": "user", "content": [{"text": "prompt"}]}]}
+    asyncio.run(RecordingBackend(CannedBackend(), archive).invoke("model", body))
+
+    with pytest.raises(ClientError):
+        asyncio.run(ReplayBackend(archive, throttle_rate=1.0).invoke("model", body))
+
+    response = asyncio.run(ReplayBackend(archive, malformed_rate=1.0).invoke("model", body))
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(response["output"]["message"]["content"][0]["text"])
+
+    other = {"messages": [{"role": "user", "content": [{"text": "unrecorded"}]}]}
+    with pytest.raises(FixtureNotFoundError):
+        asyncio.run(ReplayBackend(archive).invoke("model", other))
+
+
+def test_backend_interface_requires_invoke():
+    class NoInvoke(BedrockBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        BedrockBackend()
+    with pytest.raises(TypeError):
+        NoInvoke()
@@ -0,0 +1,96 @@
+"""
+Tests for concurrent Tier 2/Tier 3 generation (--max-concurrency)
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+from pathlib import Path
+
+from lib.backends import BedrockBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+
+
+class PromptKeyedBackend(BedrockBackend):
+    """
+    Answers depend only on the prompt, so sequential and concurrent runs see
+    the same responses; the latency also varies by prompt, so concurrent
+    calls complete out of order.
+    """
+
+    def __init__(self, shared_seed=None):
+        self.shared_seed = shared_seed
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def invoke(self, model_id, request_body):
+        instructions = json.dumps(request_body.get("system")) + json.dumps(request_body["messages"])
+        digest = hashlib.sha256(instructions.encode()).hexdigest()[:8]
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(int(digest, 16) % 5 * 0.005)
+        self.in_flight -= 1
+
+        if "search_seeds" in instructions:
+            seeds = [f"prompt {digest} seed idea {i}" for i in range(3)]
+            if self.shared_seed:
+                seeds.append(self.shared_seed)
+            payload = {"search_seeds": seeds}
+        elif "tier2_items" in instructions:
+            payload = {"tier2_items": [f"Practice {digest} {i}" for i in range(3)]}
+        else:
+            payload = {"tier1_categories": ["Baking", "Grilling", "Preserving"]}
+        return {"output": {"message": {"content": [{"text": json.dumps(payload)}]}}}
+
+
+def _run(output_dir, max_concurrency, backend=None):
+    config.base_output_dir = str(output_dir)
+    config.max_concurrency = max_concurrency
+    backend = backend or PromptKeyedBackend()
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+    results = asyncio.run(generator.generate_all_data())
+    assert results["errors"] == []
+    return Path(generator.output_dir), backend
+
+
+def _checkpoints(output_dir):
+    """Contents of every tier checkpoint and aggregate, by file name"""
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(output_dir.iterdir())
+        if path.name.startswith(("tier", "all_tier"))
+    }
+
+
+def _seed_texts(output_dir):
+    with open(output_dir / "all_tier3_food_youtube.csv", encoding="utf-8") as f:
+        return [row["seed_text"] for row in csv.DictReader(f)]
+
+
+def test_concurrent_run_matches_sequential_checkpoints(isolated_config, tmp_path):
+    sequential_dir, _ = _run(tmp_path / "sequential", max_concurrency=1)
+    concurrent_dir, backend = _run(tmp_path / "concurrent", max_concurrency=4)
+
+    assert backend.max_in_flight > 1
+    sequential = _checkpoints(sequential_dir)
+    assert len(sequential) == 1 + 3 + 1 + 9 + 1
+    # Aggregates follow Tier 1/Tier 2 order, not completion order
+    assert _checkpoints(concurrent_dir) == sequential
+
+
+def test_cross_item_duplicate_is_kept_once(isolated_config, tmp_path):
+    """With several items in flight the duplicate goes to whichever item finishes first"""
+    shared = "one seed every item suggests"
+
+    sequential_dir, _ = _run(tmp_path / "sequential", 1, PromptKeyedBackend(shared_seed=shared))
+    concurrent_dir, _ = _run(tmp_path / "concurrent", 4, PromptKeyedBackend(shared_seed=shared))
+
+    for output_dir in (sequential_dir, concurrent_dir):
+        seeds = _seed_texts(output_dir)
+        assert seeds.count(shared) == 1
+        assert len(seeds) == 9 * 3 + 1
+    assert _seed_texts(sequential_dir).index(shared) == 3
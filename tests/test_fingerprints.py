@@ -0,0 +1,64 @@
+"""
+Tests for prompt fingerprinting and checkpoint invalidation
+"""
+
+import json
+
+from lib.config import config
+from lib.fingerprints import fingerprint
+from lib.planner import plan_run
+from lib.registry import prompt_registry
+
+
+def test_fingerprint_covers_template_and_inference_settings():
+    base = fingerprint("prompt", "model", 0.1, 0.9, 4000)
+    assert fingerprint("prompt", "model", 0.1, 0.9, 4000) == base
+    assert fingerprint("prompt!", "model", 0.1, 0.9, 4000) != base
+    assert fingerprint("prompt", "other", 0.1, 0.9, 4000) != base
+    assert fingerprint("prompt", "model", 0.2, 0.9, 4000) != base
+
+
+def test_unchanged_prompts_reuse_every_checkpoint(run_generator):
+    generator, _, _ = run_generator()
+    with open(generator.output_dir / config.fingerprints_filename, encoding='utf-8') as f:
+        recorded = json.load(f)
+    # Tier 1 + 2 Tier 2 + 6 Tier 3 checkpoints
+    assert len(recorded) == 9
+
+    _, backend, results = run_generator()
+
+    assert backend.calls == 0
+    assert results["invalidated"] == {"tier1": 0, "tier2": 0, "tier3": 0}
+
+
+def test_tier3_prompt_edit_regenerates_only_tier3(run_generator, monkeypatch):
+    run_generator()
+    prompts = prompt_registry.get_prompts("food")
+    original = prompts.build_tier3_prompt
+    monkeypatch.setattr(prompts, "build_tier3_prompt", lambda *args: original(*args) + "\nPrefer short seeds.")
+
+    plan = plan_run("food", "youtube")
+    assert (plan.stages["tier3"].stale, plan.stages["tier3"].calls, plan.stages["tier2"].calls) == (6, 6, 0)
+
+    generator, backend, results = run_generator()
+
+    assert backend.calls == 6
+    assert results["invalidated"] == {"tier1": 0, "tier2": 0, "tier3": 6}
+    with open(generator.run_report_file, encoding='utf-8') as f:
+        assert json.load(f)["invalidated_checkpoints"]["tier3"] == 6
+
+    # The regenerated checkpoints now carry the new fingerprint
+    _, backend, _ = run_generator()
+    assert backend.calls == 0
+
+
+def test_legacy_checkpoints_adopt_current_fingerprint(run_generator):
+    generator, _, _ = run_generator()
+    fingerprints_file = generator.output_dir / config.fingerprints_filename
+    fingerprints_file.unlink()
+
+    _, backend, results = run_generator()
+
+    assert backend.calls == 0
+    assert sum(results["invalidated"].values()) == 0
+    assert fingerprints_file.exists()
@@ -0,0 +1,112 @@
+"""
+Tests for hedged model calls
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from lib.backends import BedrockBackend, SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+from lib.hedging import HedgePolicy
+from lib.telemetry import CallRecord, CallTelemetry
+
+
+def _telemetry(samples=20, latency_s=0.01):
+    telemetry = CallTelemetry()
+    for _ in range(samples):
+        telemetry.record(CallRecord(model_id="m", stage="tier3", category="c", attempt=1, latency_s=latency_s, outcome="ok"))
+    return telemetry
+
+
+def _policy(**overrides):
+    options = {"budget_ratio": 1.0, "min_samples": 20, "min_delay_s": 0.01, **overrides}
+    return HedgePolicy(_telemetry(), **options)
+
+
+def test_slow_call_is_hedged_and_loser_cancelled():
+    policy = _policy()
+    cancelled = []
+
+    async def call(hedge):
+        try:
+            await asyncio.sleep(0.01 if hedge else 5)
+        except asyncio.CancelledError:
+            cancelled.append(hedge)
+            raise
+        return "hedge" if hedge else "primary"
+
+    assert asyncio.run(policy.run("tier3", call)) == "hedge"
+    assert cancelled == [False]
+    assert (policy.calls, policy.hedges, policy.wins) == (1, 1, 1)
+
+
+def test_hedge_needs_samples_and_budget():
+    async def call(hedge):
+        await asyncio.sleep(0.01 if hedge else 0.1)
+        return hedge
+
+    # Too few observed calls of the stage
+    policy = HedgePolicy(_telemetry(samples=5), min_samples=20, min_delay_s=0.01, budget_ratio=1.0)
+    assert asyncio.run(policy.run("tier3", call)) is False and policy.hedges == 0
+
+    # 5% of 10 calls is less than one hedge
+    policy = _policy(budget_ratio=0.05)
+    policy.calls = 9
+    assert asyncio.run(policy.run("tier3", call)) is False and policy.hedges == 0
+    policy.calls = 19
+    assert asyncio.run(policy.run("tier3", call)) is True and policy.hedges == 1
+
+
+def test_failed_copy_falls_back_to_the_other():
+    policy = _policy()
+
+    async def primary_fails(hedge):
+        await asyncio.sleep(0.05 if hedge else 0.02)
+        if not hedge:
+            raise json.JSONDecodeError("truncated", "{", 1)
+        return "hedge"
+
+    assert asyncio.run(policy.run("tier3", primary_fails)) == "hedge"
+
+    async def both_fail(hedge):
+        await asyncio.sleep(0.05 if hedge else 0.02)
+        raise ValueError("hedge" if hedge else "primary")
+
+    with pytest.raises(ValueError, match="primary"):
+        asyncio.run(policy.run("tier3", both_fail))
+
+
+class StallingBackend(BedrockBackend):
+    """SyntheticBackend whose n-th Tier 3 request never returns in time"""
+
+    def __init__(self, stall_call):
+        self.inner = SyntheticBackend(tier1_items=2, tier2_items=6, tier3_items=4)
+        self.stall_call = stall_call
+        self.tier3_calls = 0
+
+    async def invoke(self, model_id, request_body):
+        if "search_seeds" in json.dumps(request_body):
+            self.tier3_calls += 1
+            await asyncio.sleep(30 if self.tier3_calls == self.stall_call else 0.01)
+        return await self.inner.invoke(model_id, request_body)
+
+
+def test_generator_hedges_stalled_tier3_call(isolated_config):
+    config.hedge_requests = True
+    config.hedge_min_samples = 5
+    config.hedge_min_delay_s = 0.05
+    config.hedge_budget_ratio = 0.1
+    backend = StallingBackend(stall_call=8)
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+
+    results = asyncio.run(asyncio.wait_for(generator.generate_all_data(), timeout=10))
+
+    assert results["errors"] == [] and results["tier3_count"] == 48
+    with open(generator.run_report_file, encoding='utf-8') as f:
+        report = json.load(f)
+    assert report["hedging"]["hedges"] == 1 and report["hedging"]["hedge_wins"] == 1
+    assert report["stages"]["tier3"]["outcomes"] == {"ok": 12, "cancelled": 1}
@@ -0,0 +1,66 @@
+"""
+Tests for queue-based logging
+"""
+
+import json
+import logging
+
+import pytest
+
+from lib.logging_setup import JsonFormatter, configure_logging, stop_logging
+
+
+def test_json_formatter_includes_extra_and_static_fields():
+    formatter = JsonFormatter({"category": "food"})
+    record = logging.LogRecord("lib.generator", logging.INFO, __file__, 1, "Generated %d seeds", (12,), None)
+    record.tier = "tier3"
+
+    entry = json.loads(formatter.format(record))
+
+    assert entry["message"] == "Generated 12 seeds"
+    assert entry["category"] == "food"
+    assert entry["tier"] == "tier3"
+    assert entry["level"] == "INFO"
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    yield
+    stop_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in saved_handlers:
+        root.addHandler(handler)
+    root.setLevel(saved_level)
+
+
+def test_configure_logging_writes_through_queue_listener(tmp_path, restore_root_logger):
+    log_file = tmp_path / "logs" / "food_youtube_generation.log"
+    configure_logging(log_file, json_format=True, static_fields={"platform": "youtube"})
+    logging.getLogger("lib.test").info("Tier %s done", "tier1")
+    stop_logging()
+
+    entry = json.loads(log_file.read_text().splitlines()[-1])
+    assert entry["message"] == "Tier tier1 done"
+    assert entry["platform"] == "youtube"
+
+
+@pytest.mark.parametrize("json_format", [True, False])
+def test_exceptions_reach_the_listener_unformatted(tmp_path, restore_root_logger, json_format):
+    log_file = tmp_path / "generation.log"
+    configure_logging(log_file, json_format=json_format)
+    try:
+        raise ValueError("bad response")
+    except ValueError:
+        logging.getLogger("lib.test").exception("boom %s", 1)
+    stop_logging()
+
+    text = log_file.read_text()
+    if json_format:
+        entry = json.loads(text.splitlines()[-1])
+        assert entry["message"] == "boom 1"
+        assert entry["exception"].startswith("Traceback") and "ValueError: bad response" in entry["exception"]
+    else:
+        assert " - ERROR - boom 1\nTraceback" in text and text.count("ValueError: bad response") == 1
@@ -0,0 +1,85 @@
+"""
+Tests for the in-process metrics registry and its HTTP endpoint
+"""
+
+import asyncio
+import urllib.error
+import urllib.request
+
+import pytest
+
+from lib import generator as generator_module
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.generator import DataGenerator
+from lib.metrics import Metrics, metrics, start_metrics_server
+
+
+@pytest.fixture
+def clean_metrics():
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+def test_render_types_and_escapes_labels():
+    registry = Metrics()
+    registry.set_constant_labels(category='food "fast"', platform="youtube")
+    registry.inc("seedgen_model_calls_total", stage="tier3", outcome="ok")
+    registry.inc("seedgen_model_calls_total", 2, stage="tier3", outcome="ok")
+    registry.inc("seedgen_seeds_filtered_total", reason="back\\slash\nnewline")
+    registry.set("seedgen_inflight_calls", 3)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE seedgen_model_calls_total counter" in lines
+    assert "# TYPE seedgen_inflight_calls gauge" in lines
+    assert "# HELP seedgen_inflight_calls Model calls currently in flight" in lines
+    assert 'seedgen_model_calls_total{category="food \\"fast\\"",platform="youtube",outcome="ok",stage="tier3"} 3' in lines
+    assert 'seedgen_seeds_filtered_total{category="food \\"fast\\"",platform="youtube",reason="back\\\\slash\\nnewline"} 1' in lines
+    assert 'seedgen_inflight_calls{category="food \\"fast\\"",platform="youtube"} 3' in lines
+    # Metrics without samples still declare their type, and nothing else is emitted
+    assert "# TYPE seedgen_eta_seconds gauge" in lines
+    assert all(line.startswith(("# HELP ", "# TYPE ", "seedgen_")) for line in lines)
+
+
+def test_metrics_endpoint_serves_registry(clean_metrics):
+    clean_metrics.inc("seedgen_throttles_total")
+    server = start_metrics_server(0)
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        with urllib.request.urlopen(f"{base_url}/metrics", timeout=5) as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            body = response.read().decode()
+        assert "\nseedgen_throttles_total 1\n" in body
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{base_url}/other", timeout=5)
+        assert excinfo.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_eta_extrapolates_generation_rate(isolated_config, clean_metrics, monkeypatch):
+    generator = DataGenerator(BedrockClient(backend=SyntheticBackend()), "food", "youtube")
+    clean_metrics.set("seedgen_items_total", 10, tier="tier3")
+    clean_metrics.inc("seedgen_items_completed_total", 3, tier="tier3", source="checkpoint")
+    clean_metrics.inc("seedgen_items_completed_total", 2, tier="tier3", source="generated")
+    generator._tier3_started_at = 100.0
+    generator._tier3_generated = 1
+    monkeypatch.setattr(generator_module.time, "monotonic", lambda: 104.0)
+
+    generator._update_eta()
+
+    # 5 items left at 2 items per 4 seconds
+    assert clean_metrics.get("seedgen_eta_seconds") == 10.0
+
+
+def test_eta_reaches_zero_after_run(isolated_config, clean_metrics):
+    generator = DataGenerator(BedrockClient(backend=SyntheticBackend(tier1_items=2, tier2_items=2, tier3_items=3)), "food", "youtube")
+    asyncio.run(generator.generate_all_data())
+
+    assert clean_metrics.get("seedgen_items_completed_total", tier="tier3", source="generated") == 4
+    assert clean_metrics.get("seedgen_eta_seconds") == 0.0
@@ -0,0 +1,207 @@
+"""
+Tests for the streaming PostgreSQL sink
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from lib import pg_sink
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.generator import DataGenerator
+from lib.pg_sink import PostgresSink, SinkError
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def executemany(self, query, rows):
+        await self.conn.gate.wait()
+        if self.conn.fail:
+            raise RuntimeError("connection reset")
+        self.conn.batches.append([row["raw_input"] for row in rows])
+
+
+class FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    """Records the raw_input of every executemany batch; gate and fail control the writer"""
+
+    def __init__(self):
+        self.batches = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+        self.closed = False
+
+    def transaction(self):
+        return FakeTransaction()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_conn(monkeypatch):
+    holder = {}
+
+    async def connect(conn_str):
+        holder["conn"] = FakeConnection()
+        return holder["conn"]
+
+    monkeypatch.setattr(pg_sink.psycopg.AsyncConnection, "connect", staticmethod(connect))
+    return holder
+
+
+def _seeds(key, count=2):
+    return [{"tier1_name": "Baking", "tier2_name": key, "seed_text": f"{key} seed {i}"} for i in range(count)]
+
+
+def _sink(tmp_path, **options):
+    return PostgresSink("postgresql://test", "food", "youtube", tmp_path / "ledger.jsonl", **options)
+
+
+def test_batches_up_to_batch_size_and_records_ledger(tmp_path, fake_conn):
+    async def run():
+        async with _sink(tmp_path, batch_size=4) as sink:
+            for key in ("a", "b", "c"):
+                await sink.submit(key, _seeds(key))
+        return sink
+
+    sink = asyncio.run(run())
+
+    assert [len(batch) for batch in fake_conn["conn"].batches] == [4, 2]
+    assert sink.rows_written == 6 and fake_conn["conn"].closed
+    ledger = [json.loads(line)["key"] for line in (tmp_path / "ledger.jsonl").read_text().splitlines()]
+    assert ledger == ["a", "b", "c"]
+
+
+def test_resumed_sink_skips_delivered_checkpoints(tmp_path, fake_conn):
+    (tmp_path / "ledger.jsonl").write_text(json.dumps({"key": "a"}) + "\n")
+
+    async def run():
+        async with _sink(tmp_path) as sink:
+            assert sink.is_delivered("a") and not sink.is_delivered("b")
+            await sink.submit("a", _seeds("a"))
+            await sink.submit("b", _seeds("b"))
+
+    asyncio.run(run())
+
+    assert fake_conn["conn"].batches == [["b seed 0", "b seed 1"]]
+
+
+def test_full_queue_applies_backpressure(tmp_path, fake_conn):
+    async def run():
+        async with _sink(tmp_path, batch_size=1, max_pending=1) as sink:
+            conn = fake_conn["conn"]
+            conn.gate.clear()
+            await sink.submit("a", _seeds("a"))
+            await asyncio.sleep(0.01)  # The writer takes "a" and blocks in executemany
+            await sink.submit("b", _seeds("b"))  # Fills the queue
+            blocked = asyncio.ensure_future(sink.submit("c", _seeds("c")))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            conn.gate.set()
+            await asyncio.wait_for(blocked, timeout=1)
+
+    asyncio.run(run())
+
+    assert len(fake_conn["conn"].batches) == 3
+
+
+def test_writer_failure_releases_every_waiting_producer(tmp_path, fake_conn):
+    async def run():
+        sink = _sink(tmp_path, batch_size=1, max_pending=1)
+        await sink.start()
+        conn = fake_conn["conn"]
+        conn.gate.clear()
+        conn.fail = True
+        await sink.submit("a", _seeds("a"))
+        await asyncio.sleep(0.01)
+        await sink.submit("b", _seeds("b"))
+        # More producers wait than a drained queue could ever make room for
+        waiting = [asyncio.ensure_future(sink.submit(key, _seeds(key))) for key in "cdef"]
+        await asyncio.sleep(0.01)
+        conn.gate.set()
+        results = await asyncio.wait_for(asyncio.gather(*waiting, return_exceptions=True), timeout=1)
+        assert all(isinstance(result, SinkError) for result in results)
+        with pytest.raises(SinkError):
+            await sink.submit("g", _seeds("g"))
+        with pytest.raises(SinkError):
+            await sink.close()
+
+    asyncio.run(run())
+
+    assert fake_conn["conn"].batches == []
+    assert not (tmp_path / "ledger.jsonl").exists()
+
+
+def _generate_into_sink(tmp_path, backend):
+    """Run the food/youtube pipeline with a sink attached; returns the generator"""
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+
+    async def run():
+        async with _sink(tmp_path) as sink:
+            generator.attach_sink(sink)
+            await generator.generate_all_data()
+
+    asyncio.run(run())
+    return generator
+
+
+def _sent_seeds(conn):
+    return sorted(text for batch in conn.batches for text in batch)
+
+
+def _checkpoint_seeds(generator):
+    return sorted(
+        line.rsplit(",", 1)[-1]
+        for path in generator.output_dir.glob("tier3_*.csv")
+        for line in path.read_text().splitlines()[1:]
+    )
+
+
+def test_top_up_rounds_reach_the_sink(isolated_config, tmp_path, fake_conn):
+    isolated_config.target_seeds = 8
+    generator = _generate_into_sink(tmp_path, SyntheticBackend(tier1_items=1, tier2_items=2, tier3_items=2))
+
+    assert generator.top_up_calls == 2
+    assert len(_sent_seeds(fake_conn["conn"])) == 8
+    assert _sent_seeds(fake_conn["conn"]) == _checkpoint_seeds(generator)
+
+    # On resume, each topped-up checkpoint is re-sent once as a whole, then never again
+    backend = SyntheticBackend(tier1_items=1, tier2_items=2, tier3_items=2)
+    _generate_into_sink(tmp_path, backend)
+    assert _sent_seeds(fake_conn["conn"]) == _checkpoint_seeds(generator)
+    _generate_into_sink(tmp_path, backend)
+    assert fake_conn["conn"].batches == [] and backend.calls == 0
+
+
+def test_regenerated_stale_checkpoints_reach_the_sink(isolated_config, tmp_path, fake_conn):
+    _generate_into_sink(tmp_path, SyntheticBackend(tier1_items=1, tier2_items=2, tier3_items=2))
+    first_run = _sent_seeds(fake_conn["conn"])
+
+    isolated_config.tier_routes = {"tier3": {"model_id": "amazon.nova-lite-v1:0"}}
+    generator = _generate_into_sink(tmp_path, SyntheticBackend(tier1_items=1, tier2_items=2, tier3_items=2))
+
+    assert generator.invalidated["tier3"] == 2
+    assert _sent_seeds(fake_conn["conn"]) == _checkpoint_seeds(generator)
+    assert set(_sent_seeds(fake_conn["conn"])).isdisjoint(first_run)
@@ -0,0 +1,36 @@
+"""
+Tests for the dry-run planner
+"""
+
+import json
+
+from lib.generator import tier2_checkpoint_name, tier3_checkpoint_name
+from lib.planner import plan_run
+
+
+def test_plan_skips_checkpointed_items(tmp_path):
+    output_dir = tmp_path / "youtube" / "food"
+    output_dir.mkdir(parents=True)
+    (output_dir / "tier1_food.json").write_text(json.dumps(["Baking", "Grilling"]))
+    (output_dir / tier2_checkpoint_name("food", "Baking")).write_text(
+        "tier1_name,tier2_name\nBaking,Sourdough\nBaking,Cookies\n"
+    )
+    (output_dir / tier3_checkpoint_name("food", "youtube", "Sourdough")).write_text(
+        "tier1_name,tier2_name,seed_text\nBaking,Sourdough,sourdough starter tips\n"
+    )
+
+    plan = plan_run("food", "youtube", base_output_dir=str(tmp_path), max_concurrency=4)
+
+    assert plan.stages["tier1"].calls == 0
+    # Grilling is pending and food_prompts caps Tier 2 at MAX_TIER_2_ITEMS (20)
+    assert plan.stages["tier2"].calls == 1
+    assert plan.stages["tier3"].items == 22
+    assert plan.stages["tier3"].calls == 21
+    assert plan.input_tokens > 0 and plan.output_tokens > 0
+    assert plan.stages["tier3"].wall_clock_s == 6 * plan.stages["tier3"].latency_s
+
+
+def test_plan_honours_rate_limit(tmp_path):
+    plan = plan_run("travel", "instagram", base_output_dir=str(tmp_path), max_concurrency=64, requests_per_minute=60)
+
+    assert plan.stages["tier3"].wall_clock_s == plan.stages["tier3"].calls
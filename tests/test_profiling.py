@@ -0,0 +1,44 @@
+"""
+Tests for per-stage profiling
+"""
+
+import json
+
+from lib.profiling import StageProfiler, profile_stage
+
+
+def test_profile_stage_is_noop_when_disabled():
+    with profile_stage("tier1"):
+        pass
+
+
+def test_cprofile_nested_stages_write_separate_profiles(tmp_path):
+    profiler = StageProfiler("cprofile", tmp_path)
+    profiler.start()
+    with profiler.stage("tier3"):
+        for _ in range(3):
+            with profiler.stage("filter"):
+                sorted(range(1000))
+    profiler.stop()
+
+    output_dir = profiler.write()
+
+    summary = json.loads((output_dir / "summary.json").read_text())
+    assert summary["stages"]["filter"]["calls"] == 3
+    assert summary["stages"]["tier3"]["calls"] == 1
+    assert (output_dir / "filter.prof").exists()
+    assert "sorted" in (output_dir / "filter.txt").read_text()
+
+
+def test_tracemalloc_credits_child_peak_to_parent(tmp_path):
+    profiler = StageProfiler("tracemalloc", tmp_path)
+    profiler.start()
+    with profiler.stage("tier3"):
+        with profiler.stage("aggregation"):
+            buffer = bytearray(2_000_000)
+            del buffer
+    profiler.stop()
+
+    summary = json.loads((profiler.write() / "summary.json").read_text())
+    assert summary["stages"]["aggregation"]["peak_traced_bytes"] >= 2_000_000
+    assert summary["stages"]["tier3"]["peak_traced_bytes"] >= 2_000_000
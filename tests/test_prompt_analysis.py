@@ -0,0 +1,63 @@
+"""
+Tests for prompt token footprints and max_tokens recommendations
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from lib.prompt_analysis import analyze_prompts, observed_output_tokens, recommend_max_tokens
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def _write_report(path: Path, stages):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"stages": {
+        stage: {"output_tokens_per_call": {"p50": p99 // 2, "p95": p99, "p99": p99, "max": maximum}}
+        for stage, (p99, maximum) in stages.items()
+    }}))
+
+
+def test_every_tier_and_platform_is_measured_and_budget_flagged():
+    footprints = analyze_prompts(["food", "travel"], ["youtube", "instagram"], budget=500)
+
+    assert [(f.tier, f.platform) for f in footprints[:4]] == [
+        ("tier1", None), ("tier2", None), ("tier3", "youtube"), ("tier3", "instagram")
+    ]
+    assert len(footprints) == 8
+    assert all(f.prompt_tokens > 0 and f.expected_output_tokens > 0 for f in footprints)
+    assert {(f.category, f.tier) for f in footprints if f.over_budget} >= {("food", "tier1"), ("food", "tier3")}
+    assert not any(f.over_budget for f in footprints if f.category == "travel")
+
+
+def test_recommendations_use_largest_observed_p99(tmp_path):
+    _write_report(tmp_path / "youtube" / "food" / "run_report.json", {"tier2": (300, 350), "tier3": (500, 600)})
+    _write_report(tmp_path / "instagram" / "food" / "run_report.json", {"tier3_topup": (700, 900)})
+
+    observed = observed_output_tokens(tmp_path)
+    assert observed == {"tier2": {"p99": 300, "max": 350}, "tier3": {"p99": 700, "max": 900}}
+
+    recommendations = {
+        r.tier: r for r in recommend_max_tokens(analyze_prompts(["food"], ["youtube"], 800), observed)
+    }
+    assert (recommendations["tier2"].recommended, recommendations["tier2"].source) == (512, "observed")
+    assert recommendations["tier3"].recommended == 1024
+    # No Tier 1 report: twice the expected size plus headroom
+    assert recommendations["tier1"].source == "expected"
+    assert recommendations["tier1"].recommended >= 2 * recommendations["tier1"].expected
+
+
+def test_cli_exits_non_zero_over_budget(tmp_path):
+    def run(*arguments):
+        return subprocess.run(
+            [sys.executable, "scripts/analyze_prompts.py", "--category", "food", "--data-dir", str(tmp_path), *arguments],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+
+    assert run().returncode == 0
+    over = run("--budget", "100", "--output", str(tmp_path / "analysis.json"))
+    assert over.returncode == 1
+    assert "OVER" in over.stdout
+    assert len(json.loads((tmp_path / "analysis.json").read_text())["prompts"]) == 4
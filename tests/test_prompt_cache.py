@@ -0,0 +1,102 @@
+"""
+Tests for prompt caching with a static system block
+"""
+
+import asyncio
+import json
+import logging
+
+from lib.backends import BotoBackend, SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.routing import MIN_CACHE_TOKENS
+
+
+def test_cached_requests_split_instructions_from_items(run_generator, capturing_backend, monkeypatch):
+    config.prompt_caching = True
+    # The food instructions are below Nova's real minimum
+    monkeypatch.setitem(MIN_CACHE_TOKENS, config.model_id, 100)
+    generator, backend, results = run_generator(capturing_backend)
+
+    assert results["errors"] == [] and results["tier3_count"] == 24
+    tier1, *items = backend.requests
+    assert "system" not in tier1
+    systems = {json.dumps(request["system"]) for request in items}
+    # One shared instruction block for Tier 2 and one for Tier 3
+    assert len(systems) == 2
+    for request in items:
+        text, cache_point = request["system"]
+        assert cache_point == {"cachePoint": {"type": "default"}}
+        assert "<tier1_name>" in text["text"] and "{" + "tier1_name}" not in text["text"]
+        user_text = request["messages"][0]["content"][0]["text"]
+        assert user_text.startswith("Use these values") and len(user_text) < 200
+
+    with open(generator.run_report_file, encoding='utf-8') as f:
+        report = json.load(f)
+    assert report["prompt_caching"] is True and report["prompt_cached_tiers"] == ["tier2", "tier3"]
+    cache = report["stages"]["tier3"]["prompt_cache"]
+    assert cache["cache_write_input_tokens"] > 0
+    assert cache["cache_read_input_tokens"] == 5 * cache["cache_write_input_tokens"]
+    assert 0 < report["prompt_cache"]["cached_input_share"] < 1
+
+
+def test_instructions_below_cache_minimum_are_sent_uncached(run_generator, capturing_backend, caplog):
+    config.prompt_caching = True
+    with caplog.at_level(logging.WARNING, logger="lib.generator"):
+        generator, backend, _ = run_generator(capturing_backend)
+
+    assert all("system" not in request for request in backend.requests)
+    assert "tier3 instructions are ~" in caplog.text and "cache minimum of amazon.nova-micro-v1:0" in caplog.text
+    with open(generator.run_report_file, encoding='utf-8') as f:
+        report = json.load(f)
+    assert report["prompt_cached_tiers"] == [] and report["prompt_cache"]["cached_input_share"] == 0
+
+
+def test_synthetic_backend_caches_only_above_minimum():
+    body = {
+        "messages": [{"role": "user", "content": [{"text": "<tier1_name>: Baking"}]}],
+        "system": [{"text": "x" * 3000}, {"cachePoint": {"type": "default"}}],
+    }
+    short = SyntheticBackend()
+    usages = [asyncio.run(short.invoke("amazon.nova-micro-v1:0", body))["usage"] for _ in range(2)]
+    assert all("cacheWriteInputTokens" not in usage and "cacheReadInputTokens" not in usage for usage in usages)
+    assert usages[0]["inputTokens"] > 750
+
+    long = SyntheticBackend(min_cache_tokens=500)
+    first, second = (asyncio.run(long.invoke("amazon.nova-micro-v1:0", body))["usage"] for _ in range(2))
+    assert first["cacheWriteInputTokens"] == second["cacheReadInputTokens"] > 750
+
+
+def test_uncached_requests_are_unchanged(run_generator, capturing_backend):
+    generator, backend, _ = run_generator(capturing_backend)
+
+    assert all("system" not in request for request in backend.requests)
+    assert backend.requests[-1]["messages"][0]["content"][0]["text"] == generator.prompts.build_tier3_prompt(
+        "Synthetic Category 1", "Synthetic Practice 3-2", "youtube"
+    )
+    with open(generator.run_report_file, encoding='utf-8') as f:
+        assert json.load(f)["prompt_cache"]["cached_input_share"] == 0
+
+
+def test_converse_api_receives_system_blocks():
+    backend = BotoBackend(api="converse")
+    calls = []
+
+    class FakeClient:
+        def converse(self, **kwargs):
+            calls.append(kwargs)
+            return {
+                "ResponseMetadata": {"HTTPStatusCode": 200},
+                "output": {"message": {"role": "assistant", "content": [{"text": '{"tier2_items": []}'}]}},
+                "usage": {"inputTokens": 12, "outputTokens": 5, "cacheReadInputTokens": 900},
+            }
+
+    backend.client = FakeClient()
+    client = BedrockClient(backend=backend)
+    response = asyncio.run(client.invoke_model("model", "<tier1_name>: Baking", system="Instructions"))
+
+    assert calls[0]["modelId"] == "model"
+    assert calls[0]["system"][1] == {"cachePoint": {"type": "default"}}
+    assert "ResponseMetadata" not in response["raw_response"]
+    record = response["call_record"]
+    assert (record.input_tokens, record.cache_read_input_tokens) == (12, 900)
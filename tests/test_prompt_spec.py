@@ -0,0 +1,88 @@
+"""
+Tests for declarative prompt specs and the compiled renderer
+"""
+
+import pytest
+
+from lib.prompt_spec import PromptSpec, PromptSpecError
+from lib.registry import prompt_registry
+from prompts.base import BASE_SPEC, bullets, json_items, safety_guidelines
+
+SPEC = BASE_SPEC.extend(
+    category="test",
+    tier1='List up to {max_tier1} topics as {{"tier1_categories": [...]}}',
+    tier2='Items for "{tier1_name}"',
+    tier3={"youtube": 'YouTube seeds for "{tier2_name}" in {tier1_name}', "instagram": 'Instagram "{tier2_name}" {tier1_name}'},
+    values={"max_tier1": 20},
+)
+
+
+def test_render_split_and_platform_fallback():
+    prompts = SPEC.compile()
+
+    assert prompts.build_tier1_prompt() == 'List up to 20 topics as {"tier1_categories": [...]}'
+    assert prompts.build_tier2_prompt("Baking {x}") == 'Items for "Baking {x}"'
+    assert prompts.build_tier3_prompt("Baking", "Bread", "Instagram") == 'Instagram "Bread" Baking'
+    assert prompts.build_tier3_prompt("Baking", "Bread", "tiktok") == 'YouTube seeds for "Bread" in Baking'
+
+    template = prompts.template("tier3", "youtube")
+    assert template.static_prefix == 'YouTube seeds for "'
+    assert template.split(tier1_name="Baking", tier2_name="Bread") == ('YouTube seeds for "', 'Bread" in Baking')
+
+
+def test_extend_merges_platforms_and_values():
+    spec = SPEC.extend(tier3={"instagram": 'IG {tier1_name} {tier2_name}'}, values={"max_tier1": 5})
+
+    assert set(spec.tier3) == {"youtube", "instagram"}
+    assert spec.compile().build_tier1_prompt().startswith("List up to 5 topics")
+    assert SPEC.values["max_tier1"] == 20
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"tier2": 'Items for "{tier1}"'}, "unknown placeholder {tier1}"),
+    ({"tier2": "Items for the category"}, "missing placeholders ['tier1_name']"),
+    ({"tier1": '{\n  "tier1_categories": []\n}'}, "unescaped brace"),
+    ({"tier2": "Items for {tier1_name!r}"}, "not supported"),
+    ({"tier3": {"youtube": "Seeds for {tier2_name}"}}, "tier3.youtube: missing placeholders ['tier1_name']"),
+])
+def test_malformed_templates_fail_at_compile_time(overrides, message):
+    with pytest.raises(PromptSpecError, match=message.replace("[", r"\[").replace("{", r"\{").replace("]", r"\]")):
+        SPEC.extend(**overrides).compile()
+
+
+def test_base_templates_render_category_values():
+    values = {
+        "domain": "Gardening", "tier1_scope": "gardening", "tier1_count": "8-12", "tier1_areas": "gardening",
+        "tier1_audience": "home gardeners", "tier1_requirements": bullets("Keep names short"),
+        "tier1_examples": json_items("Houseplants", "Lawn Care"),
+    }
+    # Only Tier 1 uses the shared template here
+    spec = BASE_SPEC.extend(tier2=SPEC.tier2, tier3=SPEC.tier3, values=values)
+    tier1 = spec.compile().build_tier1_prompt()
+
+    assert "- Each category should have a clear, descriptive name\n- Keep names short\n\nReturn ONLY" in tier1
+    assert '"tier1_categories": [\n    "Houseplants",\n    "Lawn Care"\n  ]' in tier1
+    assert tier1.endswith("Generate exactly 8-12 categories. Return ONLY the JSON, no additional text.")
+
+    guarded = spec.extend(values={**values, "tier1_guidelines": safety_guidelines("NO brand names")})
+    assert "- Keep names short\n\nSAFETY GUIDELINES:\n- NO brand names\n\nReturn ONLY" in guarded.compile().build_tier1_prompt()
+
+    # A category that leaves out a value the shared templates use fails when it compiles
+    with pytest.raises(PromptSpecError, match=r"tier1: unknown placeholder \{domain\}"):
+        BASE_SPEC.extend(category="gardening").compile()
+
+
+def test_default_platform_needs_a_template():
+    with pytest.raises(PromptSpecError, match="default platform"):
+        PromptSpec(category="test", tier1="a", tier2="{tier1_name}", tier3={"instagram": "{tier1_name}{tier2_name}"}).compile()
+
+
+def test_every_category_compiles_and_renders_behind_its_static_prefix():
+    for category in prompt_registry.get_available_categories():
+        prompts = prompt_registry.get_prompts(category)
+        for platform in ("youtube", "instagram"):
+            template = prompts.PROMPTS.template("tier3", platform)
+            rendered = prompts.build_tier3_prompt("Tier One", "Tier Two", platform)
+            assert rendered.startswith(template.static_prefix)
+            assert "Tier Two" in rendered and "{" + "tier" not in rendered
+        assert "{{" not in prompts.build_tier1_prompt()
@@ -0,0 +1,184 @@
+"""
+Tests for the retry budget and circuit breaker
+"""
+
+import asyncio
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lib.backends import BedrockBackend, SyntheticBackend
+from lib.bedrock_client import BedrockClient, BedrockError, CircuitOpenError
+from lib.metrics import metrics
+from lib.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, RetryBudget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FailingBackend(BedrockBackend):
+    """Fails every call with a server error (or with error, if set) until healed"""
+
+    def __init__(self):
+        self.inner = SyntheticBackend()
+        self.calls = 0
+        self.healthy = False
+        self.error = None
+
+    async def invoke(self, model_id, request_body):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        if not self.healthy:
+            raise ClientError({"Error": {"Code": "ServiceUnavailableException", "Message": "down"}}, "InvokeModel")
+        return await self.inner.invoke(model_id, request_body)
+
+
+def _invoke(client, max_retries=1):
+    return asyncio.run(client.invoke_model("amazon.nova-micro-v1:0", "prompt", max_retries=max_retries,
+                                           tags={"stage": "tier3"}))
+
+
+def test_retry_budget_scales_with_successes_in_window():
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.5, min_retries=2, window_s=10, clock=clock)
+
+    assert budget.try_retry() and budget.try_retry()
+    assert not budget.try_retry()
+    budget.record_success()
+    budget.record_success()
+    assert budget.try_retry() and not budget.try_retry("json")
+    assert budget.rejected == 2
+
+    clock.now = 11
+    assert budget.try_retry()
+
+
+def test_breaker_opens_on_failure_rate_and_probes_after_cooldown():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=0.5, window=10, min_calls=4, cooldown_s=30, clock=clock)
+    breaker.record_success(breaker.allow())
+    breaker.record_failure(breaker.allow())
+    breaker.record_success(breaker.allow())
+    assert breaker.state == CLOSED
+    breaker.record_failure(breaker.allow())
+    assert breaker.state == OPEN and breaker.allow() is None
+    assert metrics.get("seedgen_circuit_state") == 2
+
+    clock.now = 30
+    assert breaker.state == HALF_OPEN
+    probe = breaker.allow()
+    assert probe.probe and breaker.allow() is None  # One probe at a time
+    breaker.record_failure(probe)
+    assert breaker.state == OPEN and breaker.times_opened == 2
+
+    clock.now = 60
+    probe = breaker.allow()
+    breaker.record_success(probe)
+    assert breaker.state == CLOSED and breaker.allow() is not None
+    assert metrics.get("seedgen_circuit_state") == 0
+
+
+def test_only_the_probe_permit_frees_the_probe_slot():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window=2, min_calls=2, cooldown_s=30, clock=clock)
+    early = breaker.allow()
+    breaker.record_failure(breaker.allow())
+    breaker.record_failure(breaker.allow())
+
+    clock.now = 30
+    probe = breaker.allow()
+    # A call started before the breaker opened ends without an outcome, or with one
+    breaker.release(early)
+    breaker.record_success(early)
+    assert breaker.state == HALF_OPEN and breaker.allow() is None
+
+    breaker.release(probe)
+    assert breaker.allow().probe
+
+
+def test_probe_ending_in_an_unexpected_error_frees_the_probe_slot():
+    backend = FailingBackend()
+    breaker = CircuitBreaker(min_calls=3, window=3, cooldown_s=0.05, max_pause_s=1)
+    client = BedrockClient(backend=backend, circuit_breaker=breaker)
+    for _ in range(3):
+        with pytest.raises(BedrockError):
+            _invoke(client)
+
+    backend.error = RuntimeError("no recorded response")
+    with pytest.raises(RuntimeError):
+        _invoke(client)
+
+    # The next call is let through as a new probe rather than waiting out max_pause_s
+    backend.error = None
+    backend.healthy = True
+    assert _invoke(client)["content"]
+    assert breaker.state == CLOSED and breaker.fast_failures == 0
+
+
+def test_request_errors_do_not_count_against_the_breaker():
+    backend = FailingBackend()
+    breaker = CircuitBreaker(min_calls=3, window=3, cooldown_s=0.05, max_pause_s=1)
+    client = BedrockClient(backend=backend, circuit_breaker=breaker)
+    backend.error = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "The provided model identifier is invalid."},
+         "ResponseMetadata": {"HTTPStatusCode": 400}},
+        "InvokeModel"
+    )
+    for _ in range(3):
+        with pytest.raises(BedrockError):
+            _invoke(client)
+    assert breaker.state == CLOSED
+
+    backend.error = None
+    for _ in range(3):
+        with pytest.raises(BedrockError):
+            _invoke(client)
+    assert breaker.state == OPEN
+
+    # A probe rejected as a bad request neither reopens nor closes the breaker
+    backend.error = ClientError({"Error": {"Code": "ValidationException", "Message": "bad"}}, "InvokeModel")
+    with pytest.raises(BedrockError):
+        _invoke(client)
+    assert breaker.state == HALF_OPEN and breaker.times_opened == 1
+
+    backend.error = None
+    backend.healthy = True
+    assert _invoke(client)["content"]
+    assert breaker.state == CLOSED and breaker.fast_failures == 0
+
+
+def test_open_breaker_fails_fast_without_calling_the_service():
+    backend = FailingBackend()
+    breaker = CircuitBreaker(min_calls=3, window=3, cooldown_s=0.05, max_pause_s=0)
+    client = BedrockClient(backend=backend, circuit_breaker=breaker)
+    for _ in range(3):
+        with pytest.raises(BedrockError):
+            _invoke(client)
+
+    with pytest.raises(CircuitOpenError):
+        _invoke(client)
+    assert backend.calls == 3 and breaker.fast_failures == 1
+
+    # Once the cooldown has passed, a waiting call goes through as the probe and closes the breaker
+    breaker.max_pause_s = 1
+    backend.healthy = True
+    assert _invoke(client)["content"]
+    assert breaker.state == CLOSED
+
+
+def test_exhausted_retry_budget_stops_api_retries():
+    backend = FailingBackend()
+    client = BedrockClient(backend=backend, retry_budget=RetryBudget(ratio=0, min_retries=0))
+    before = metrics.get("seedgen_retries_rejected_total", kind="api")
+
+    with pytest.raises(BedrockError, match="retry budget is exhausted"):
+        _invoke(client, max_retries=3)
+
+    assert backend.calls == 1
+    assert metrics.get("seedgen_retries_rejected_total", kind="api") == before + 1
@@ -0,0 +1,103 @@
+"""
+Tests for per-tier model routing
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from lib.backends import BotoBackend, SyntheticBackend
+from lib.config import config
+from lib.planner import plan_run
+from lib.routing import MODEL_PRICING, RoutingError, load_routes, resolve_route, resolve_routes
+
+TIER1_MODEL = "amazon.nova-pro-v1:0"
+CLAUDE_MODEL = "anthropic.claude-3-5-haiku-20241022-v1:0"
+
+
+def test_category_routes_override_tier_routes_override_globals(isolated_config):
+    config.tier_routes = {"tier3": {"model_id": "amazon.nova-lite-v1:0", "max_tokens": 1024}}
+    config.category_routes = {"food": {"tier3": {"max_tokens": 512}}}
+
+    assert resolve_route(config, "tier1").model_id == config.model_id
+    assert resolve_route(config, "tier3").max_tokens == 1024
+    food = resolve_routes(config, "food")["tier3"]
+    assert (food.model_id, food.max_tokens, food.temperature) == ("amazon.nova-lite-v1:0", 512, config.temperature)
+    assert resolve_route(config, "tier3", "books").max_tokens == 1024
+
+
+def test_malformed_routes_are_rejected(tmp_path):
+    routes_file = tmp_path / "routes.json"
+    routes_file.write_text(json.dumps({"tiers": {"tier4": {"model_id": "x"}}}))
+    with pytest.raises(RoutingError, match="unknown tier 'tier4'"):
+        load_routes(routes_file)
+
+    routes_file.write_text(json.dumps({"categories": {"food": {"tier2": {"top_k": 5}}}}))
+    with pytest.raises(RoutingError, match="category 'food'.*top_k"):
+        load_routes(routes_file)
+
+    routes_file.write_text(json.dumps({"tiers": {"tier1": {"model_id": TIER1_MODEL}}}))
+    assert load_routes(routes_file) == ({"tier1": {"model_id": TIER1_MODEL}}, {})
+
+
+def test_tier_route_applies_only_to_its_tier(run_generator, capturing_backend):
+    config.tier_routes = {"tier1": {"model_id": TIER1_MODEL}, "tier3": {"max_tokens": 512}}
+    generator, backend, results = run_generator(capturing_backend)
+
+    assert results["errors"] == [] and results["tier3_count"] == 24
+    tier1_model, *item_models = backend.model_ids
+    assert tier1_model == TIER1_MODEL
+    assert set(item_models) == {config.model_id}
+    # 2 Tier 2 calls, then 6 Tier 3 calls
+    assert [body["inferenceConfig"]["maxTokens"] for body in backend.requests[1:]] == [config.max_tokens] * 2 + [512] * 6
+
+    with open(generator.run_report_file, encoding='utf-8') as f:
+        report = json.load(f)
+    tier1 = report["routes"][f"tier1:{TIER1_MODEL}"]
+    assert tier1["attempts"] == 1
+    pricing = MODEL_PRICING[TIER1_MODEL]
+    expected = tier1["input_tokens"] / 1000 * pricing.input_per_1k + tier1["output_tokens"] / 1000 * pricing.output_per_1k
+    assert tier1["estimated_cost_usd"] == pytest.approx(expected, abs=1e-6)
+    assert sum(route["cost_share"] for route in report["routes"].values()) == pytest.approx(1, abs=1e-3)
+    assert report["tier_routes"]["tier3"]["max_tokens"] == 512
+
+
+def test_tier3_route_change_regenerates_only_tier3(run_generator):
+    run_generator()
+    config.tier_routes = {"tier3": {"model_id": "amazon.nova-lite-v1:0"}}
+
+    plan = plan_run("food", "youtube")
+    assert (plan.stages["tier3"].stale, plan.stages["tier2"].calls) == (6, 0)
+    assert plan.stages["tier3"].model_id == "amazon.nova-lite-v1:0"
+
+    _, backend, results = run_generator()
+
+    assert backend.calls == 6
+    assert results["invalidated"] == {"tier1": 0, "tier2": 0, "tier3": 6}
+
+
+def test_non_nova_routes_use_the_converse_api(run_generator):
+    config.tier_routes = {"tier1": {"model_id": CLAUDE_MODEL}}
+    synthetic = SyntheticBackend(tier1_items=1, tier2_items=1, tier3_items=4)
+    calls = []
+
+    class FakeClient:
+        def _respond(self, api, model_id, request_body):
+            calls.append((api, model_id))
+            return asyncio.run(synthetic.invoke(model_id, request_body))
+
+        def converse(self, modelId, **request_body):
+            return {"ResponseMetadata": {"HTTPStatusCode": 200}, **self._respond("converse", modelId, request_body)}
+
+        def invoke_model(self, modelId, body):
+            response = json.dumps(self._respond("invoke", modelId, json.loads(body))).encode()
+            return {"body": io.BytesIO(response)}
+
+    backend = BotoBackend(api="invoke")
+    backend.client = FakeClient()
+    _, _, results = run_generator(backend)
+
+    assert results["errors"] == []
+    assert calls == [("converse", CLAUDE_MODEL), ("invoke", config.model_id), ("invoke", config.model_id)]
@@ -0,0 +1,62 @@
+"""
+Tests for deadline-aware scheduling
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+from lib.scheduler import breadth_first, parse_deadline, parse_duration
+
+
+def test_breadth_first_round_robins_and_favours_least_covered():
+    items = ["a1", "a2", "a3", "b1", "b2", "c1"]
+
+    assert breadth_first(items, branch=lambda item: item[0]) == ["a1", "b1", "c1", "a2", "b2", "a3"]
+    assert breadth_first(items, branch=lambda item: item[0], covered={"a": 1, "b": 1}) == \
+        ["c1", "a1", "b1", "a2", "b2", "a3"]
+
+
+def test_parse_time_budget_and_deadline():
+    assert parse_duration("1h30m") == 5400
+    assert parse_duration("90m") == 5400
+    assert parse_duration("45") == 45
+    with pytest.raises(ValueError):
+        parse_duration("soon")
+
+    now = datetime(2025, 6, 1, 22, 0)
+    assert parse_deadline("06:00", now) == datetime(2025, 6, 2, 6, 0).timestamp()
+    assert parse_deadline("2025-06-01T23:30", now) == datetime(2025, 6, 1, 23, 30).timestamp()
+
+
+def test_deadline_run_covers_every_branch_before_deepening(isolated_config):
+    config.deadline = 5.0
+
+    # Every model call advances a fake clock by one second
+    now = [0.0]
+    backend = SyntheticBackend(tier1_items=2, tier2_items=3, tier3_items=3)
+    original_invoke = backend.invoke
+
+    async def timed_invoke(model_id, request_body):
+        now[0] += 1
+        return await original_invoke(model_id, request_body)
+
+    backend.invoke = timed_invoke
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+    generator.scheduler.clock = lambda: now[0]
+
+    asyncio.run(generator.generate_all_data())
+
+    # Tier 1 and both Tier 2 calls take 3s, leaving time for two of the six Tier 3 items:
+    # the first practice of each Tier 1 category rather than two from the first one
+    checkpoints = sorted(path.name for path in generator.output_dir.glob("tier3_*.csv"))
+    assert checkpoints == [
+        "tier3_food_youtube_synthetic_practice_2_0.csv",
+        "tier3_food_youtube_synthetic_practice_3_0.csv",
+    ]
+    assert generator.deadline_skipped == 4
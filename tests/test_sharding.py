@@ -0,0 +1,115 @@
+"""
+Tests for --shard i/N partitioning and shard merging
+"""
+
+import asyncio
+import csv
+
+import pytest
+
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+from lib.sharding import ShardingError, parse_shard, shard_of
+from scripts.upsert_to_pg import discover_tier3_artifacts
+
+
+@pytest.fixture
+def isolated_config(isolated_config):
+    isolated_config.max_concurrency = 2
+    return isolated_config
+
+
+def _backend():
+    return SyntheticBackend(tier1_items=2, tier2_items=5, tier3_items=3)
+
+
+def test_shard_of_is_stable_and_in_range():
+    assert shard_of("food", "youtube", "A", "B", 4) == shard_of("food", "youtube", "A", "B", 4)
+    assert all(0 <= shard_of("food", "youtube", "A", str(i), 3) < 3 for i in range(50))
+    assert len({shard_of("food", "youtube", "A", str(i), 3) for i in range(50)}) == 3
+
+
+def test_parse_shard():
+    assert parse_shard("1/4") == (1, 4)
+    for text in ("4/4", "-1/2", "1", "a/b", "0/0"):
+        with pytest.raises(ValueError):
+            parse_shard(text)
+
+
+def _run_shards(backend_factory, count):
+    preparer = DataGenerator(BedrockClient(backend=_backend()), "food", "youtube")
+    asyncio.run(preparer.prepare_shards())
+    assert not list(preparer.output_dir.glob("tier3_*.csv"))
+
+    shard_items = []
+    for index in range(count):
+        backend = backend_factory()
+        calls_before = backend.calls
+        generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube", shard=(index, count))
+        results = asyncio.run(generator.generate_all_data())
+        assert not results["errors"]
+        # Tier 1 and Tier 2 come from the prepared checkpoints
+        shard_items.append({path.name for path in generator.tier3_dir.glob("tier3_*.csv")})
+        assert backend.calls - calls_before == len(shard_items[-1])
+    return preparer, shard_items
+
+
+def test_shards_partition_tier3_and_merge_matches_unsharded_run(isolated_config, tmp_path):
+    shared = _backend()
+    preparer, shard_items = _run_shards(lambda: shared, 3)
+
+    assert sum(len(items) for items in shard_items) == 10
+    assert len(set().union(*shard_items)) == 10
+
+    summary = preparer.merge_shards(3)
+    assert summary["merged_items"] == 10
+    assert summary["missing_items"] == []
+    assert summary["duplicates_dropped"] == 0
+    assert preparer.manifest_file.exists()
+
+    # Only the merged aggregate is picked up for upserting
+    artifacts = discover_tier3_artifacts(tmp_path)
+    assert [artifact.file_path for artifact in artifacts] == [preparer.tier3_aggregated_file]
+
+    config.base_output_dir = str(tmp_path / "unsharded")
+    unsharded = asyncio.run(DataGenerator(BedrockClient(backend=_backend()), "food", "youtube").generate_all_data())
+    assert unsharded["tier3_count"] == summary["seeds"]
+
+
+def test_merge_drops_cross_shard_duplicates(isolated_config):
+    # Fresh synthetic backends repeat the same seeds on every shard
+    preparer, _ = _run_shards(_backend, 2)
+
+    summary = preparer.merge_shards(2)
+
+    assert summary["duplicates_dropped"] > 0
+    with open(preparer.seed_index_file, encoding='utf-8') as f:
+        index_rows = list(csv.DictReader(f))
+    assert len(index_rows) == summary["seeds"]
+    assert len({row["seed_hash"] for row in index_rows}) == summary["seeds"]
+    with open(preparer.tier3_aggregated_file, encoding='utf-8') as f:
+        assert len(list(csv.DictReader(f))) == summary["seeds"]
+
+
+def test_merge_with_wrong_shard_count_keeps_outputs(isolated_config):
+    preparer, _ = _run_shards(_backend, 1)
+    merged = preparer.merge_shards(1)
+    aggregate = preparer.tier3_aggregated_file.read_text()
+
+    with pytest.raises(ShardingError):
+        preparer.merge_shards(2)
+
+    assert merged["seeds"] == 30
+    assert preparer.tier3_aggregated_file.read_text() == aggregate
+
+
+def test_shard_requires_prepared_tiers(isolated_config):
+    backend = _backend()
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube", shard=(0, 2))
+
+    results = asyncio.run(generator.generate_all_data())
+
+    assert backend.calls == 0
+    assert "--prepare-shards" in results["errors"][0]
@@ -0,0 +1,41 @@
+"""
+Tests for lazy category discovery and CLI startup imports
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.bench_startup import parse_importtime
+from lib.registry import PromptRegistry
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def test_categories_are_discovered_on_first_use(tmp_path):
+    registry = PromptRegistry(prompts_dir=tmp_path)
+    (tmp_path / "food_prompts.py").write_text("")
+    (tmp_path / "travel_prompts.py").write_text("")
+    (tmp_path / "__init__.py").write_text("")
+
+    assert registry._categories is None
+    assert registry.get_available_categories() == ["food", "travel"]
+
+    # The listing is cached for the process
+    (tmp_path / "music_prompts.py").write_text("")
+    assert not registry.is_category_available("music")
+
+
+def test_list_categories_imports_no_aws_or_database_client():
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "scripts/generate_seeds.py", "--list-categories"],
+        cwd=PROJECT_ROOT, env=dict(os.environ), capture_output=True, text=True
+    )
+
+    assert completed.returncode == 0
+    assert "food" in completed.stdout
+    imported = {module for module, _, _ in parse_importtime(completed.stderr)}
+    assert not {module.split(".")[0] for module in imported} & {"boto3", "psycopg", "psycopg_pool"}
+    assert "prompts.food_prompts" not in imported
+    assert not imported & {"asyncio", "lib.generator", "lib.bedrock_client"}
@@ -0,0 +1,79 @@
+"""
+Tests for --target-seeds target-yield mode
+"""
+
+import asyncio
+import json
+
+from lib.backends import BedrockBackend, SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.generator import DataGenerator
+
+
+def test_stops_calling_once_target_is_met(isolated_config):
+    isolated_config.target_seeds = 5
+    backend = SyntheticBackend(tier1_items=1, tier2_items=4, tier3_items=3)
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+
+    results = asyncio.run(generator.generate_all_data())
+
+    # Tier 1 + Tier 2 + two Tier 3 calls reach 6 seeds; the last two items are never requested
+    assert backend.calls == 4
+    assert results["tier3_count"] == 6
+    assert generator.top_up_calls == 0
+
+
+def test_tops_up_deficient_items_with_exclusions(isolated_config):
+    isolated_config.target_seeds = 8
+    backend = SyntheticBackend(tier1_items=1, tier2_items=2, tier3_items=2)
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+    prompts = []
+    original_invoke = backend.invoke
+
+    async def capturing_invoke(model_id, request_body):
+        prompts.append(request_body["messages"][0]["content"][0]["text"])
+        return await original_invoke(model_id, request_body)
+
+    backend.invoke = capturing_invoke
+    results = asyncio.run(generator.generate_all_data())
+
+    assert results["tier3_count"] == 8
+    assert generator.top_up_calls == 2
+    assert "ALREADY COLLECTED" in prompts[-1]
+    # Top-ups are appended to the item checkpoints
+    checkpoints = sorted(generator.output_dir.glob("tier3_*.csv"))
+    assert [len(path.read_text().splitlines()) - 1 for path in checkpoints] == [4, 4]
+
+
+class FailFirstTier3Backend(BedrockBackend):
+    """Raises on the first `failures` Tier 3 calls, then answers like a SyntheticBackend"""
+
+    def __init__(self, failures, **sizes):
+        self.inner = SyntheticBackend(**sizes)
+        self.failures = failures
+        self.calls = 0
+
+    async def invoke(self, model_id, request_body):
+        self.calls += 1
+        if self.failures and "search_seeds" in json.dumps(request_body):
+            self.failures -= 1
+            raise RuntimeError("connection dropped")
+        return await self.inner.invoke(model_id, request_body)
+
+
+def test_top_up_over_stale_checkpoint_records_fingerprint(isolated_config):
+    isolated_config.target_seeds = 4
+    sizes = {"tier1_items": 1, "tier2_items": 2, "tier3_items": 2}
+    asyncio.run(DataGenerator(BedrockClient(backend=SyntheticBackend(**sizes)), "food", "youtube").generate_all_data())
+
+    # The route change makes both Tier 3 checkpoints stale; regenerating them fails and the top-up replaces them
+    isolated_config.tier_routes = {"tier3": {"model_id": "amazon.nova-lite-v1:0"}}
+    backend = FailFirstTier3Backend(2, **sizes)
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+    results = asyncio.run(generator.generate_all_data())
+    assert (results["tier3_count"], generator.top_up_calls) == (4, 2)
+
+    backend = SyntheticBackend(**sizes)
+    results = asyncio.run(DataGenerator(BedrockClient(backend=backend), "food", "youtube").generate_all_data())
+    assert backend.calls == 0
+    assert results["invalidated"]["tier3"] == 0
@@ -0,0 +1,47 @@
+"""
+Tests for per-call telemetry and the run report
+"""
+
+import asyncio
+import json
+
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.generator import DataGenerator
+from lib.telemetry import CallRecord, build_run_report, percentile
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) is None
+
+
+def test_run_report_counts_failed_parses_in_cost():
+    records = [
+        CallRecord("m", "tier3", "food", 1, 0.2, "ok", input_tokens=1000, output_tokens=500),
+        CallRecord("m", "tier3", "food", 1, 0.4, "parse_failure", input_tokens=1000, output_tokens=500),
+        CallRecord("m", "tier3", "food", 2, 0.1, "throttled"),
+    ]
+
+    report = build_run_report(records, surviving_seeds=10, input_cost_per_1k=1.0, output_cost_per_1k=2.0)
+
+    stage = report["stages"]["tier3"]
+    assert stage["outcomes"] == {"ok": 1, "parse_failure": 1, "throttled": 1}
+    assert stage["latency_ms"]["p50"] == 200.0
+    assert report["estimated_cost_usd"] == 4.0
+    assert report["tokens_per_surviving_seed"] == 300.0
+
+
+def test_generator_writes_run_report(isolated_config):
+    backend = SyntheticBackend(tier1_items=2, tier2_items=2, tier3_items=3)
+    generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+
+    asyncio.run(generator.generate_all_data())
+
+    report = json.loads(generator.run_report_file.read_text())
+    assert set(report["stages"]) == {"tier1", "tier2", "tier3"}
+    assert report["stages"]["tier3"]["attempts"] == 4
+    assert report["surviving_seeds"] == 12
+    assert report["input_tokens"] > 0
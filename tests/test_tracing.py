@@ -0,0 +1,41 @@
+"""
+Tests for opt-in OpenTelemetry tracing
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.generator import DataGenerator
+from lib.tracing import configure_tracing, shutdown_tracing, span
+
+
+def test_span_is_noop_when_disabled():
+    with span("anything", category="food") as current:
+        assert current is None
+
+
+def test_file_exporter_records_nested_spans(isolated_config, tmp_path):
+    pytest.importorskip("opentelemetry.sdk")
+    trace_file = tmp_path / "traces.jsonl"
+
+    configure_tracing("file", file_path=trace_file)
+    try:
+        backend = SyntheticBackend(tier1_items=1, tier2_items=2, tier3_items=3)
+        generator = DataGenerator(BedrockClient(backend=backend), "food", "youtube")
+        asyncio.run(generator.generate_all_data())
+    finally:
+        shutdown_tracing()
+
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    by_id = {s["context"]["span_id"]: s for s in spans}
+    calls = [s for s in spans if s["name"] == "bedrock.invoke_model"]
+    assert len(calls) == 4
+    assert all(s["attributes"]["outcome"] == "ok" for s in calls)
+
+    tier3_call = next(s for s in calls if s["attributes"]["stage"] == "tier3")
+    assert by_id[tier3_call["parent_id"]]["name"] == "tier3.item"
+    assert any(s["name"] == "checkpoint.write" for s in spans)
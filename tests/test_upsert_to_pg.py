@@ -0,0 +1,211 @@
+"""
+Tests for the PostgreSQL upsert script
+"""
+
+import json
+
+import pytest
+
+from lib.seeds_db import (
+    NORMALIZED_UPSERT_SQL,
+    UPSERT_SQL,
+    attach_hierarchy_ids,
+    build_seed_rows,
+    conflict_key,
+    dedupe_rows,
+)
+from lib.tracing import configure_tracing, shutdown_tracing
+from scripts.upsert_to_pg import _write_rows, discover_tier3_artifacts, resolve_artifact
+
+
+def test_conflict_key_matches_lower_btrim():
+    """Only spaces are trimmed and the comparison is case-insensitive"""
+    assert conflict_key("youtube", "  Yoga For Beginners ") == ("youtube", "yoga for beginners")
+    assert conflict_key("youtube", "\tyoga") == ("youtube", "\tyoga")
+
+
+def test_dedupe_rows_merges_like_on_conflict():
+    """Duplicates keep the first raw_input, the max priority and the last non-null json"""
+    seeds = [
+        {"category": "food", "tier1_name": "Baking", "seed_text": "Easy Bread Recipe", "priority": 1},
+        {"seed_text": "easy bread recipe", "priority": 5},
+        {"category": "food", "tier1_name": "Cooking", "seed_text": "EASY BREAD RECIPE", "priority": 2},
+        {"category": "food", "seed_text": "sourdough starter guide"},
+    ]
+    rows = build_seed_rows(seeds, "youtube")
+
+    deduped, collapsed = dedupe_rows(rows)
+
+    assert collapsed == 2
+    assert [row["raw_input"] for row in deduped] == ["Easy Bread Recipe", "sourdough starter guide"]
+    assert deduped[0]["priority"] == 5
+    assert deduped[0]["parsed_json"].obj == {"category": "food", "tier1_name": "Cooking"}
+    # Input rows are left untouched
+    assert rows[0]["priority"] == 1
+
+
+def test_dedupe_rows_is_per_platform():
+    """The same text on different platforms is not a conflict"""
+    rows = build_seed_rows([{"seed_text": "street food tour"}], "youtube")
+    rows += build_seed_rows([{"seed_text": "street food tour"}], "instagram")
+
+    deduped, collapsed = dedupe_rows(rows)
+
+    assert collapsed == 0
+    assert len(deduped) == 2
+
+
+def test_discover_tier3_artifacts_prefers_manifest(tmp_path):
+    """Manifest metadata wins; legacy outputs fall back to the directory layout"""
+    food_dir = tmp_path / "instagram" / "food"
+    food_dir.mkdir(parents=True)
+    (food_dir / "all_tier3_food_instagram.csv").write_text("tier1_name,tier2_name,seed_text\n")
+    (food_dir / "manifest.json").write_text(json.dumps({
+        "category": "food",
+        "platform": "instagram",
+        "tier3_aggregated_file": "all_tier3_food_instagram.csv",
+    }))
+
+    legacy_dir = tmp_path / "youtube" / "health_wellbeing"
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "all_tier3_health_wellbeing_youtube.csv").write_text("tier1_name,tier2_name,seed_text\n")
+
+    (tmp_path / "all_tier3_stray.csv").write_text("tier1_name,tier2_name,seed_text\n")
+
+    artifacts = discover_tier3_artifacts(tmp_path)
+
+    assert [(a.platform, a.category) for a in artifacts] == [
+        ("instagram", "food"),
+        ("youtube", "health_wellbeing"),
+    ]
+
+
+def test_resolve_artifact_falls_back_to_filename(tmp_path):
+    """A file outside the base directory without a manifest is resolved from its name"""
+    base_dir = tmp_path / "data"
+    base_dir.mkdir()
+    exported = tmp_path / "exports" / "all_tier3_health_wellbeing_instagram.csv"
+    exported.parent.mkdir()
+    exported.write_text("tier1_name,tier2_name,seed_text\n")
+
+    artifact = resolve_artifact(exported, base_dir)
+
+    assert (artifact.category, artifact.platform) == ("health_wellbeing", "instagram")
+    assert resolve_artifact(tmp_path / "exports" / "all_tier3_food_tiktok.csv", base_dir) is None
+
+
+class FakeCursor:
+    """Emulates the seed_tier1/seed_tier2 unnest upserts (ids in insert order) and records executemany calls"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params):
+        self.conn.statements.append((query, params))
+        if "seed_tier1" in query.split("SELECT")[0]:
+            table, keys = self.conn.tier1, list(zip(params["categories"], params["names"]))
+        else:
+            table, keys = self.conn.tier2, list(zip(params["tier1_ids"], params["names"]))
+        self.result = [(table.setdefault(key, len(table) + 1), *key) for key in keys]
+
+    def fetchall(self):
+        return self.result
+
+    def executemany(self, query, rows):
+        self.conn.batches.append((query, list(rows)))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.tier1 = {("food", "Baking"): 7}
+        self.tier2 = {}
+        self.statements = []
+        self.batches = []
+        self.commits = 0
+
+    def cursor(self, row_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_attach_hierarchy_ids_upserts_each_pair_once():
+    """Distinct Tier 1/Tier 2 pairs are sent once; rows without a Tier 1 keep parsed_json"""
+    conn = FakeConnection()
+    rows = build_seed_rows([
+        {"category": "food", "tier1_name": "Baking", "tier2_name": "Bread", "seed_text": "easy bread"},
+        {"category": "food", "tier1_name": "Baking", "tier2_name": "Bread", "seed_text": "rye bread"},
+        {"category": "food", "tier1_name": "Grilling", "seed_text": "charcoal tips"},
+        {"category": "food", "seed_text": "pantry basics"},
+    ], "youtube")
+
+    normalized = attach_hierarchy_ids(conn, rows)
+
+    (tier1_sql, tier1_params), (tier2_sql, tier2_params) = conn.statements
+    assert "afleau.seed_tier1" in tier1_sql and "afleau.seed_tier2" in tier2_sql
+    assert tier1_params == {"categories": ["food", "food"], "names": ["Baking", "Grilling"]}
+    assert tier2_params == {"tier1_ids": [7], "names": ["Bread"]}
+    assert [(row["tier1_id"], row["tier2_id"]) for row in normalized] == [(7, 1), (7, 1), (2, None), (None, None)]
+    assert [row["parsed_json"] for row in normalized[:3]] == [None, None, None]
+    assert normalized[3]["parsed_json"].obj == {"category": "food"}
+    assert rows[0]["parsed_json"] is not None
+
+
+def test_attach_hierarchy_ids_targets_schema():
+    conn = FakeConnection()
+    rows = build_seed_rows([{"category": "food", "tier1_name": "Baking", "seed_text": "easy bread"}], "youtube")
+
+    attach_hierarchy_ids(conn, rows, schema="scratch")
+
+    [(tier1_sql, _)] = conn.statements
+    assert "scratch.seed_tier1" in tier1_sql and "afleau." not in tier1_sql
+
+
+def test_write_rows_sends_one_ordered_batch(tmp_path):
+    """Rows go out in conflict-key order in one transaction, inside an upsert.batch span"""
+    pytest.importorskip("opentelemetry.sdk")
+    trace_file = tmp_path / "traces.jsonl"
+    conn = FakeConnection()
+    rows = build_seed_rows(
+        [{"seed_text": text} for text in ("Zucchini bread", "banana bread", "Apple pie")], "youtube"
+    )
+
+    configure_tracing("file", file_path=trace_file)
+    try:
+        _write_rows(conn, rows)
+    finally:
+        shutdown_tracing()
+
+    [(query, sent)] = conn.batches
+    assert query == UPSERT_SQL
+    assert [row["raw_input"] for row in sent] == ["Apple pie", "banana bread", "Zucchini bread"]
+    assert conn.commits == 1 and conn.statements == []
+    [batch_span] = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert batch_span["name"] == "upsert.batch"
+    assert batch_span["attributes"] == {"rows": 3, "normalized": False}
+
+
+def test_write_rows_normalized_attaches_ids_first():
+    conn = FakeConnection()
+    rows = build_seed_rows([
+        {"category": "food", "tier1_name": "Baking", "tier2_name": "Bread", "seed_text": "rye bread"},
+        {"category": "food", "tier1_name": "Baking", "seed_text": "easy cake"},
+    ], "youtube")
+
+    _write_rows(conn, rows, normalized=True)
+
+    [(query, sent)] = conn.batches
+    assert query == NORMALIZED_UPSERT_SQL
+    assert [(row["raw_input"], row["tier1_id"], row["tier2_id"]) for row in sent] == [
+        ("easy cake", 7, None),
+        ("rye bread", 7, 1),
+    ]
+    assert len(conn.statements) == 2 and conn.commits == 1
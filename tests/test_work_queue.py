@@ -0,0 +1,132 @@
+"""
+Tests for the SQLite work queue and --worker mode
+"""
+
+import asyncio
+
+import pytest
+
+from lib.backends import SyntheticBackend
+from lib.bedrock_client import BedrockClient
+from lib.config import config
+from lib.generator import DataGenerator
+from lib.work_queue import FAILED, QUEUED, SqliteWorkQueue, WorkQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def isolated_config(isolated_config):
+    isolated_config.max_concurrency = 2
+    isolated_config.queue_poll_interval_s = 0.01
+    return isolated_config
+
+
+def test_lease_complete_and_follow_ups(tmp_path):
+    queue = SqliteWorkQueue(tmp_path / "queue.db", "food", "youtube")
+    assert queue.enqueue("tier2", [("Baking", ""), ("Grilling", "")]) == 2
+    assert queue.enqueue("tier2", [("Baking", "")]) == 0
+
+    job = queue.lease("w1", 60)
+    assert (job.kind, job.tier1_name, job.attempts) == ("tier2", "Baking", 1)
+    assert queue.heartbeat(job, 60)
+    assert queue.complete(job, ["Bread", "Cakes"], [("Baking", "Bread"), ("Baking", "Cakes")])
+
+    counts = queue.counts()
+    assert (counts["done"], counts["queued"]) == (1, 3)
+    assert queue.results("tier2") == [("Baking", "", ["Bread", "Cakes"])]
+    # Queue order: the remaining Tier 2 job before the new Tier 3 jobs
+    assert queue.lease("w1", 60).tier1_name == "Grilling"
+    assert queue.lease("w1", 60).kind == "tier3"
+
+
+def test_expired_lease_is_requeued_and_old_holder_cannot_complete(tmp_path):
+    clock = FakeClock()
+    queue = SqliteWorkQueue(tmp_path / "queue.db", "food", "youtube", clock=clock)
+    queue.enqueue("tier2", [("Baking", "")])
+
+    stale = queue.lease("w1", 60)
+    assert queue.lease("w2", 60) is None
+
+    clock.now += 61
+    fresh = queue.lease("w2", 60)
+    assert fresh.id == stale.id and fresh.attempts == 2
+
+    assert not queue.heartbeat(stale, 60)
+    assert not queue.complete(stale, ["Bread"], [("Baking", "Bread")])
+    assert queue.complete(fresh, ["Cakes"], [("Baking", "Cakes")])
+    assert queue.results("tier2") == [("Baking", "", ["Cakes"])]
+    assert queue.counts()["queued"] == 1
+
+
+def test_failed_jobs_are_retried_then_marked_failed(tmp_path):
+    queue = SqliteWorkQueue(tmp_path / "queue.db", "food", "youtube")
+    queue.enqueue("tier2", [("Baking", "")])
+
+    assert queue.fail(queue.lease("w1", 60), "boom", max_attempts=2) == QUEUED
+    assert queue.fail(queue.lease("w1", 60), "boom", max_attempts=2) == FAILED
+    assert queue.lease("w1", 60) is None
+
+    assert queue.requeue_failed() == 1
+    assert queue.lease("w1", 60).attempts == 1
+
+
+def test_workers_drain_queue_without_repeating_calls(isolated_config, tmp_path):
+    queue_path = tmp_path / "queue.db"
+    enqueue_backend = SyntheticBackend(tier1_items=2, tier2_items=3, tier3_items=4)
+    enqueuer = DataGenerator(BedrockClient(backend=enqueue_backend), "food", "youtube")
+    asyncio.run(enqueuer.enqueue_jobs(SqliteWorkQueue(queue_path, "food", "youtube")))
+
+    # One backend shared by both workers keeps synthetic seeds unique across them
+    backend = SyntheticBackend(tier1_items=2, tier2_items=3, tier3_items=4)
+
+    async def run_workers():
+        workers = [
+            DataGenerator(BedrockClient(backend=backend), "food", "youtube").run_worker(
+                SqliteWorkQueue(queue_path, "food", "youtube"), f"w{index}"
+            )
+            for index in range(2)
+        ]
+        return await asyncio.gather(*workers)
+
+    outcomes = asyncio.run(run_workers())
+
+    # 2 Tier 2 jobs + 6 Tier 3 jobs, each paid for exactly once
+    assert backend.calls == 8
+    assert sum(outcome.get("completed", 0) for outcome in outcomes) == 8
+
+    summary = enqueuer.collect_jobs(SqliteWorkQueue(queue_path, "food", "youtube"))
+    assert summary["jobs"]["done"] == 8
+    assert summary["tier2_count"] == 6
+    assert summary["seeds"] == 24
+    assert len(list(enqueuer.output_dir.glob("tier3_*.csv"))) == 6
+    assert enqueuer.manifest_file.exists()
+    assert len(list((enqueuer.output_dir / "workers").glob("run_report_*.json"))) == 2
+
+
+def test_job_is_abandoned_when_its_lease_is_lost(isolated_config, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "queue_visibility_timeout_s", 0.03)
+    queue = SqliteWorkQueue(tmp_path / "queue.db", "food", "youtube")
+    queue.enqueue("tier2", [("Baking", "")])
+    monkeypatch.setattr(queue, "heartbeat", lambda job, timeout: False)
+    generator = DataGenerator(BedrockClient(backend=SyntheticBackend(latency=0.5, tier2_items=3)), "food", "youtube")
+
+    outcome = asyncio.run(generator._run_job(queue, queue.lease("w1", 60)))
+
+    assert outcome == "lost"
+    assert queue.results("tier2") == []
+    assert queue.counts()["leased"] == 1
+
+
+def test_work_queue_requires_transaction():
+    class NoTransaction(WorkQueue):
+        pass
+
+    with pytest.raises(TypeError):
+        NoTransaction("food", "youtube")